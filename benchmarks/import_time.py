@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+"""Times importing linnapi in a new interpreter.
+
+Each case is run ``--repeat`` times, each time in a new Python process so
+nothing is already imported, and the fastest and median times are shown.
+
+The ``session + SKU check`` case imports what creating a
+``LinnworksAPISession`` and sending one ``SKUExists`` request load,
+without contacting the API.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --ref baseline-commit
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+SESSION_MODULES = (
+    'requests', 'linnapi.settings', 'linnapi.transport', 'linnapi.scheduler',
+    'linnapi.coalescer', 'linnapi.circuit_breaker')
+
+CASES = (
+    ('import linnapi', 'import linnapi'),
+    ('session', 'from linnapi import LinnworksAPISession'),
+    ('session + SKU check', (
+        'import importlib\n'
+        'from linnapi import LinnworksAPISession\n'
+        'for name in {!r}:\n'
+        '    try:\n'
+        '        importlib.import_module(name)\n'
+        '    except ImportError:\n'
+        '        pass\n'
+        'from linnapi.api_requests import SKUExists').format(
+            SESSION_MODULES)),
+)
+
+TIMER = (
+    'import time\n'
+    'started = time.perf_counter()\n'
+    'exec({!r})\n'
+    'print(time.perf_counter() - started)')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_import(statement, path):
+    """Return seconds taken by statement in a new interpreter in path."""
+    output = subprocess.check_output(
+        [sys.executable, '-c', TIMER.format(statement)], cwd=path)
+    return float(output)
+
+
+def export_ref(ref, directory):
+    """Write the linnapi package at git ref to directory."""
+    archive = os.path.join(directory, 'linnapi.tar')
+    subprocess.check_call(
+        ['git', 'archive', '-o', archive, ref, 'linnapi'], cwd=ROOT)
+    with tarfile.open(archive) as tar:
+        tar.extractall(directory)
+
+
+def run(path, repeat):
+    for name, statement in CASES:
+        times = [time_import(statement, path) for i in range(repeat)]
+        print('  {:<22} min {:7.1f} ms   median {:7.1f} ms'.format(
+            name, min(times) * 1000, statistics.median(times) * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--repeat', type=int, default=10, help='Runs of each case.')
+    parser.add_argument(
+        '--ref', help='Git ref to time as well, such as a baseline commit.')
+    args = parser.parse_args()
+    if args.ref is not None:
+        with tempfile.TemporaryDirectory() as directory:
+            export_ref(args.ref, directory)
+            print(args.ref)
+            run(directory, args.repeat)
+    print('working tree')
+    run(ROOT, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
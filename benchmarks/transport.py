@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+"""Compares bytes on the wire and wall time for HTTP transport settings.
+
+Requests like those sent when creating items are sent to a local stand-in
+for the API server from a pool of threads. Each transport is run in turn:
+
+    default -- One ``requests.Session`` shared by every thread, as the
+        session used before ``TransportProfile``.
+    profile -- ``TransportProfile`` with its default settings.
+    profile+gzip -- ``TransportProfile`` with ``compress_requests``.
+
+The server counts the bytes it reads and writes and the connections
+opened. It gzips responses when the client accepts gzip, as the API does.
+``--bandwidth`` makes the server wait as if every connection were limited
+to that many kilobytes per second, which roughly models a slow link. TLS
+is not used, so handshakes saved by reusing connections are not counted.
+
+Usage:
+    python benchmarks/transport.py
+    python benchmarks/transport.py --threads 16 --requests 800 --bandwidth 256
+"""
+
+import argparse
+import gzip
+import http.server
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests
+
+from linnapi.transport import TransportProfile
+
+
+class Counter:
+    """Bytes and connections counted by the server."""
+
+    def __init__(self, bandwidth=None):
+        self.bandwidth = bandwidth
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.received = 0
+            self.sent = 0
+            self.connections = 0
+
+    def add(self, name, size):
+        with self.lock:
+            setattr(self, name, getattr(self, name) + size)
+        if self.bandwidth:
+            time.sleep(size / (self.bandwidth * 1024))
+
+
+class CountingReader:
+
+    def __init__(self, stream, counter):
+        self.stream = stream
+        self.counter = counter
+
+    def read(self, size=-1):
+        data = self.stream.read(size)
+        self.counter.add('received', len(data))
+        return data
+
+    def readline(self, size=-1):
+        data = self.stream.readline(size)
+        self.counter.add('received', len(data))
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class CountingWriter:
+
+    def __init__(self, stream, counter):
+        self.stream = stream
+        self.counter = counter
+
+    def write(self, data):
+        self.counter.add('sent', len(data))
+        return self.stream.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class APIHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        counter = self.server.counter
+        counter.add('connections', 1)
+        self.rfile = CountingReader(self.rfile, counter)
+        self.wfile = CountingWriter(self.wfile, counter)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        content = self.server.response_body
+        headers = {'Content-Type': 'application/json'}
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            content = self.server.gzipped_response_body
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_item(number):
+    """Return ``dict`` of an inventory item as sent by AddInventoryItem."""
+    return {
+        'ItemNumber': 'SKU-{:06d}'.format(number),
+        'ItemTitle': 'Stainless steel widget, pack of {}'.format(number),
+        'BarcodeNumber': '50{:011d}'.format(number),
+        'PurchasePrice': '1.25', 'RetailPrice': '4.99', 'Quantity': '0',
+        'TaxRate': '20', 'StockItemId': str(uuid.uuid4()),
+        'VariationGroupName': '', 'MetaData': '',
+        'Weight': '120', 'Width': '10', 'Depth': '4', 'Height': '2'}
+
+
+def make_request_data(number):
+    """Return POST data for a batch of extended properties of an item."""
+    stock_id = str(uuid.uuid4())
+    properties = [
+        {'pkRowId': str(uuid.uuid4()), 'fkStockItemId': stock_id,
+         'ProperyName': 'Property {}'.format(i),
+         'PropertyValue': 'Value {} of item {}'.format(i, number),
+         'PropertyType': 'Attribute'}
+        for i in range(30)]
+    return {'inventoryItemExtendedProperties': json.dumps(properties)}
+
+
+def make_response_body():
+    """Return JSON body like a page of inventory items."""
+    return json.dumps([make_item(i) for i in range(50)]).encode()
+
+
+def default_client():
+    session = requests.Session()
+
+    def send(url, data):
+        return session.post(url, data=data, params={'token': 'token'})
+    return send
+
+
+def profile_client(profile):
+    local = threading.local()
+
+    def send(url, data):
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = profile.configure(requests.Session())
+            local.session = session
+        data, headers = profile.prepare_data(data)
+        return session.post(
+            url, data=data, params={'token': 'token'}, headers=headers,
+            timeout=profile.timeout)
+    return send
+
+
+def run(name, send, server, url, payloads, threads):
+    server.counter.reset()
+
+    def call(data):
+        response = send(url, data)
+        response.raise_for_status()
+        return len(response.content)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(call, payloads))
+    elapsed = time.perf_counter() - started
+    counter = server.counter
+    print('{:<14} {:>11} {:>14} {:>14} {:>14} {:>9.2f}'.format(
+        name, counter.connections, counter.received, counter.sent,
+        counter.received + counter.sent, elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--threads', type=int, default=16, help='Concurrent requests.')
+    parser.add_argument(
+        '--requests', type=int, default=400, help='Requests per transport.')
+    parser.add_argument(
+        '--bandwidth', type=float, default=None,
+        help='Kilobytes per second for each connection.')
+    args = parser.parse_args()
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), APIHandler)
+    server.daemon_threads = True
+    server.counter = Counter(args.bandwidth)
+    server.response_body = make_response_body()
+    server.gzipped_response_body = gzip.compress(server.response_body)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{}/api/Inventory/CreateInventoryItem' \
+        'ExtendedProperties'.format(server.server_port)
+    payloads = [make_request_data(i) for i in range(args.requests)]
+    profile = TransportProfile(pool_maxsize=args.threads)
+    gzip_profile = TransportProfile(
+        pool_maxsize=args.threads, compress_requests=True)
+    print('{} requests from {} threads'.format(args.requests, args.threads))
+    print('{:<14} {:>11} {:>14} {:>14} {:>14} {:>9}'.format(
+        'transport', 'connections', 'bytes up', 'bytes down',
+        'bytes total', 'seconds'))
+    run('default', default_client(), server, url, payloads, args.threads)
+    run('profile', profile_client(profile), server, url, payloads,
+        args.threads)
+    run('profile+gzip', profile_client(gzip_profile), server, url, payloads,
+        args.threads)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
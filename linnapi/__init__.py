@@ -2,9 +2,17 @@
 api.linnworks.net
 """
 
-from . import settings
-from . import orders
-from . import inventory
+from . lazy_import import lazy_import
 from . functions import *
-from . linnworks_api_session import LinnworksAPISession
 from . exceptions import *
+
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(),
+    {'LinnworksAPISession': 'linnworks_api_session',
+     'TransportProfile': 'transport',
+     'ResponseCache': 'response_cache',
+     'BatchLoader': 'batch_loader',
+     'RequestScheduler': 'scheduler',
+     'AdaptiveConcurrencyLimit': 'concurrency_limit',
+     'CircuitBreakers': 'circuit_breaker'},
+    submodules=('settings', 'orders', 'inventory', 'processed_orders'))
@@ -1,5 +1,82 @@
-from . inventory import *
-from . orders import *
-from . settings import *
-from . import_export import *
-from . processed_orders import *
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'UpdateInventoryItemField':
+        'inventory.update_inventory.update_inventory_item_field',
+    'UpdateInventoryItemStockField':
+        'inventory.update_inventory.update_inventory_item_stock_field',
+    'UpdateItemTitle': 'inventory.update_inventory.update_item_title',
+    'UpdateRetailPrice': 'inventory.update_inventory.update_retail_price',
+    'UpdatePurchasePrice': 'inventory.update_inventory.update_purchase_price',
+    'UpdateCategory': 'inventory.update_inventory.update_category',
+    'UpdateBarcode': 'inventory.update_inventory.update_barcode',
+    'UpdateAvailable': 'inventory.update_inventory.update_available',
+    'DeleteImageFromInventoryItem':
+        'inventory.images.delete_image_from_inventory_item',
+    'GetInventoryItemImages': 'inventory.images.get_inventory_item_images',
+    'UploadFile': 'inventory.images.upload_file',
+    'UploadImagesToInventoryItem':
+        'inventory.images.upload_images_to_inventory_item',
+    'AddInventoryItem': 'inventory.add_inventory_item',
+    'AddVariationItems': 'inventory.add_variation_items',
+    'CreateVariationGroup': 'inventory.create_variation_group',
+    'DeleteVariationItems': 'inventory.delete_variation_items',
+    'GetInventoryColumnTypes': 'inventory.get_inventory_column_types',
+    'GetInventoryItemByID': 'inventory.get_inventory_item_by_id',
+    'GetInventoryItemCount': 'inventory.get_inventory_item_count',
+    'GetInventoryItemDescriptions':
+        'inventory.get_inventory_item_descriptions',
+    'GetInventoryItemPrices': 'inventory.get_inventory_item_prices',
+    'GetInventoryItemTitles': 'inventory.get_inventory_item_titles',
+    'GetInventoryItems': 'inventory.get_inventory_items',
+    'GetInventoryViews': 'inventory.get_inventory_views',
+    'GetNewSKU': 'inventory.get_new_sku',
+    'GetStockLevel': 'inventory.get_stock_level',
+    'GetStockLevelBatch': 'inventory.get_stock_level_batch',
+    'GetVariationItems': 'inventory.get_variation_items',
+    'InventoryViewColumn': 'inventory.inventory_view_column',
+    'InventoryViewFilter': 'inventory.inventory_view_filter',
+    'InventoryView': 'inventory.inventory_view',
+    'FrozenInventoryView': 'inventory.frozen_inventory_view',
+    'SearchInventoryByTitle': 'inventory.search_inventory_by_title',
+    'SearchVariationGroups': 'inventory.search_variation_groups',
+    'SetStockLevel': 'inventory.set_stock_level',
+    'SKUExists': 'inventory.sku_exists',
+    'UpdateInventoryItem': 'inventory.update_inventory_item',
+    'CreatePDFFromJobForceTemplate':
+        'orders.create_PDF_from_job_force_template',
+    'GetAllOpenOrders': 'orders.get_all_open_orders',
+    'GetOpenOrderIDByOrderOrReferenceID':
+        'orders.get_open_order_id_by_order_or_reference_id',
+    'GetOpenOrder': 'orders.get_open_order',
+    'GetOpenOrders': 'orders.get_open_orders',
+    'GetOrders': 'orders.get_orders',
+    'GetPrintFile': 'orders.get_print_file',
+    'ProcessOrder': 'orders.process_order',
+    'GetCategories': 'settings.get_categories',
+    'GetChannels': 'settings.get_channels',
+    'GetLocations': 'settings.get_locations',
+    'GetPackageGroups': 'settings.get_package_groups',
+    'GetPostageServices': 'settings.get_postage_services',
+    'GetShippingMethods': 'settings.get_shipping_methods',
+    'ExecuteCustomScriptCSV': 'import_export.execute_custom_script_csv',
+    'GetOrderInfo': 'processed_orders.get_order_info',
+    'SearchProcessedOrdersPaged':
+        'processed_orders.search_processed_orders_paged',
+    'CreateInventoryItemExtendedProperties':
+        'inventory.extended_properties.'
+        'create_inventory_item_extended_properties',
+    'GetExtendedPropertyNames':
+        'inventory.extended_properties.get_extended_property_names',
+    'GetInventoryItemExtendedProperties':
+        'inventory.extended_properties.get_inventory_item_extended_properties',
+    'UpdateInventoryItemExtendedProperties':
+        'inventory.extended_properties.'
+        'update_inventory_item_extended_properties',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes, submodules=(
+        'inventory', 'orders', 'settings', 'import_export',
+        'processed_orders'))
@@ -0,0 +1,50 @@
+"""JSON decoders for API responses.
+
+Every response body is decoded once by ``decode``. The standard library
+``json`` module is always available; ``orjson`` is used by default when it
+is installed. Use ``set_decoder`` to choose a decoder by name or to supply
+any callable that takes the response body as ``bytes``.
+"""
+
+import json
+
+
+def decode_stdlib(content):
+    return json.loads(content)
+
+
+decoders = {'json': decode_stdlib}
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+else:
+    decoders['orjson'] = orjson.loads
+
+decoder = decoders['orjson' if orjson is not None else 'json']
+
+
+def set_decoder(new_decoder):
+    """Set the decoder used for all responses.
+
+    Arguments:
+        new_decoder -- Name of a decoder in ``decoders`` or a callable that
+            takes ``bytes`` and returns the decoded object.
+    """
+    global decoder
+    if not callable(new_decoder):
+        if new_decoder not in decoders:
+            raise ValueError(
+                'Unknown JSON decoder {!r}. Available decoders: {}'.format(
+                    new_decoder, ', '.join(decoders)))
+        new_decoder = decoders[new_decoder]
+    decoder = new_decoder
+
+
+def decode(content):
+    """Return decoded content or None if content is not valid JSON."""
+    try:
+        return decoder(content)
+    except ValueError:
+        return None
@@ -1 +1,9 @@
-from . execute_custom_script_csv import ExecuteCustomScriptCSV
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'ExecuteCustomScriptCSV': 'execute_custom_script_csv',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes)
@@ -6,9 +6,12 @@ from linnapi.api_requests.request import Request
 class ExecuteCustomScriptCSV(Request):
     url_extension = '/api/Dashboards/ExecuteCustomScriptCSV'
 
-    def __init__(self, api_session, script_id, parameters=[]):
+    def __init__(self, api_session, script_id, parameters=None):
         self.script_id = script_id
-        self.parameters = parameters
+        if parameters is not None:
+            self.parameters = parameters
+        else:
+            self.parameters = []
         super().__init__(api_session)
 
     def test_request(self):
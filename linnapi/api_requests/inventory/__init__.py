@@ -1,24 +1,57 @@
 """This module contains Request classes for inventory related requests """
 
-from . update_inventory import *
-from . images import *
-from . add_inventory_item import AddInventoryItem
-from . create_variation_group import CreateVariationGroup
-from . get_inventory_column_types import GetInventoryColumnTypes
-from . get_inventory_item_by_id import GetInventoryItemByID
-from . get_inventory_item_count import GetInventoryItemCount
-from . get_inventory_item_descriptions import GetInventoryItemDescriptions
-from . get_inventory_item_prices import GetInventoryItemPrices
-from . get_inventory_item_titles import GetInventoryItemTitles
-from . get_inventory_items import GetInventoryItems
-from . get_inventory_views import GetInventoryViews
-from . get_new_sku import GetNewSKU
-from . get_stock_level import GetStockLevel
-from . get_variation_items import GetVariationItems
-from . inventory_view_column import InventoryViewColumn
-from . inventory_view_filter import InventoryViewFilter
-from . inventory_view import InventoryView
-from . search_inventory_by_title import SearchInventoryByTitle
-from . search_variation_groups import SearchVariationGroups
-from . sku_exists import SKUExists
-from . update_inventory_item import UpdateInventoryItem
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'UpdateInventoryItemField': 'update_inventory.update_inventory_item_field',
+    'UpdateInventoryItemStockField':
+        'update_inventory.update_inventory_item_stock_field',
+    'UpdateItemTitle': 'update_inventory.update_item_title',
+    'UpdateRetailPrice': 'update_inventory.update_retail_price',
+    'UpdatePurchasePrice': 'update_inventory.update_purchase_price',
+    'UpdateCategory': 'update_inventory.update_category',
+    'UpdateBarcode': 'update_inventory.update_barcode',
+    'UpdateAvailable': 'update_inventory.update_available',
+    'DeleteImageFromInventoryItem': 'images.delete_image_from_inventory_item',
+    'GetInventoryItemImages': 'images.get_inventory_item_images',
+    'UploadFile': 'images.upload_file',
+    'UploadImagesToInventoryItem': 'images.upload_images_to_inventory_item',
+    'AddInventoryItem': 'add_inventory_item',
+    'AddVariationItems': 'add_variation_items',
+    'CreateVariationGroup': 'create_variation_group',
+    'DeleteVariationItems': 'delete_variation_items',
+    'GetInventoryColumnTypes': 'get_inventory_column_types',
+    'GetInventoryItemByID': 'get_inventory_item_by_id',
+    'GetInventoryItemCount': 'get_inventory_item_count',
+    'GetInventoryItemDescriptions': 'get_inventory_item_descriptions',
+    'GetInventoryItemPrices': 'get_inventory_item_prices',
+    'GetInventoryItemTitles': 'get_inventory_item_titles',
+    'GetInventoryItems': 'get_inventory_items',
+    'GetInventoryViews': 'get_inventory_views',
+    'GetNewSKU': 'get_new_sku',
+    'GetStockLevel': 'get_stock_level',
+    'GetStockLevelBatch': 'get_stock_level_batch',
+    'GetVariationItems': 'get_variation_items',
+    'InventoryViewColumn': 'inventory_view_column',
+    'InventoryViewFilter': 'inventory_view_filter',
+    'InventoryView': 'inventory_view',
+    'FrozenInventoryView': 'frozen_inventory_view',
+    'SearchInventoryByTitle': 'search_inventory_by_title',
+    'SearchVariationGroups': 'search_variation_groups',
+    'SetStockLevel': 'set_stock_level',
+    'SKUExists': 'sku_exists',
+    'UpdateInventoryItem': 'update_inventory_item',
+    'CreateInventoryItemExtendedProperties':
+        'extended_properties.create_inventory_item_extended_properties',
+    'GetExtendedPropertyNames':
+        'extended_properties.get_extended_property_names',
+    'GetInventoryItemExtendedProperties':
+        'extended_properties.get_inventory_item_extended_properties',
+    'UpdateInventoryItemExtendedProperties':
+        'extended_properties.update_inventory_item_extended_properties',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes,
+    submodules=('update_inventory', 'images', 'extended_properties'))
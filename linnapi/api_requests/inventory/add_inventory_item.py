@@ -8,6 +8,7 @@ from linnapi.functions import is_guid
 
 class AddInventoryItem(Request):
     url_extension = '/api/Inventory/AddInventoryItem'
+    invalidates_cache = True
 
     sku = ''
     stock_id = ''
@@ -34,31 +35,59 @@ class AddInventoryItem(Request):
                  category_id=None, package_group_id=None,
                  postage_service_id=None, weight=None, width=None, depth=None,
                  height=None, test=True):
+        if sku is None:
+            sku = self.get_new_sku(api_session)
         self.sku = str(sku)
         self.stock_id = str(stock_id)
         self.title = str(title)
-        self.barcode = str(barcode)
-        self.purchase_price = float(purchase_price)
-        self.retail_price = float(retail_price)
-        self.quantity = int(quantity)
-        self.tax_rate = float(tax_rate)
-        self.variation_group_name = str(variation_group_name)
-        self.meta_data = str(meta_data)
-        self.category_id = str(category_id)
-        self.package_group_id = str(package_group_id)
-        self.postage_service_id = str(postage_service_id)
-        self.weight = float(weight)
-        self.width = float(width)
-        self.depth = float(depth)
-        self.height = float(height)
+        if barcode is not None:
+            self.barcode = str(barcode)
+        if purchase_price is not None:
+            self.purchase_price = float(purchase_price)
+        if retail_price is not None:
+            self.retail_price = float(retail_price)
+        if quantity is not None:
+            self.quantity = int(quantity)
+        if tax_rate is not None:
+            self.tax_rate = float(tax_rate)
+        if variation_group_name is not None:
+            self.variation_group_name = str(variation_group_name)
+        if meta_data is not None:
+            self.meta_data = str(meta_data)
+        if category_id is not None:
+            self.category_id = str(category_id)
+        if package_group_id is not None:
+            self.package_group_id = str(package_group_id)
+        if postage_service_id is not None:
+            self.postage_service_id = str(postage_service_id)
+        if weight is not None:
+            self.weight = float(weight)
+        if width is not None:
+            self.width = float(width)
+        if depth is not None:
+            self.depth = float(depth)
+        if height is not None:
+            self.height = float(height)
         super().__init__(api_session, test)
 
+    def get_new_sku(self, api_session):
+        """Return a SKU for an item created without one."""
+        return api_session.sku_pool.get()
+
     def test_request(self):
         assert isinstance(self.sku, str), "SKU must be string."
         assert len(self.sku) > 0, "SKU must not be empty string."
         assert is_guid(self.stock_id), "Stock ID must be valid GUID"
         return super().test_request()
 
+    def execute(self):
+        super().execute()
+        if self.response.ok:
+            self.api_session.sku_lookup.add(self.sku, self.stock_id)
+
+    def get_stock_ids(self):
+        return (self.stock_id,)
+
     def get_data(self):
         inventory_item = {
             'ItemNumber': str(self.sku),
@@ -66,18 +95,22 @@ class AddInventoryItem(Request):
             'BarcodeNumber': str(self.barcode),
             'PurchasePrice': str(self.purchase_price),
             'RetailPrice': str(self.retail_price),
-            'Quantity': str(self.quantity),
             'TaxRate': str(self.tax_rate),
             'StockItemId': str(self.stock_id),
             'VariationGroupName': str(self.variation_group_name),
             'MetaData': str(self.meta_data),
-            'CategoryId': str(self.category_id),
-            'PackageGroupId': str(self.package_group_id),
-            'PostalServiceId': str(self.postage_service_id),
             'Weight': str(self.weight),
             'Width': str(self.width),
             'Depth': str(self.depth),
             'Height': str(self.height),
         }
+        if self.quantity is not None:
+            inventory_item['Quantity'] = str(self.quantity)
+        if self.category_id is not None:
+            inventory_item['CategoryId'] = str(self.category_id)
+        if self.package_group_id is not None:
+            inventory_item['PackageGroupId'] = str(self.package_group_id)
+        if self.postage_service_id is not None:
+            inventory_item['PostalServiceId'] = str(self.postage_service_id)
         data = {'inventoryItem': json.dumps(inventory_item)}
         return data
@@ -0,0 +1,34 @@
+"""Adds inventory items to an existing variation group """
+
+import json
+
+from linnapi.api_requests.request import Request
+from linnapi.functions import is_guid
+
+
+class AddVariationItems(Request):
+    url_extension = '/api/Stock/AddVariationItems'
+    invalidates_cache = True
+
+    def __init__(self, api_session, parent_stock_id, children_ids):
+        self.parent_stock_id = parent_stock_id
+        self.children_ids = children_ids
+        super().__init__(api_session)
+
+    def test_request(self):
+        assert is_guid(self.parent_stock_id), \
+            "Parent Stock ID must be valid GUID."
+        assert isinstance(self.children_ids, (list, set, tuple)), \
+            "Children IDs must be in list or set."
+        for child in self.children_ids:
+            assert is_guid(child), "Children IDs must be valid GUID."
+        return super().test_request()
+
+    def get_stock_ids(self):
+        return [self.parent_stock_id] + list(self.children_ids)
+
+    def get_data(self):
+        data = {
+            'pkVariationItemId': self.parent_stock_id,
+            'pkStockItemIds': json.dumps(list(self.children_ids))}
+        return data
@@ -1,30 +1,34 @@
 """Creates new variation group """
 
+import json
 import uuid
 
 from linnapi.api_requests.request import Request
-from linnapi.functions import get_new_SKU
 from linnapi.functions import is_guid
 
 
 class CreateVariationGroup(Request):
     url_extension = '/api/Stock/CreateVariationGroup'
-    children_ids = []
+    invalidates_cache = True
+    title = None
+    children_ids = None
 
     def __init__(self, api_session, sku=None, title=None, stock_id=None,
                  children_ids=None):
         if sku is not None:
             self.sku = sku
         else:
-            self.sku = get_new_SKU()
+            self.sku = api_session.sku_pool.get()
         if title is not None:
             self.title = title
         if stock_id is not None:
             self.stock_id = stock_id
         else:
-            self.stock_id = str(uuid.uuid4)
+            self.stock_id = str(uuid.uuid4())
         if children_ids is not None:
             self.children_ids = children_ids
+        else:
+            self.children_ids = []
         super().__init__(api_session)
 
     def test_request(self):
@@ -38,14 +42,17 @@ class CreateVariationGroup(Request):
             "Children IDs must be in list or set."
         for child in self.children_ids:
             assert is_guid(child), "Children IDs must be valid GUID."
-        return super().test_request
+        return super().test_request()
+
+    def get_stock_ids(self):
+        return [self.stock_id] + list(self.children_ids)
 
     def get_data(self):
         template = {}
         template['ParentSKU'] = self.sku
         template['VariationGroupName'] = self.title
         template['ParentStockItemId'] = self.stock_id
-        template['VariationItemIds'] = self.children_ids
+        template['VariationItemIds'] = list(self.children_ids)
         data = {'template': json.dumps(template)}
         return data
 
@@ -0,0 +1,7 @@
+"""Removes inventory items from a variation group """
+
+from . add_variation_items import AddVariationItems
+
+
+class DeleteVariationItems(AddVariationItems):
+    url_extension = '/api/Stock/DeleteVariationItems'
@@ -1,7 +1,15 @@
-from . create_inventory_item_extended_properties \
-    import CreateInventoryItemExtendedProperties
-from . get_extended_property_names import GetExtendedPropertyNames
-from . get_inventory_item_extended_properties \
-    import GetInventoryItemExtendedProperties
-from . update_inventory_item_extended_properties \
-    import UpdateInventoryItemExtendedProperties
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'CreateInventoryItemExtendedProperties':
+        'create_inventory_item_extended_properties',
+    'GetExtendedPropertyNames': 'get_extended_property_names',
+    'GetInventoryItemExtendedProperties':
+        'get_inventory_item_extended_properties',
+    'UpdateInventoryItemExtendedProperties':
+        'update_inventory_item_extended_properties',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes)
@@ -5,3 +5,4 @@ from . update_inventory_item_extended_properties \
 class CreateInventoryItemExtendedProperties(
         UpdateInventoryItemExtendedProperties):
     url_extension = '/api/Inventory/CreateInventoryItemExtendedProperties'
+    invalidated_endpoints = ('/api/Inventory/GetExtendedPropertyNames',)
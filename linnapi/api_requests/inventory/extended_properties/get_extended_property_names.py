@@ -5,8 +5,9 @@ from linnapi.api_requests.request import Request
 
 class GetExtendedPropertyNames(Request):
     url_extension = '/api/Inventory/GetExtendedPropertyNames'
+    cacheable = True
 
     def test_response(self, response):
-        assert isinstance(response.json(), list), \
+        assert isinstance(self.response_dict, list), \
             "Error message recieved: " + response.text
         return super().test_response(response)
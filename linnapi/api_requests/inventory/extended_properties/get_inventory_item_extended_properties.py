@@ -6,6 +6,8 @@ from linnapi.functions import is_guid
 
 class GetInventoryItemExtendedProperties(Request):
     url_extension = '/api/Inventory/GetInventoryItemExtendedProperties'
+    cacheable = True
+    coalesce = True
 
     def __init__(self, api_session, stock_id):
         self.stock_id = stock_id
@@ -15,6 +17,9 @@ class GetInventoryItemExtendedProperties(Request):
         assert is_guid(self.stock_id), "Stock ID must be valid GUID."
         return super().test_request()
 
+    def get_stock_ids(self):
+        return (self.stock_id,)
+
     def get_data(self):
         data = {
             'inventoryItemId': self.stock_id
@@ -22,6 +27,6 @@ class GetInventoryItemExtendedProperties(Request):
         return data
 
     def test_response(self, response):
-        assert isinstance(response.json(), list), \
+        assert isinstance(self.response_dict, list), \
             "Error message recieved: " + response.text
         return super().test_response(response)
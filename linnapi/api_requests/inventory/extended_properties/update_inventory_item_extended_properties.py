@@ -1,8 +1,12 @@
+import json
+
 from linnapi.api_requests.request import Request
+from linnapi.functions import is_guid
 
 
 class UpdateInventoryItemExtendedProperties(Request):
     url_extension = '/api/Inventory/UpdateInventoryItemExtendedProperties'
+    invalidates_cache = True
 
     def __init__(self, api_session, extended_properties):
         self.extended_properties = extended_properties
@@ -19,12 +23,23 @@ class UpdateInventoryItemExtendedProperties(Request):
                 'Extended Property must contain PropertyValue'
             assert 'PropertyType' in ex_prop, \
                 'Extended Property must contain PropertyType'
+        return super().test_request()
+
+    def get_stock_ids(self):
+        stock_ids = []
+        for ex_prop in self.extended_properties:
+            if 'fkStockItemId' not in ex_prop:
+                return None
+            stock_ids.append(ex_prop['fkStockItemId'])
+        return stock_ids
 
     def get_data(self):
-        data = {self.extended_properties}
+        data = {
+            'inventoryItemExtendedProperties': json.dumps(
+                self.extended_properties)}
         return data
 
     def test_response(self, response):
-        assert isinstance(response.json(), list), \
+        assert isinstance(self.response_dict, list), \
             "Error message recieved: " + response.text
         return super().test_response(response)
@@ -0,0 +1,52 @@
+"""Immutable inventory view with cached JSON """
+
+import json
+
+
+class FrozenInventoryView():
+    """Immutable, hashable copy of an ``InventoryView``.
+
+    The view is serialised once when it is created and ``to_json`` returns
+    the same string every time, so a view used for many requests is not
+    serialised again. Frozen views with the same ``JSON`` are equal.
+    Use ``InventoryView.freeze`` to create one and ``thaw`` to get an
+    editable ``InventoryView`` back.
+    """
+
+    __slots__ = ('_json', '_id', 'name')
+
+    def __init__(self, view):
+        view_json = view.to_json()
+        object.__setattr__(self, '_json', view_json)
+        object.__setattr__(self, '_id', view._id)
+        object.__setattr__(self, 'name', view.name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenInventoryView can not be changed.')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenInventoryView can not be changed.')
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenInventoryView):
+            return NotImplemented
+        return self._json == other._json
+
+    def __hash__(self):
+        return hash(self._json)
+
+    def __repr__(self):
+        return 'FrozenInventoryView({!r})'.format(self.name)
+
+    def to_json(self):
+        return self._json
+
+    def to_dict(self):
+        return json.loads(self._json)
+
+    def thaw(self):
+        """Return an editable ``InventoryView`` copy of the view."""
+        from . inventory_view import InventoryView
+        view = InventoryView()
+        view.load_from_json(self._json)
+        return view
@@ -6,6 +6,7 @@ from . inventory_view_column import InventoryViewColumn
 
 class GetInventoryColumnTypes(Request):
     url_extension = '/api/Inventory/GetInventoryColumnTypes'
+    cacheable = True
 
     def process_response(self, response):
         self.column_dicts = []
@@ -17,6 +18,6 @@ class GetInventoryColumnTypes(Request):
             self.columns.append(new_column)
 
     def test_response(self, response):
-        assert isinstance(response.json(), list), \
+        assert isinstance(self.response_dict, list), \
             "Error message recieved: " + response.text
         return super().test_response(response)
@@ -2,6 +2,10 @@
 
 Arguments:
     stock_id -- GUID of inventory item.
+
+Keyword arguments:
+    cacheable -- If False the item is always requested, even if the session
+        has a response cache. (Default None)
 """
 
 from linnapi.api_requests.request import Request
@@ -10,20 +14,27 @@ from linnapi.functions import is_guid
 
 class GetInventoryItemByID(Request):
     url_extension = '/api/Inventory/GetInventoryItemById'
+    cacheable = True
+    coalesce = True
 
-    def __init__(self, api_session, stock_id, test=True):
+    def __init__(self, api_session, stock_id, test=True, cacheable=None):
         self.stock_id = stock_id
+        if cacheable is not None:
+            self.cacheable = cacheable
         super().__init__(api_session, test=test)
 
     def test_request(self):
         assert is_guid(self.stock_id), "Stock ID must be vaild GUID."
         return super().test_request()
 
+    def get_stock_ids(self):
+        return (self.stock_id,)
+
     def get_data(self):
         data = {'id': self.stock_id}
         return data
 
     def test_response(self, response):
-        assert isinstance(response.json(), dict), \
+        assert isinstance(self.response_dict, dict), \
             "Error message recieved: " + response.text
         return super().test_response(response)
@@ -9,13 +9,13 @@ from . inventory_view import InventoryView
 
 class GetInventoryItemCount(Request):
     url_extension = '/api/Inventory/GetInventoryItems'
-    view = InventoryView()
+    view = InventoryView().freeze()
     start = 0
     count = 1
-    locations = []
+    locations = None
 
     def __init__(self, api_session):
-        self.locations = api_session.locations.ids
+        self.locations = list(api_session.locations.ids)
         super().__init__(api_session)
 
     def process_response(self, response):
@@ -31,6 +31,6 @@ class GetInventoryItemCount(Request):
         return data
 
     def test_response(self, response):
-        assert isinstance(response.json(), dict), \
+        assert isinstance(self.response_dict, dict), \
             "Error message recieved: " + response.text
         return super().test_response(response)
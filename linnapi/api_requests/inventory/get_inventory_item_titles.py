@@ -22,6 +22,6 @@ class GetInventoryItemTitles(Request):
         return data
 
     def test_response(self, response):
-        assert isinstance(response.json(), list), \
+        assert isinstance(self.response_dict, list), \
             "Error message recieved: " + response.text
         return super().test_response(response)
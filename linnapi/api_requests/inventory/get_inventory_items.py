@@ -4,9 +4,14 @@ Keyword arguments:
     start -- Index of first item to be returned. Default 0.
     count -- Number of items to be returned. Default 1.
     view: InventoryView ``JSON`` object to filter results. Default will
-        return any item.
+        return any item with the standard columns.
+    view_json: ``JSON`` string of view, used in place of view so a view
+        that has already been serialised is not serialised again.
+    stream: If True items are read one at a time with ``iter_response``
+        instead of being decoded at once. Default False.
 """
 
+import functools
 import json
 
 from linnapi.api_requests.request import Request
@@ -14,25 +19,36 @@ from linnapi.functions import is_guid
 from . get_inventory_views import GetInventoryViews
 from . get_inventory_item_count import GetInventoryItemCount
 from . inventory_view import InventoryView
+from . frozen_inventory_view import FrozenInventoryView
+
+
+def get_standard_view():
+    view = InventoryView(name='Standard Columns')
+    view.columns = GetInventoryViews.standard_columns
+    return view.freeze()
 
 
 class GetInventoryItems(Request):
     url_extension = '/api/Inventory/GetInventoryItems'
+    default_view = get_standard_view()
+    stream_key = 'Items'
 
     def __init__(self, api_session, start=0, count=0, view=None,
-                 locations=None):
+                 locations=None, view_json=None, stream=False):
+        self.stream = stream
         self.count = 0
         self.view = None
+        self.view_json = view_json
         self.locations = []
-        self.start = 0
+        self.start = start
         if count == 0:
             self.count = GetInventoryItemCount(api_session).item_count
         else:
             self.count = count
-        if view is None:
-            self.view = GetInventoryViews(api_session)[0]
-        else:
+        if view is not None:
             self.view = view
+        elif view_json is None:
+            self.view = self.default_view
         if locations is None:
             self.locations = api_session.locations.ids
         else:
@@ -40,8 +56,13 @@ class GetInventoryItems(Request):
         super().__init__(api_session)
 
     def test_request(self):
-        assert isinstance(self.view, InventoryView), \
-            "View must be InventoryView."
+        if self.view_json is None:
+            assert isinstance(
+                self.view, (InventoryView, FrozenInventoryView)), \
+                "View must be InventoryView."
+        else:
+            assert isinstance(self.view_json, str), \
+                "View JSON must be str."
         assert isinstance(self.start, int), \
             "Start must be of type int."
         assert isinstance(self.count, int), \
@@ -50,9 +71,14 @@ class GetInventoryItems(Request):
             "Locations must be dict or set."
         return super().test_request()
 
+    def get_view_json(self):
+        if self.view_json is not None:
+            return self.view_json
+        return self.view.to_json()
+
     def get_data(self):
         data = {
-            'view': self.view.to_json(),
+            'view': self.get_view_json(),
             'startIndex': self.start,
             'itemsCount': self.count,
             'stockLocationIds': json.dumps(self.locations)
@@ -60,18 +86,26 @@ class GetInventoryItems(Request):
         return data
 
     def test_response(self, response):
-        assert isinstance(response.json(), dict), \
+        assert isinstance(self.response_dict, dict), \
             "Error message recieved: " + response.text
         return super().test_response(response)
 
-    def process_response(self, response):
-        self.result_count = len(self.response_dict['Items'])
-        self.items_json = []
-        self.item_titles = []
-        self.skus = []
-        self.guids = []
-        for item in self.response_dict['Items']:
-            self.items_json.append(item)
-            self.item_titles.append(item['Title'])
-            self.skus.append(item['SKU'])
-            self.guids.append(item['Id'])
+    @functools.cached_property
+    def result_count(self):
+        return len(self.response_dict['Items'])
+
+    @functools.cached_property
+    def items_json(self):
+        return list(self.response_dict['Items'])
+
+    @functools.cached_property
+    def item_titles(self):
+        return [item['Title'] for item in self.response_dict['Items']]
+
+    @functools.cached_property
+    def skus(self):
+        return [item['SKU'] for item in self.response_dict['Items']]
+
+    @functools.cached_property
+    def guids(self):
+        return [item['Id'] for item in self.response_dict['Items']]
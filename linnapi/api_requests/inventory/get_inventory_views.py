@@ -7,8 +7,6 @@ from . inventory_view_column import InventoryViewColumn
 
 class GetInventoryViews(Request):
     url_extension = '/api/Inventory/GetInventoryViews'
-    view_dicts = []
-    views = []
     standard_columns = [
         InventoryViewColumn(
             column_name='SKU', display_name='SKU'
@@ -32,6 +30,8 @@ class GetInventoryViews(Request):
     ]
 
     def process_response(self, response):
+        self.view_dicts = []
+        self.views = []
         for view in self.response_dict:
             self.view_dicts.append(view)
             new_view = InventoryView()
@@ -46,6 +46,6 @@ class GetInventoryViews(Request):
         return self.views[index]
 
     def test_response(self, response):
-        assert isinstance(response.json(), list), \
+        assert isinstance(self.response_dict, list), \
             "Error message recieved: " + response.text
         return super().test_response(response)
@@ -6,6 +6,7 @@ from linnapi.functions import is_guid
 
 class GetStockLevel(Request):
     url_extension = '/api/Stock/GetStockLevel'
+    coalesce = True
 
     def __init__(self, api_session, stock_id):
         self.stock_id = stock_id
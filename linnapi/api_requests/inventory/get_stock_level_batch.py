@@ -0,0 +1,34 @@
+"""Request stock levels for many inventory items """
+
+import json
+
+from linnapi.api_requests.request import Request
+from linnapi.functions import is_guid
+
+
+class GetStockLevelBatch(Request):
+    url_extension = '/api/Stock/GetStockLevel_Batch'
+
+    def __init__(self, api_session, stock_ids):
+        self.stock_ids = list(stock_ids)
+        super().__init__(api_session)
+
+    def test_request(self):
+        assert len(self.stock_ids) > 0, "Stock IDs must be supplied."
+        for stock_id in self.stock_ids:
+            assert is_guid(stock_id), "Stock ID must be valid GUID."
+        return super().test_request()
+
+    def get_data(self):
+        data = {'request': json.dumps({'StockItemIds': self.stock_ids})}
+        return data
+
+    def test_response(self, response):
+        assert isinstance(self.response_dict, list), \
+            "Error message recieved: " + response.text
+        return super().test_response(response)
+
+    def process_response(self, response):
+        self.stock_levels = {}
+        for item in self.response_dict:
+            self.stock_levels[item['pkStockItemId']] = item['StockItemLevels']
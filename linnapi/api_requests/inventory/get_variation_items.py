@@ -6,6 +6,8 @@ from linnapi.functions import is_guid
 
 class GetVariationItems(Request):
     url_extension = '/api/Stock/GetVariationItems'
+    cacheable = True
+    coalesce = True
 
     def __init__(self, api_session, parent_stock_id):
         self.parent_stock_id = parent_stock_id
@@ -16,12 +18,15 @@ class GetVariationItems(Request):
             "Parent Stock ID must be valid GUID."
         return super().test_request()
 
+    def get_stock_ids(self):
+        return (self.parent_stock_id,)
+
     def get_data(self):
         data = {'pkVariationItemId': self.parent_stock_id}
         return data
 
     def test_response(self, response):
-        assert isinstance(response.json(), list), \
+        assert isinstance(self.response_dict, list), \
             "Error message recieved: " + response.text
         return super().test_response(response)
 
@@ -1,4 +1,12 @@
-from . delete_image_from_inventory_item import DeleteImageFromInventoryItem
-from . get_inventory_item_images import GetInventoryItemImages
-from . upload_file import UploadFile
-from . upload_images_to_inventory_item import UploadImagesToInventoryItem
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'DeleteImageFromInventoryItem': 'delete_image_from_inventory_item',
+    'GetInventoryItemImages': 'get_inventory_item_images',
+    'UploadFile': 'upload_file',
+    'UploadImagesToInventoryItem': 'upload_images_to_inventory_item',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes)
@@ -3,6 +3,7 @@ from linnapi.api_requests.request import Request
 
 class DeleteImageFromInventoryItem(Request):
     url_extension = '/api/Inventory/DeleteImagesFromInventoryItem'
+    invalidates_cache = True
 
     def __init__(self, api_session, image_url, stock_id):
         self.image_url = image_url
@@ -12,6 +13,9 @@ class DeleteImageFromInventoryItem(Request):
     def test_request(self):
         return super().test_request()
 
+    def get_stock_ids(self):
+        return (self.stock_id,)
+
     def get_data(self):
         data = {'imageURL': self.image_url, 'inventoryItemId': self.stock_id}
         return data
@@ -6,11 +6,16 @@ from linnapi.functions import is_guid
 
 class GetInventoryItemImages(Request):
     url_extension = '/api/Inventory/GetInventoryItemImages'
+    cacheable = True
+    coalesce = True
 
     def __init__(self, api_session, stock_id):
         self.stock_id = stock_id
         super().__init__(api_session)
 
+    def get_stock_ids(self):
+        return (self.stock_id,)
+
     def get_data(self):
         data = {'inventoryItemId': self.stock_id}
         return data
@@ -31,6 +36,6 @@ class GetInventoryItemImages(Request):
                 self.images.append(image_url)
 
     def test_response(self, response):
-        assert isinstance(response.json(), list), \
+        assert isinstance(self.response_dict, list), \
             "Error message recieved: " + response.text
         return super().test_response(response)
@@ -5,6 +5,7 @@ from linnapi.api_requests.request import Request
 
 class UploadImagesToInventoryItem(Request):
     url_extension = '/api/Inventory/UploadImagesToInventoryItem'
+    invalidates_cache = True
 
     def __init__(self, api_session, stock_id, image_ids):
         self.stock_id = stock_id
@@ -16,6 +17,9 @@ class UploadImagesToInventoryItem(Request):
         assert(len(self.image_ids) > 0)
         return super().test_request()
 
+    def get_stock_ids(self):
+        return (self.stock_id,)
+
     def get_data(self):
         data = {
             'inventoryItemId': self.stock_id,
@@ -3,6 +3,7 @@ import uuid
 
 from . inventory_view_column import InventoryViewColumn
 from . inventory_view_filter import InventoryViewFilter
+from . frozen_inventory_view import FrozenInventoryView
 
 
 class InventoryView():
@@ -20,6 +21,8 @@ class InventoryView():
         self.show_only_changed = False
         self.source = None
         self.sub_source = None
+        if name is not None:
+            self.name = name
         if _id is None:
             self._id = str(uuid.uuid4())
         else:
@@ -80,3 +83,7 @@ class InventoryView():
 
     def load_from_json(self, view_json):
         return self.load_from_dict(json.loads(view_json))
+
+    def freeze(self):
+        """Return ``FrozenInventoryView`` of the view as it is now."""
+        return FrozenInventoryView(self)
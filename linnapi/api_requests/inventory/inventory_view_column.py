@@ -13,13 +13,12 @@ class InventoryViewColumn():
     def __init__(
             self, column_name=None, display_name=None, field=None, group=None,
             is_editable=None, sort_direction=None, width=None):
-        self.column_name = column_name
         if column_name is not None:
             self.column_name = column_name
         if display_name is not None:
             self.display_name = display_name
         else:
-            display_name = self.column_name
+            self.display_name = self.column_name
         if field is not None:
             self.field = field
         if group is not None:
@@ -29,7 +28,7 @@ class InventoryViewColumn():
         if sort_direction is not None:
             self.sort_direction = sort_direction
         if width is not None:
-            self.width = None
+            self.width = width
 
     def load_from_dict(self, column_dict):
         self.column_name = column_dict['ColumnName']
@@ -4,12 +4,13 @@ import json
 class InventoryViewFilter():
 
     def __init__(self, field=None, value=None, condition=None,
-                 filter_name=None, filter_name_exact=None):
+                 filter_name=None, filter_name_exact=None, filter_type=None):
         self.field = ''
         self.value = ''
         self.filter_name = ''
         self.filter_name_exact = ''
         self.condition = ''
+        self.filter_type = None
         if field is not None:
             self.field = field
         if value is not None:
@@ -22,6 +23,8 @@ class InventoryViewFilter():
             self.filter_name = self.field
         if filter_name_exact is not None:
             self.filter_name_exact = filter_name_exact
+        if filter_type is not None:
+            self.filter_type = filter_type
 
     def to_dict(self):
         filter_dict = {}
@@ -30,6 +33,8 @@ class InventoryViewFilter():
         filter_dict['FilterName'] = self.filter_name
         filter_dict['FilterNameExact'] = self.filter_name_exact
         filter_dict['Condition'] = self.condition
+        if self.filter_type is not None:
+            filter_dict['Type'] = self.filter_type
         return filter_dict
 
     def load_from_dict(self, filter_dict):
@@ -38,6 +43,7 @@ class InventoryViewFilter():
         self.filter_name = filter_dict['FilterName']
         self.filter_name_exact = filter_dict['FilterNameExact']
         self.condition = filter_dict['Condition']
+        self.filter_type = filter_dict.get('Type')
 
     def to_json(self):
         return json.dumps(self.to_dict())
@@ -1,3 +1,5 @@
+import functools
+
 from . get_inventory_items import GetInventoryItems
 from . get_inventory_item_count import GetInventoryItemCount
 from . inventory_view import InventoryView
@@ -5,6 +7,23 @@ from . get_inventory_views import GetInventoryViews
 from . inventory_view_filter import InventoryViewFilter
 
 
+def get_title_search_view(search_string, columns=None):
+    view = InventoryView()
+    if columns is None:
+        view.columns = GetInventoryViews.standard_columns
+    else:
+        view.columns = columns
+    view.filters = [InventoryViewFilter(
+        field='Title', value=search_string, condition='contains'
+    )]
+    return view.freeze()
+
+
+@functools.lru_cache(maxsize=256)
+def get_cached_title_search_view(search_string):
+    return get_title_search_view(search_string)
+
+
 class SearchInventoryByTitle(GetInventoryItems):
 
     def __init__(self, api_session, search_string, count=None, columns=None,
@@ -13,17 +32,13 @@ class SearchInventoryByTitle(GetInventoryItems):
             self.count = GetInventoryItemCount(api_session).item_count
         else:
             self.count = count
-        self.view = InventoryView()
         if columns is None:
-            self.view.columns = GetInventoryViews.standard_columns
+            self.view = get_cached_title_search_view(search_string)
         else:
-            self.columns = columns
-        self.view.filters = [InventoryViewFilter(
-            field='Title', value=search_string, condition='contains'
-        )]
+            self.view = get_title_search_view(search_string, columns)
         self.start = 0
         if locations is None:
-            self.locations = [self.api_session.locations['Default'].guid]
+            self.locations = [api_session.locations['Default'].guid]
         else:
             self.locations = locations
         super().__init__(api_session, start=0, count=self.count, view=self.view,
@@ -41,6 +41,6 @@ class SearchVariationGroups(Request):
             self.variation_groups.append(new_group)
 
     def test_response(self, response):
-        assert isinstance(response.json(), dict), \
+        assert isinstance(self.response_dict, dict), \
             "Error message recieved: " + response.text
         return super().test_response(response)
@@ -0,0 +1,55 @@
+"""Sets stock levels for many inventory items and locations """
+
+import json
+
+from linnapi.api_requests.request import Request
+from linnapi.functions import is_guid
+
+
+class SetStockLevel(Request):
+    """Set stock levels.
+
+    Arguments:
+        stock_levels -- List of (SKU, location ID, level) tuples.
+
+    Keyword arguments:
+        change_source -- Description of the change recorded in the stock
+            item history. (Default None)
+    """
+
+    url_extension = '/api/Stock/SetStockLevel'
+    invalidates_cache = True
+    change_source = None
+
+    def __init__(self, api_session, stock_levels, change_source=None):
+        self.stock_levels = list(stock_levels)
+        if change_source is not None:
+            self.change_source = change_source
+        super().__init__(api_session)
+
+    def test_request(self):
+        assert len(self.stock_levels) > 0, "Stock levels must be supplied."
+        for sku, location_id, level in self.stock_levels:
+            assert isinstance(sku, str) and sku != '', \
+                "SKU must be supplied."
+            assert is_guid(location_id), "Location ID must be valid GUID."
+            assert isinstance(level, int), "Level must be of type int."
+        return super().test_request()
+
+    def get_stock_ids(self):
+        return None
+
+    def get_data(self):
+        stock_levels = []
+        for sku, location_id, level in self.stock_levels:
+            stock_levels.append({
+                'SKU': sku, 'LocationId': location_id, 'Level': level})
+        data = {'stockLevels': json.dumps(stock_levels)}
+        if self.change_source is not None:
+            data['changeSource'] = self.change_source
+        return data
+
+    def test_response(self, response):
+        assert isinstance(self.response_dict, list), \
+            "Error message recieved: " + response.text
+        return super().test_response(response)
@@ -1,8 +1,16 @@
-from . update_inventory_item_field import UpdateInventoryItemField
-from . update_inventory_item_stock_field import UpdateInventoryItemStockField
-from . update_item_title import UpdateItemTitle
-from . update_retail_price import UpdateRetailPrice
-from . update_purchase_price import UpdatePurchasePrice
-from . update_category import UpdateCategory
-from . update_barcode import UpdateBarcode
-from . update_available import UpdateAvailable
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'UpdateInventoryItemField': 'update_inventory_item_field',
+    'UpdateInventoryItemStockField': 'update_inventory_item_stock_field',
+    'UpdateItemTitle': 'update_item_title',
+    'UpdateRetailPrice': 'update_retail_price',
+    'UpdatePurchasePrice': 'update_purchase_price',
+    'UpdateCategory': 'update_category',
+    'UpdateBarcode': 'update_barcode',
+    'UpdateAvailable': 'update_available',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes)
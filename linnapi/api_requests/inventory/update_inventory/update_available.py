@@ -2,7 +2,7 @@ from . update_inventory_item_stock_field import UpdateInventoryItemStockField
 
 
 class UpdateAvailable(UpdateInventoryItemStockField):
-    field_name = 'Barcode'
+    field_name = 'Available'
 
     def __init__(self, api_session, value=None, stock_id=None,
                  location_id=None):
@@ -16,4 +16,4 @@ class UpdateAvailable(UpdateInventoryItemStockField):
 
     def test_request(self):
         assert isinstance(self.value, int), "Value must be of type int"
-        return super().test_request(self)
+        return super().test_request()
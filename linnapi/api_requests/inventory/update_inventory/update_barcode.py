@@ -13,4 +13,4 @@ class UpdateBarcode(UpdateInventoryItemField):
 
     def test_request(self):
         assert isinstance(self.value, str), "Value must be of type str"
-        return super().test_request(self)
+        return super().test_request()
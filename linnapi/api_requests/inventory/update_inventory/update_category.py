@@ -1,3 +1,4 @@
+from linnapi.functions import is_guid
 from . update_inventory_item_field import UpdateInventoryItemField
 
 
@@ -13,4 +14,4 @@ class UpdateCategory(UpdateInventoryItemField):
 
     def test_request(self):
         assert is_guid(self.value), "Value must be valid GUID."
-        return super().test_request(self)
+        return super().test_request()
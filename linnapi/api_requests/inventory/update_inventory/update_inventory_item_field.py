@@ -6,9 +6,10 @@ from linnapi.functions import is_guid
 
 class UpdateInventoryItemField(Request):
     url_extension = '/api/Inventory/UpdateInventoryItemField'
+    invalidates_cache = True
     field_name = ''
-    field_value = ''
-    inventory_item_id = ''
+    value = None
+    stock_id = ''
 
     def __init__(self, api_session, field_name=None, value=None,
                  stock_id=None):
@@ -21,9 +22,17 @@ class UpdateInventoryItemField(Request):
         super().__init__(api_session)
 
     def test_response(self, response):
-        assert reponse.text == '', "Error message recieved: " + response.text
+        assert response.text == '', "Error message recieved: " + response.text
         return super().test_response(response)
 
+    def execute(self):
+        super().execute()
+        if self.response.ok and self.field_name == 'SKU':
+            self.api_session.sku_lookup.add(str(self.value), self.stock_id)
+
+    def get_stock_ids(self):
+        return (self.stock_id,)
+
     def get_data(self):
         data = {
             'fieldName': self.field_name,
@@ -35,7 +44,7 @@ class UpdateInventoryItemField(Request):
     def test_request(self):
         assert self.field_name is not None and len(self.field_name) > 0, \
             "Field name must be supplied."
-        assert self.value is not None and value != '', \
+        assert self.value is not None and self.value != '', \
             "Value must be supplied."
         assert is_guid(self.stock_id), "Stock ID must be a valid GUID."
-        return super().test_request(request)
+        return super().test_request()
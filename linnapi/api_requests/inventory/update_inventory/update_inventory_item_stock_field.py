@@ -1,15 +1,16 @@
 """Updates stock fields for inventory items """
 
 from linnapi.api_requests.request import Request
-from linnapi.api_requests.settings.get_locations import GetLocations
+from linnapi.functions import is_guid
 
 
 class UpdateInventoryItemStockField(Request):
     url_extension = '/api/Inventory/UpdateInventoryItemField'
+    invalidates_cache = True
     field_name = ''
-    field_value = ''
-    inventory_item_id = ''
-    location_id = ''
+    value = None
+    stock_id = ''
+    location_id = None
 
     def __init__(self, api_session, field_name=None, value=None, stock_id=None,
                  location_id=None):
@@ -19,14 +20,19 @@ class UpdateInventoryItemStockField(Request):
             self.value = value
         if stock_id is not None:
             self.stock_id = stock_id
-        if location_id is None:
-            self.location_id = GetLocations.default
+        if location_id is not None:
+            self.location_id = location_id
+        if self.location_id is None:
+            self.location_id = api_session.locations['Default'].guid
         super().__init__(api_session)
 
     def test_response(self, response):
-        assert reponse.text == '', "Error message recieved: " + response.text
+        assert response.text == '', "Error message recieved: " + response.text
         return super().test_response(response)
 
+    def get_stock_ids(self):
+        return (self.stock_id,)
+
     def get_data(self):
         data = {
             'fieldName': self.field_name,
@@ -39,8 +45,8 @@ class UpdateInventoryItemStockField(Request):
     def test_request(self):
         assert self.field_name is not None and len(self.field_name) > 0, \
             "Field name must be supplied."
-        assert self.value is not None and value != '', \
+        assert self.value is not None and self.value != '', \
             "Value must be supplied."
         assert is_guid(self.stock_id), "Stock ID must be a valid GUID."
         assert is_guid(self.location_id), "Location ID must be a valid GUID."
-        return super().test_request(request)
+        return super().test_request()
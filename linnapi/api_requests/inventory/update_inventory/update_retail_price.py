@@ -13,4 +13,4 @@ class UpdateRetailPrice(UpdateInventoryItemField):
 
     def test_request(self):
         assert isinstance(self.value, float), "Value must be of type float"
-        return super().test_request(self)
+        return super().test_request()
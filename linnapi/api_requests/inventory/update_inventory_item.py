@@ -3,3 +3,7 @@ from linnapi.api_requests.inventory.add_inventory_item import AddInventoryItem
 
 class UpdateInventoryItem(AddInventoryItem):
     url_extension = '/api/Inventory/UpdateInventoryItem'
+    quantity = None
+
+    def get_new_sku(self, api_session):
+        raise ValueError('SKU is required to update an inventory item.')
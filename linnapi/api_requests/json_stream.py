@@ -0,0 +1,136 @@
+"""Incremental parsing of JSON arrays from a stream of bytes.
+
+Large list responses can be handled one element at a time without holding
+the whole body in memory. The body is read in chunks into a text buffer,
+each complete element is decoded with ``json.JSONDecoder.raw_decode`` and
+dropped from the buffer before more is read.
+"""
+
+import codecs
+import json
+
+
+class JSONArrayStream:
+    """Iterate over the elements of a JSON array read from chunks of bytes.
+
+    If ``key`` is None the body must be a JSON array. Otherwise the body
+    must be a JSON object and the elements of the array stored under
+    ``key`` are returned. Other members of the object are decoded as they
+    are passed and stored in ``values`` by name, so values that follow the
+    array are available once iteration has finished.
+
+    Arguments:
+        chunks -- Iterable of ``bytes``, such as
+            ``requests.Response.iter_content()``.
+
+    Keyword arguments:
+        key -- Name of the array in the top level object. (Default None)
+        max_buffer_size -- Maximum number of characters held at once.
+            ``ValueError`` is raised if a single element or value is larger.
+            (Default 16777216)
+    """
+
+    max_buffer_size = 16 * 1024 * 1024
+    whitespace = ' \t\n\r'
+    number_characters = '0123456789.eE+-'
+
+    def __init__(self, chunks, key=None, max_buffer_size=None):
+        self.chunks = iter(chunks)
+        self.key = key
+        if max_buffer_size is not None:
+            self.max_buffer_size = max_buffer_size
+        self.values = {}
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+        self.finished = False
+
+    def read(self):
+        """Add the next chunk to the buffer. Return False at end of body."""
+        if self.finished:
+            return False
+        self.buffer = self.buffer[self.position:]
+        self.position = 0
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.buffer += self.text_decoder.decode(b'', final=True)
+            self.finished = True
+            return False
+        self.buffer += self.text_decoder.decode(chunk)
+        if len(self.buffer) > self.max_buffer_size:
+            raise ValueError(
+                'JSON value larger than {} characters.'.format(
+                    self.max_buffer_size))
+        return True
+
+    def next_character(self):
+        """Skip whitespace and return the next character without using it."""
+        while True:
+            while self.position < len(self.buffer) and \
+                    self.buffer[self.position] in self.whitespace:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read():
+                raise ValueError('Unexpected end of JSON body.')
+
+    def expect(self, characters):
+        character = self.next_character()
+        if character not in characters:
+            raise ValueError('Expected {!r} at {!r} in JSON body.'.format(
+                characters, self.buffer[self.position:self.position + 20]))
+        self.position += 1
+        return character
+
+    def decode_value(self):
+        """Decode and return the next complete JSON value."""
+        self.next_character()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(
+                    self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.read():
+                    continue
+                raise
+            if self.may_continue(value, end) and self.read():
+                continue
+            self.position = end
+            return value
+
+    def may_continue(self, value, end):
+        """Return True if the value may continue in the next chunk."""
+        if end == len(self.buffer):
+            return True
+        return isinstance(value, (int, float)) and \
+            self.buffer[end] in self.number_characters
+
+    def __iter__(self):
+        if self.key is None:
+            yield from self.iter_array()
+            return
+        self.expect('{')
+        if self.next_character() == '}':
+            self.position += 1
+            return
+        while True:
+            name = self.decode_value()
+            self.expect(':')
+            if name == self.key and self.next_character() == '[':
+                yield from self.iter_array()
+            else:
+                self.values[name] = self.decode_value()
+            if self.expect(',}') == '}':
+                return
+
+    def iter_array(self):
+        self.expect('[')
+        if self.next_character() == ']':
+            self.position += 1
+            return
+        while True:
+            yield self.decode_value()
+            if self.expect(',]') == ']':
+                return
@@ -1,9 +1,17 @@
-from . create_PDF_from_job_force_template import CreatePDFFromJobForceTemplate
-from . get_all_open_orders import GetAllOpenOrders
-from . get_open_order_id_by_order_or_reference_id \
-    import GetOpenOrderIDByOrderOrReferenceID
-from . get_open_order import GetOpenOrder
-from . get_open_orders import GetOpenOrders
-from . get_orders import GetOrders
-from . get_print_file import GetPrintFile
-from . process_order import ProcessOrder
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'CreatePDFFromJobForceTemplate': 'create_PDF_from_job_force_template',
+    'GetAllOpenOrders': 'get_all_open_orders',
+    'GetOpenOrderIDByOrderOrReferenceID':
+        'get_open_order_id_by_order_or_reference_id',
+    'GetOpenOrder': 'get_open_order',
+    'GetOpenOrders': 'get_open_orders',
+    'GetOrders': 'get_orders',
+    'GetPrintFile': 'get_print_file',
+    'ProcessOrder': 'process_order',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes)
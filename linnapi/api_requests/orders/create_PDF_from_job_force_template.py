@@ -1,5 +1,3 @@
-import requests
-
 from linnapi.api_requests.request import Request
 
 
@@ -7,12 +5,14 @@ class CreatePDFFromJobForceTemplate(Request):
     url_extension = '/api/PrintService/CreatePDFfromJobForceTemplate'
     printer_name = 'PDF'
     template_type = 'Invoice Template'
-    ids = []
+    ids = None
 
     def __init__(self, api_session, ids=None, printer_name=None,
                  template_type=None):
         if ids is not None:
             self.ids = ids
+        else:
+            self.ids = []
         if printer_name is not None:
             self.printer_name = printer_name
         if template_type is not None:
@@ -33,6 +33,7 @@ class CreatePDFFromJobForceTemplate(Request):
         self.response_url = self.response_dict['URL']
 
     def save_PDF(self, filename):
+        import requests
         response = requests.get(self.response_url)
         with open(filename, "w") as out_file:
             out_file.write(response.text)
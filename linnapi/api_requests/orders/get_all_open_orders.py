@@ -5,7 +5,7 @@ from linnapi.api_requests.request import Request
 
 class GetAllOpenOrders(Request):
     url_extension = '/api/Orders/GetAllOpenOrders'
-    filters = {}
+    filters = None
     location_id = ''
     additional_filter = ''
 
@@ -13,10 +13,12 @@ class GetAllOpenOrders(Request):
                  additional_filter=None):
         if filters is not None:
             self.filters = filters
+        else:
+            self.filters = {}
         if location_id is not None:
             self.location_id = location_id
         else:
-            self.location_id = self.api_session.locations['Default'].guid
+            self.location_id = api_session.locations['Default'].guid
         super().__init__(api_session)
 
     def get_data(self):
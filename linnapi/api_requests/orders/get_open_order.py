@@ -5,6 +5,7 @@ from linnapi.api_requests.request import Request
 
 class GetOpenOrder(Request):
     url_extension = '/api/Orders/GetOrder'
+    coalesce = True
     load_items = True
     load_additional_info = False
 
@@ -7,7 +7,7 @@ from linnapi.api_requests.request import Request
 
 class GetOpenOrderIDByOrderOrReferenceID(Request):
     url_extension = '/api/Orders/GetOpenOrderIdByOrderOrReferenceId'
-    filters = {}
+    filters = None
     order_number = ''
 
     def __init__(self, api_session, order_number=None, filters=None):
@@ -15,6 +15,8 @@ class GetOpenOrderIDByOrderOrReferenceID(Request):
             self.order_number = order_number
         if filters is not None:
             self.filters = filters
+        else:
+            self.filters = {}
         super().__init__(api_session)
 
     def get_data(self):
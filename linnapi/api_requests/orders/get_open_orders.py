@@ -5,24 +5,28 @@ from linnapi.api_requests.request import Request
 
 class GetOpenOrders(Request):
     url_extension = '/api/Orders/GetOpenOrders'
-    filters = {}
+    filters = None
     location_id = ''
     additional_filter = ''
     count = 99999
     page_number = 1
+    stream_key = 'Data'
 
     def __init__(self, api_session, count=None, page_number=None, filters=None,
-                 location_id=None, additional_filter=None):
+                 location_id=None, additional_filter=None, stream=False):
+        self.stream = stream
         if count is not None:
             self.count = count
         if page_number is not None:
             self.page_number = page_number
         if filters is not None:
             self.filters = filters
+        else:
+            self.filters = {}
         if location_id is not None:
             self.location_id = location_id
         else:
-            self.location_id = self.api_session.locations['Default'].guid
+            self.location_id = api_session.locations['Default'].guid
         super().__init__(api_session)
 
     def get_data(self):
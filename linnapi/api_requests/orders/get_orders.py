@@ -7,7 +7,7 @@ from linnapi.api_requests.request import Request
 
 class GetOrders(Request):
     url_extension = '/api/Orders/GetOrders'
-    order_ids = []
+    order_ids = None
     location_id = ''
     load_items = True
     load_additional_info = True
@@ -16,10 +16,12 @@ class GetOrders(Request):
                  load_items=None, load_additional_info=None):
         if order_ids is not None:
             self.order_ids = order_ids
+        else:
+            self.order_ids = []
         if location_id is not None:
             self.location_id = location_id
         else:
-            self.location_id = self.api_session.locations['Default'].guid
+            self.location_id = api_session.locations['Default'].guid
         if load_items is not None:
             self.load_items = load_items
         if load_additional_info is not None:
@@ -1,2 +1,10 @@
-from . get_order_info import GetOrderInfo
-from . search_processed_orders_paged import SearchProcessedOrdersPaged
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'GetOrderInfo': 'get_order_info',
+    'SearchProcessedOrdersPaged': 'search_processed_orders_paged',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes)
@@ -1,7 +1,23 @@
+import json
+
+import requests
+
+from linnapi.api_requests import decoders
+from linnapi.api_requests.json_stream import JSONArrayStream
+
+
 class Request():
     url_extension = ''
-    data = {}
+    data = None
     response = None
+    stream = False
+    stream_key = None
+    stream_chunk_size = 64 * 1024
+    stream_buffer_size = 16 * 1024 * 1024
+    cacheable = False
+    invalidates_cache = False
+    invalidated_endpoints = ()
+    coalesce = False
 
     def __init__(self, api_session, test=True):
         self.test = test
@@ -15,21 +31,130 @@ class Request():
             self.execute()
 
     def execute(self):
-        self.response = self.api_session.request(
-            self.url,
-            data=self.data,
-            files=self.get_files(),
-            params=self.get_params())
-        self.json = self.response.text
+        if self.stream is True:
+            return self.execute_stream()
+        cache = self.api_session.response_cache
+        if cache is not None and self.cacheable:
+            self.response, self.response_dict = self.get_cached_response(
+                cache)
+        else:
+            self.response, self.response_dict = self.send()
+        if cache is not None and self.invalidates_cache and \
+                self.response.ok:
+            cache.invalidate(
+                self.get_stock_ids(),
+                url_extensions=self.invalidated_endpoints)
         if self.test is True:
             if self.test_response(self.response) is True:
                 self.load_respose_dict()
         else:
             self.load_respose_dict()
 
+    def send(self):
+        """Send the request and return the response and decoded response.
+
+        If the class sets ``coalesce`` identical requests sent at the same
+        time from other threads share one network call and one decoded
+        response, so the decoded response must not be changed.
+        """
+        coalescer = self.api_session.coalescer
+        if self.coalesce and coalescer is not None:
+            return coalescer.call(self.get_request_key(), self.send_decoded)
+        return self.send_decoded()
+
+    def send_decoded(self):
+        response = self.send_request()
+        return response, decoders.decode(response.content)
+
+    def send_request(self, stream=False):
+        """Send the request through the endpoint's circuit breaker.
+
+        Raises ``CircuitOpenError`` without sending the request if the
+        endpoint has been failing.
+        """
+        breakers = self.api_session.circuit_breakers
+        if breakers is None:
+            return self.api_session.request(
+                self.url, data=self.data, files=self.get_files(),
+                params=self.get_params(), stream=stream)
+        breaker = breakers.get(self.url_extension)
+        breaker.before_request()
+        try:
+            response = self.api_session.request(
+                self.url, data=self.data, files=self.get_files(),
+                params=self.get_params(), stream=stream)
+        except requests.RequestException:
+            breaker.record(None)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record(response)
+        return response
+
+    def get_cached_response(self, cache):
+        """Return response and decoded response from ``cache``.
+
+        The request is sent and cached if it is not in the cache.
+        """
+        response = cache.get(self)
+        if response is not None:
+            return response, decoders.decode(response.content)
+        generation = cache.generation
+        response, response_dict = self.send()
+        cache.put(self, response, generation=generation)
+        return response, response_dict
+
+    def get_request_key(self):
+        """Return ``str`` identifying the endpoint, data and parameters."""
+        values = json.dumps(
+            [self.data, self.get_params()], sort_keys=True,
+            separators=(',', ':'), default=str)
+        return self.url_extension + '?' + values
+
+    def get_stock_ids(self):
+        """Return stock IDs read or changed by the request.
+
+        Used to drop cached responses when an item changes. Requests that
+        change items that can not be listed return None so every cached
+        item is dropped.
+        """
+        return ()
+
+    def execute_stream(self):
+        """Send the request without reading the response body.
+
+        The elements of the response array are read by ``iter_response``.
+        """
+        self.response = self.send_request(stream=True)
+        self.response_dict = None
+        self.response.raise_for_status()
+
+    def iter_response(self):
+        """Yield the elements of a streamed response array one at a time.
+
+        The body is read in chunks of ``stream_chunk_size`` bytes and no
+        more than ``stream_buffer_size`` characters are held at once. For
+        requests with a ``stream_key`` the members of the response object
+        other than the array are stored in ``response_values``.
+        """
+        array_stream = JSONArrayStream(
+            self.response.iter_content(self.stream_chunk_size),
+            key=self.stream_key, max_buffer_size=self.stream_buffer_size)
+        self.response_values = array_stream.values
+        try:
+            yield from array_stream
+        finally:
+            self.response.close()
+
+    @property
+    def json(self):
+        return self.response.text
+
     def load_respose_dict(self):
+        if self.response_dict is None:
+            return
         try:
-            self.response_dict = self.response.json()
             self.process_response(self.response)
         except:
             pass
@@ -45,7 +170,7 @@ class Request():
         return True
 
     def get_data(self):
-        data = {}
+        data = None
         return data
 
     def get_files(self):
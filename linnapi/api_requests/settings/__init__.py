@@ -1,6 +1,14 @@
-from . get_categories import GetCategories
-from . get_channels import GetChannels
-from . get_locations import GetLocations
-from . get_package_groups import GetPackageGroups
-from . get_postage_services import GetPostageServices
-from . get_shipping_methods import GetShippingMethods
+from linnapi.lazy_import import lazy_import
+
+_request_classes = {
+    'GetCategories': 'get_categories',
+    'GetChannels': 'get_channels',
+    'GetLocations': 'get_locations',
+    'GetPackageGroups': 'get_package_groups',
+    'GetPostageServices': 'get_postage_services',
+    'GetShippingMethods': 'get_shipping_methods',
+}
+
+__all__ = list(_request_classes)
+__getattr__, __dir__ = lazy_import(
+    __name__, globals(), _request_classes)
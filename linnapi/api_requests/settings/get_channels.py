@@ -3,8 +3,9 @@ from linnapi.api_requests.request import Request
 
 class GetChannels(Request):
     url_extension = '/api/Inventory/GetChannels'
+    cacheable = True
 
     def test_response(self, response):
-        assert isinstance(response.json(), list),\
+        assert isinstance(self.response_dict, list),\
             response.text + " is not valid json"
         return super().test_response(response)
@@ -5,6 +5,7 @@ from linnapi.api_requests.request import Request
 
 class GetInfoRequest(Request):
     url_extension = ''
+    cacheable = True
     info = []
     name_field = ''
     id_field = ''
@@ -14,7 +15,7 @@ class GetInfoRequest(Request):
         super().__init__(api_session)
 
     def test_response(self, response):
-        assert isinstance(response.json(), list),\
+        assert isinstance(self.response_dict, list),\
             response.text + " is not valid json"
         return super().test_response(response)
 
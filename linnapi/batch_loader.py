@@ -0,0 +1,168 @@
+"""Merges single item reads into bulk requests """
+
+import contextlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class BatchLoader:
+    """Collects keys requested one at a time and loads them together.
+
+    Subclasses implement ``load_batch``, which takes a list of keys and
+    returns a ``dict`` of values by key. A value that is an exception is
+    raised by ``load`` for that key only.
+
+    Keys passed to ``load`` from different threads within ``window``
+    seconds of each other are loaded with one call to ``load_batch``, or
+    one per ``max_batch_size`` keys. The thread that asks for the first key
+    of a batch waits for the window to pass, or for the batch to fill, and
+    loads the batch for every thread waiting on it.
+
+    Code that asks for one key at a time from a single thread can be
+    batched with ``prefetch``. Every key is loaded up front in batches and
+    ``load`` returns the loaded values until the ``with`` block ends.
+
+    Example:
+        with api_session.stock_level_loader.prefetch(stock_ids):
+            for item in items:
+                item.get_available()
+
+    Keyword arguments:
+        window -- Seconds to wait for more keys before loading a batch.
+            (Default 0.01)
+        max_batch_size -- Largest number of keys passed to ``load_batch``.
+            (Default 200)
+        max_workers -- Number of batches loaded at once by ``load_many``.
+            (Default 8)
+    """
+
+    window = 0.01
+    max_batch_size = 200
+    max_workers = 8
+
+    def __init__(self, window=None, max_batch_size=None, max_workers=None):
+        if window is not None:
+            self.window = window
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+        if max_workers is not None:
+            self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.batch_full = None
+        self.scopes = []
+        self.batches = 0
+        self.keys_loaded = 0
+
+    def load_batch(self, keys):
+        """Return ``dict`` of values by key for a list of keys."""
+        raise NotImplementedError
+
+    def get_prefetched(self, key):
+        for values in reversed(self.scopes):
+            if key in values:
+                return True, values[key]
+        return False, None
+
+    def load(self, key):
+        """Return the value for key, loaded in a batch with other keys.
+
+        Raises ``KeyError`` if ``load_batch`` does not return the key.
+        """
+        with self.lock:
+            found, value = self.get_prefetched(key)
+            if found:
+                return value
+            future = self.pending.get(key)
+            leader = False
+            if future is None:
+                future = Future()
+                self.pending[key] = future
+                if len(self.pending) == 1:
+                    self.batch_full = threading.Event()
+                    leader = True
+                if self.batch_full is not None and \
+                        len(self.pending) >= self.max_batch_size:
+                    self.batch_full.set()
+            batch_full = self.batch_full
+        if leader:
+            batch_full.wait(self.window)
+            self.dispatch()
+        return future.result()
+
+    def load_many(self, keys):
+        """Return ``dict`` of values by key for keys, loaded now.
+
+        Keys that ``load_batch`` does not return or could not load are
+        left out.
+        """
+        keys = list(dict.fromkeys(keys))
+        futures = {}
+        with self.lock:
+            for key in keys:
+                found, value = self.get_prefetched(key)
+                if found:
+                    futures[key] = Future()
+                    futures[key].set_result(value)
+                    continue
+                if key not in self.pending:
+                    self.pending[key] = Future()
+                futures[key] = self.pending[key]
+        self.dispatch()
+        values = {}
+        for key, future in futures.items():
+            if future.exception() is None:
+                values[key] = future.result()
+        return values
+
+    @contextlib.contextmanager
+    def prefetch(self, keys):
+        """Load keys in batches and serve them to ``load`` in the block."""
+        values = self.load_many(keys)
+        with self.lock:
+            self.scopes.append(values)
+        try:
+            yield values
+        finally:
+            with self.lock:
+                self.scopes.remove(values)
+
+    def dispatch(self):
+        """Load every pending key."""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.batch_full = None
+        if not pending:
+            return
+        keys = list(pending)
+        batches = [
+            keys[i:i + self.max_batch_size]
+            for i in range(0, len(keys), self.max_batch_size)]
+        if len(batches) == 1:
+            self.run_batch(batches[0], pending)
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch in batches:
+                executor.submit(self.run_batch, batch, pending)
+
+    def run_batch(self, keys, pending):
+        try:
+            values = self.load_batch(keys)
+        except BaseException as e:
+            for key in keys:
+                pending[key].set_exception(e)
+            return
+        with self.lock:
+            self.batches += 1
+            self.keys_loaded += len(keys)
+        for key in keys:
+            value = values.get(key, KeyError(key))
+            if isinstance(value, BaseException):
+                pending[key].set_exception(value)
+            else:
+                pending[key].set_result(value)
+
+    def stats(self):
+        """Return ``dict`` of batch and key counts."""
+        with self.lock:
+            return {'batches': self.batches, 'keys': self.keys_loaded}
@@ -0,0 +1,190 @@
+"""Stops requests to API endpoints that keep failing """
+
+import threading
+import time
+
+from linnapi.exceptions import CircuitOpenError
+
+
+class CircuitBreaker:
+    """Tracks failures of one endpoint and fails fast while it is down.
+
+    The circuit starts ``'closed'`` and requests are sent. After
+    ``failure_threshold`` failures in a row it is ``'open'`` and
+    ``before_request`` raises ``CircuitOpenError`` without sending
+    anything. After ``reset_timeout`` seconds it is ``'half_open'`` and up
+    to ``half_open_requests`` trial requests are sent. The circuit closes
+    if a trial succeeds and opens again if one fails.
+
+    A failure is a connection error, a timeout or a 5xx response. A
+    request that ends in any other exception is passed to ``release`` so
+    its trial slot is given back.
+
+    Arguments:
+        url_extension -- Endpoint the breaker is for.
+
+    Keyword arguments:
+        failure_threshold -- Failures in a row that open the circuit.
+            (Default 5)
+        reset_timeout -- Seconds the circuit stays open. (Default 30)
+        half_open_requests -- Trial requests allowed at once when half
+            open. (Default 1)
+    """
+
+    failure_threshold = 5
+    reset_timeout = 30.0
+    half_open_requests = 1
+
+    def __init__(self, url_extension, failure_threshold=None,
+                 reset_timeout=None, half_open_requests=None):
+        self.url_extension = url_extension
+        if failure_threshold is not None:
+            self.failure_threshold = failure_threshold
+        if reset_timeout is not None:
+            self.reset_timeout = reset_timeout
+        if half_open_requests is not None:
+            self.half_open_requests = half_open_requests
+        self.lock = threading.Lock()
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = None
+        self.trials = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    def update_state(self):
+        if self.state == 'open' and \
+                time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = 'half_open'
+            self.trials = 0
+
+    def get_state(self):
+        """Return 'closed', 'open' or 'half_open'."""
+        with self.lock:
+            self.update_state()
+            return self.state
+
+    def get_retry_in(self):
+        if self.state != 'open':
+            return 0.0
+        return max(
+            0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def before_request(self):
+        """Raise ``CircuitOpenError`` if a request may not be sent."""
+        with self.lock:
+            self.update_state()
+            if self.state == 'half_open' and \
+                    self.trials < self.half_open_requests:
+                self.trials += 1
+                return
+            if self.state != 'closed':
+                self.rejected += 1
+                raise CircuitOpenError(
+                    self.url_extension, self.get_retry_in())
+
+    def release(self):
+        """Give back a trial slot for a request that ended with no result."""
+        with self.lock:
+            if self.state == 'half_open' and self.trials > 0:
+                self.trials -= 1
+
+    def open(self):
+        self.state = 'open'
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            if self.state == 'half_open':
+                self.state = 'closed'
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == 'half_open' or \
+                    self.failures >= self.failure_threshold:
+                self.open()
+
+    def record(self, response):
+        """Record a response, or None if no response was received."""
+        if response is None or response.status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self):
+        """Close the circuit."""
+        with self.lock:
+            self.state = 'closed'
+            self.failures = 0
+
+    def stats(self):
+        with self.lock:
+            self.update_state()
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'times_opened': self.times_opened,
+                'rejected': self.rejected,
+                'retry_in': self.get_retry_in()}
+
+
+class CircuitBreakers:
+    """A ``CircuitBreaker`` for each ``Request.url_extension``.
+
+    Example:
+        breakers = CircuitBreakers(endpoints={
+            '/api/PrintService/CreatePDFfromJobForceTemplate': {
+                'failure_threshold': 2, 'reset_timeout': 60}})
+        api_session = LinnworksAPISession(circuit_breakers=breakers)
+
+    Keyword arguments:
+        failure_threshold -- Default failures in a row that open a
+            circuit. (Default 5)
+        reset_timeout -- Default seconds a circuit stays open.
+            (Default 30)
+        half_open_requests -- Default trial requests allowed at once.
+            (Default 1)
+        endpoints -- ``dict`` by ``url_extension`` of ``dict``s of
+            ``CircuitBreaker`` keyword arguments for that endpoint.
+            (Default None)
+    """
+
+    def __init__(self, failure_threshold=None, reset_timeout=None,
+                 half_open_requests=None, endpoints=None):
+        self.settings = {
+            'failure_threshold': failure_threshold,
+            'reset_timeout': reset_timeout,
+            'half_open_requests': half_open_requests}
+        self.endpoints = {}
+        if endpoints is not None:
+            self.endpoints.update(endpoints)
+        self.lock = threading.Lock()
+        self.breakers = {}
+
+    def get(self, url_extension):
+        """Return the ``CircuitBreaker`` for an endpoint."""
+        with self.lock:
+            breaker = self.breakers.get(url_extension)
+            if breaker is None:
+                settings = dict(self.settings)
+                settings.update(self.endpoints.get(url_extension, {}))
+                breaker = CircuitBreaker(url_extension, **settings)
+                self.breakers[url_extension] = breaker
+            return breaker
+
+    def reset(self):
+        """Close every circuit."""
+        with self.lock:
+            breakers = list(self.breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    def stats(self):
+        """Return ``dict`` of breaker states by endpoint."""
+        with self.lock:
+            breakers = list(self.breakers.values())
+        return {
+            breaker.url_extension: breaker.stats() for breaker in breakers}
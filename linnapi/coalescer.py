@@ -0,0 +1,88 @@
+"""Shares one network call between identical concurrent requests """
+
+import threading
+
+
+class Flight:
+    """A request in progress and the callers waiting on it."""
+
+    __slots__ = ('event', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """Coalesces identical read requests that are in flight at once.
+
+    The first caller for a key sends the request. Callers with the same key
+    that arrive before it finishes wait for it and are given the same
+    result, such as the ``requests.Response`` and its decoded body, or the
+    same exception is raised. Nothing is kept
+    once the request has finished, so later callers always send a new
+    request.
+
+    Attributes:
+        calls -- Number of requests sent.
+        hits -- Number of callers given another caller's result.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.calls = 0
+        self.hits = 0
+
+    def call(self, key, function):
+        """Return the result of ``function`` shared by callers of ``key``.
+
+        Arguments:
+            key -- Hashable key identifying the request.
+            function -- Callable sending the request and returning the
+                result to share.
+        """
+        with self.lock:
+            flight = self.flights.get(key)
+            if flight is None:
+                flight = Flight()
+                self.flights[key] = flight
+                self.calls += 1
+                leader = True
+            else:
+                flight.waiters += 1
+                self.hits += 1
+                leader = False
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = function()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.event.set()
+        return flight.result
+
+    def in_flight(self):
+        """Return the number of requests currently being sent."""
+        with self.lock:
+            return len(self.flights)
+
+    def stats(self):
+        """Return ``dict`` of request and coalesce hit counts."""
+        with self.lock:
+            calls, hits = self.calls, self.hits
+        total = calls + hits
+        return {
+            'calls': calls,
+            'hits': hits,
+            'hit_rate': hits / total if total else 0.0,
+            'in_flight': len(self.flights)}
@@ -0,0 +1,180 @@
+"""Adapts the number of concurrent requests to the server's responses """
+
+import collections
+import email.utils
+import threading
+import time
+
+
+def get_retry_after(response):
+    """Return seconds to wait from a response's ``Retry-After`` or None."""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class AdaptiveConcurrencyLimit:
+    """Additive increase, multiplicative decrease limit on requests in flight.
+
+    Each response is recorded with ``record``. The limit grows by one for
+    every ``limit`` successful responses and is cut by ``decrease_factor``
+    when the server throttles (429), fails (5xx) or the connection fails.
+    It is cut by the smaller ``latency_factor`` when responses slow down:
+    latency is compared with the fastest recent response from the same
+    endpoint, so slow endpoints do not look like congestion. Cuts are made
+    at most once per ``cooldown`` seconds so one burst of failures counts
+    once.
+
+    A throttled response pauses new requests for its ``Retry-After`` time,
+    or ``default_retry_after`` seconds if it has none.
+
+    Keyword arguments:
+        initial_limit -- Starting limit. Defaults to ``max_limit``.
+        min_limit -- Smallest limit. (Default 1)
+        max_limit -- Largest limit. (Default 16)
+        decrease_factor -- Limit multiplier after a throttled or failed
+            response. (Default 0.5)
+        latency_factor -- Limit multiplier when latency rises.
+            (Default 0.9)
+        latency_tolerance -- Ratio of smoothed latency to the endpoint's
+            fastest recent latency treated as congestion. (Default 2.0)
+        cooldown -- Least number of seconds between cuts. (Default 1.0)
+        history_size -- Number of limit changes kept in ``history``.
+            (Default 100)
+    """
+
+    min_limit = 1
+    max_limit = 16
+    decrease_factor = 0.5
+    latency_factor = 0.9
+    latency_tolerance = 2.0
+    latency_smoothing = 0.1
+    baseline_samples = 50
+    cooldown = 1.0
+    default_retry_after = 1.0
+    history_size = 100
+
+    def __init__(self, initial_limit=None, min_limit=None, max_limit=None,
+                 decrease_factor=None, latency_factor=None,
+                 latency_tolerance=None, cooldown=None, history_size=None):
+        if min_limit is not None:
+            self.min_limit = min_limit
+        if max_limit is not None:
+            self.max_limit = max_limit
+        if decrease_factor is not None:
+            self.decrease_factor = decrease_factor
+        if latency_factor is not None:
+            self.latency_factor = latency_factor
+        if latency_tolerance is not None:
+            self.latency_tolerance = latency_tolerance
+        if cooldown is not None:
+            self.cooldown = cooldown
+        if history_size is not None:
+            self.history_size = history_size
+        if initial_limit is None:
+            initial_limit = self.max_limit
+        self.lock = threading.Lock()
+        self.limit = float(
+            min(self.max_limit, max(self.min_limit, initial_limit)))
+        self.latency_ratio = 1.0
+        self.baselines = {}
+        self.last_decrease = 0.0
+        self.throttled_until = 0.0
+        self.responses = 0
+        self.throttled = 0
+        self.errors = 0
+        self.history = collections.deque(maxlen=self.history_size)
+        self.add_history('start')
+
+    def get_limit(self):
+        """Return the current limit as an ``int``."""
+        return int(self.limit)
+
+    def get_delay(self):
+        """Return seconds until requests may be sent after throttling."""
+        return max(0.0, self.throttled_until - time.monotonic())
+
+    def add_history(self, reason):
+        self.history.append((time.time(), self.get_limit(), reason))
+
+    def set_limit(self, limit, reason):
+        limit = min(self.max_limit, max(self.min_limit, limit))
+        changed = int(limit) != self.get_limit()
+        self.limit = limit
+        if changed:
+            self.add_history(reason)
+
+    def decrease(self, factor, reason):
+        now = time.monotonic()
+        if now - self.last_decrease < self.cooldown:
+            return
+        self.last_decrease = now
+        self.set_limit(self.limit * factor, reason)
+
+    def update_latency(self, endpoint, latency):
+        """Return True if latency shows the server is congested."""
+        samples = self.baselines.get(endpoint)
+        if samples is None:
+            samples = collections.deque(maxlen=self.baseline_samples)
+            self.baselines[endpoint] = samples
+        samples.append(latency)
+        baseline = min(samples)
+        if baseline <= 0:
+            return False
+        self.latency_ratio += self.latency_smoothing * (
+            latency / baseline - self.latency_ratio)
+        return self.latency_ratio > self.latency_tolerance
+
+    def record(self, endpoint, latency, response):
+        """Update the limit from a response.
+
+        Arguments:
+            endpoint -- Key grouping requests of similar cost, such as the
+                URL.
+            latency -- Seconds the request took.
+            response -- ``requests.Response`` or None if no response was
+                received.
+        """
+        with self.lock:
+            self.responses += 1
+            if response is None or response.status_code >= 500:
+                self.errors += 1
+                self.decrease(self.decrease_factor, 'error')
+            elif response.status_code == 429:
+                self.throttled += 1
+                retry_after = get_retry_after(response)
+                if retry_after is None:
+                    retry_after = self.default_retry_after
+                self.throttled_until = max(
+                    self.throttled_until, time.monotonic() + retry_after)
+                self.decrease(self.decrease_factor, 'throttled')
+            elif self.update_latency(endpoint, latency):
+                self.decrease(self.latency_factor, 'latency')
+            else:
+                self.set_limit(self.limit + 1 / self.limit, 'increase')
+
+    def stats(self):
+        """Return ``dict`` of the current limit, counts and limit history.
+
+        History is a list of (time, limit, reason) tuples.
+        """
+        with self.lock:
+            return {
+                'limit': self.get_limit(),
+                'latency_ratio': self.latency_ratio,
+                'throttled_for': self.get_delay(),
+                'responses': self.responses,
+                'throttled': self.throttled,
+                'errors': self.errors,
+                'history': list(self.history)}
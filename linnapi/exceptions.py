@@ -1,5 +1,4 @@
 import json
-from simplejson.scanner import JSONDecodeError
 
 
 class HTTPRequestError(Exception):
@@ -8,7 +7,7 @@ class HTTPRequestError(Exception):
         try:
             self.response_text = json.dumps(
                 request.json(), indent=4, sort_keys=True)
-        except JSONDecodeError:
+        except ValueError:
             self.response_text = request.text
         super().__init__(self.get_message())
 
@@ -23,3 +22,19 @@ class InvalidResponse(HTTPRequestError):
     def get_message(self):
         message = "Request to " + self.url + "returned invalid response:\n"
         message += self.response_text
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to an endpoint that is failing.
+
+    Attributes:
+        url_extension -- Endpoint whose circuit is open.
+        retry_in -- Seconds until a trial request will be allowed.
+    """
+
+    def __init__(self, url_extension, retry_in):
+        self.url_extension = url_extension
+        self.retry_in = retry_in
+        super().__init__(
+            'Circuit open for {}, retry in {:.1f} seconds.'.format(
+                url_extension, retry_in))
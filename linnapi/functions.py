@@ -1,6 +1,6 @@
 def SKU_exists(api_session, sku):
     """Checks if sku has been used as a product SKU """
-    from linnapi.api_requests.sku_exists import SKUExists
+    from linnapi.api_requests.inventory.sku_exists import SKUExists
     request = SKUExists(api_session, sku)
     return request.response_dict
 
@@ -21,39 +21,43 @@ def is_guid(guid):
 
 
 def get_stock_id_by_SKU(api_session, sku):
-    from linnapi.api_requests.inventory.inventory_view import InventoryView
-    from linnapi.api_requests.inventory.inventory_view_filter \
-        import InventoryViewFilter
-    from linnapi.api_requests.inventory.get_inventory_items \
-        import GetInventoryItems
-
-    view = InventoryView()
-    view.filters.append(InventoryViewFilter(
-        field='String',
-        value=sku,
-        condition='Equals',
-        filter_name='SKU',
-        filter_name_exact=''
-    ))
-    response = GetInventoryItems(api_session, view=view)
-    return response.response_dict['Items'][0]['Id']
+    """Return stock ID of the item with SKU sku."""
+    stock_ids = api_session.sku_lookup.get_stock_ids([sku])
+    return stock_ids[sku]
+
+
+def get_stock_ids_by_SKU(api_session, skus):
+    """Return ``dict`` of stock IDs by SKU for each existing SKU in skus."""
+    return api_session.sku_lookup.get_stock_ids(skus)
+
+
+def SKUs_exist(api_session, skus):
+    """Return ``dict`` showing if each SKU in skus is used by an item."""
+    stock_ids = api_session.sku_lookup.get_stock_ids(skus)
+    return {sku: sku in stock_ids for sku in skus}
 
 
 def get_order_number(api_session, order_number):
+    """Return ``OpenOrder`` for order_number or None.
+
+    Requests are sent at interactive priority.
+    """
     from linnapi.api_requests.orders.\
         get_open_order_id_by_order_or_reference_id import \
         GetOpenOrderIDByOrderOrReferenceID
     from linnapi.orders import OpenOrder
-    request = GetOpenOrderIDByOrderOrReferenceID(api_session, order_number)
-    if is_guid(request.response_dict):
-        order_id = request.response_dict
-        try:
-            order = OpenOrder(api_session, load_order_id=order_id)
-        except:
-            order = None
-        return order
-    else:
-        return None
+    with api_session.priority('interactive'):
+        request = GetOpenOrderIDByOrderOrReferenceID(
+            api_session, order_number)
+        if is_guid(request.response_dict):
+            order_id = request.response_dict
+            try:
+                order = OpenOrder(api_session, load_order_id=order_id)
+            except:
+                order = None
+            return order
+        else:
+            return None
 
 
 def get_inventory_item(api_session, stock_id=None, sku=None):
@@ -66,7 +70,7 @@ def get_inventory_item(api_session, stock_id=None, sku=None):
     return InventoryItem(api_session, load_stock_id=stock_id)
 
 
-def get_export(api_session, script_id, parameters=[]):
+def get_export(api_session, script_id, parameters=None):
     import linnapi.api_requests
     import lstools
     request = linnapi.api_requests.ExecuteCustomScriptCSV(
@@ -155,21 +159,32 @@ def get_inventory(api_session, location='Default'):
 
 
 def get_order_id(api_session, order_number):
+    """Return order ID for order_number or None.
+
+    If ``api_session.processed_order_store`` is set it is checked before any
+    request is made. Requests are sent at interactive priority.
+    """
     from linnapi.api_requests import GetOpenOrderIDByOrderOrReferenceID
     from linnapi.api_requests import SearchProcessedOrdersPaged
-    open_order_request = \
-        GetOpenOrderIDByOrderOrReferenceID(
-            api_session, order_number)
-    open_order_request.response.raise_for_status()
-    if open_order_request.response.text == 'null':
-        processed_order_request = \
-            SearchProcessedOrdersPaged(
-                api_session, order_number, date_type='ALLDATES',
-                exact_match=True, search_field='nOrderId')
-        if len(processed_order_request.response_dict['Data']) == 1:
-            return processed_order_request.response_dict[
-                'Data'][0]['pkOrderID']
+    with api_session.priority('interactive'):
+        if api_session.processed_order_store is not None:
+            order_id = api_session.processed_order_store.get_order_id(
+                order_number)
+            if order_id is not None:
+                return order_id
+        open_order_request = \
+            GetOpenOrderIDByOrderOrReferenceID(
+                api_session, order_number)
+        open_order_request.response.raise_for_status()
+        if open_order_request.response.text == 'null':
+            processed_order_request = \
+                SearchProcessedOrdersPaged(
+                    api_session, order_number, date_type='ALLDATES',
+                    exact_match=True, search_field='nOrderId')
+            if len(processed_order_request.response_dict['Data']) == 1:
+                return processed_order_request.response_dict[
+                    'Data'][0]['pkOrderID']
+            else:
+                return None
         else:
-            return None
-    else:
-        return open_order_request.response_dict
+            return open_order_request.response_dict
@@ -1,7 +1,29 @@
-from . basic_item import BasicItem
-from . extended_property import ExtendedProperty
-from . inventory_item_image import InventoryItemImage
-from . inventory import Inventory
-from . single_inventory_item import SingleInventoryItem
-from . variation_group import VariationGroup
-from . variation_inventory_item import VariationInventoryItem
+from linnapi.lazy_import import lazy_import
+
+_classes = {
+    'BasicItem': 'basic_item',
+    'ExtendedProperty': 'extended_property',
+    'InventoryItem': 'inventory_item',
+    'InventoryItemImage': 'inventory_item_image',
+    'Inventory': 'inventory',
+    'SingleInventoryItem': 'single_inventory_item',
+    'VariationGroup': 'variation_group',
+    'VariationInventoryItem': 'variation_inventory_item',
+    'SKULookup': 'sku_lookup',
+    'SKUPool': 'sku_pool',
+    'BulkItemCreator': 'bulk_item_creator',
+    'VariationSync': 'variation_sync',
+    'VariationSyncReport': 'variation_sync',
+    'InventoryQuery': 'inventory_query',
+    'InventoryViewRegistry': 'view_registry',
+    'StockSnapshot': 'stock_snapshot',
+    'StockLevel': 'stock_snapshot',
+    'StockLevelUpdater': 'stock_level_updater',
+    'StockUpdateReport': 'stock_level_updater',
+    'InventoryFieldUpdater': 'field_updater',
+    'FieldUpdateReport': 'field_updater',
+    'StockLevelLoader': 'item_loaders',
+}
+
+__all__ = list(_classes)
+__getattr__, __dir__ = lazy_import(__name__, globals(), _classes)
@@ -0,0 +1,312 @@
+"""Creates inventory items in bulk """
+
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+from linnapi.functions import is_guid
+
+
+class BulkItemCreator:
+    """Creates many inventory items with their follow up steps.
+
+    Each row is a ``dict`` of ``AddInventoryItem`` keyword arguments
+    (``sku``, ``title``, ``barcode``, ``purchase_price`` ...) with these
+    optional extra keys:
+
+        extended_properties -- ``dict`` of extended property values by name.
+        images -- List of paths of images to upload.
+        variation_group -- SKU of the variation group the item belongs to.
+        variation_group_title -- Title of the variation group.
+            Defaults to the item title.
+
+    All rows are validated before any request is made. Rows without a SKU
+    are given one from ``api_session.sku_pool`` and every row is given a
+    stock ID locally. Rows are created from a pool of ``max_workers``
+    threads, each row adding its extended properties and images once the
+    item exists. Variation groups are created once all their items have
+    been. Failed steps are retried ``retries`` times.
+
+    If ``checkpoint`` is a file path, each completed step is appended to it
+    as a line of JSON and the lines are replayed by ``run`` so an
+    interrupted run can be resumed. The same rows must be passed in the
+    same order when resuming.
+
+    Arguments:
+        api_session -- ``LinnworksAPISession``.
+        rows -- List of ``dict``s describing new items.
+
+    Keyword arguments:
+        checkpoint -- Path of checkpoint file. (Default None)
+        max_workers -- Number of rows processed at once. (Default 8)
+        retries -- Number of times to retry a failed step. (Default 2)
+        retry_delay -- Seconds to wait before the first retry, doubled for
+            each retry after. (Default 1)
+    """
+
+    item_fields = {
+        'barcode': str, 'purchase_price': float, 'retail_price': float,
+        'quantity': int, 'tax_rate': float, 'variation_group_name': str,
+        'meta_data': str, 'category_id': str, 'package_group_id': str,
+        'postage_service_id': str, 'weight': float, 'width': float,
+        'depth': float, 'height': float}
+    guid_fields = ('category_id', 'package_group_id', 'postage_service_id')
+    extra_fields = (
+        'sku', 'title', 'extended_properties', 'images', 'variation_group',
+        'variation_group_title')
+    priority = 'bulk'
+
+    def __init__(self, api_session, rows, checkpoint=None, max_workers=8,
+                 retries=2, retry_delay=1):
+        self.api_session = api_session
+        self.rows = list(rows)
+        self.checkpoint = checkpoint
+        self.max_workers = max_workers
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.lock = threading.Lock()
+        self.state = {'items': {}, 'variation_groups': {}}
+        self.checkpoint_file = None
+        self.failed = {}
+
+    def validate(self):
+        """Raise ``ValueError`` listing every problem found in the rows."""
+        errors = []
+        skus = set()
+        for index, row in enumerate(self.rows):
+            for field in row:
+                if field not in self.item_fields and \
+                        field not in self.extra_fields:
+                    errors.append((index, 'Unknown field ' + str(field)))
+            title = row.get('title')
+            if not isinstance(title, str) or len(title) == 0:
+                errors.append((index, 'Title must be a non empty string.'))
+            sku = row.get('sku')
+            if sku is not None:
+                if not isinstance(sku, str) or len(sku) == 0:
+                    errors.append((index, 'SKU must be a non empty string.'))
+                elif sku in skus:
+                    errors.append((index, 'Duplicate SKU ' + sku))
+                skus.add(sku)
+            for field, field_type in self.item_fields.items():
+                if row.get(field) is None:
+                    continue
+                try:
+                    field_type(row[field])
+                except (TypeError, ValueError):
+                    errors.append((index, field + ' must be ' + str(
+                        field_type.__name__)))
+            for field in self.guid_fields:
+                if row.get(field) is not None and not is_guid(row[field]):
+                    errors.append((index, field + ' must be valid GUID.'))
+            if not isinstance(row.get('extended_properties', {}), dict):
+                errors.append(
+                    (index, 'extended_properties must be a dict.'))
+            for filepath in row.get('images', []):
+                if not os.path.isfile(filepath):
+                    errors.append((index, 'No image file at ' + filepath))
+        if len(errors) > 0:
+            raise ValueError('Invalid rows:\n' + '\n'.join(
+                'Row {}: {}'.format(index, error)
+                for index, error in errors))
+
+    def load_checkpoint(self):
+        """Rebuild the state by replaying the checkpoint file."""
+        self.state = {'items': {}, 'variation_groups': {}}
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return
+        with open(self.checkpoint, 'r') as checkpoint_file:
+            for line in checkpoint_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Last line cut short by an interrupted write.
+                    continue
+                self.apply_entry(entry)
+
+    def apply_entry(self, entry):
+        if 'variation_group' in entry:
+            self.state['variation_groups'][entry['variation_group']] = \
+                entry['stock_id']
+        elif 'step' in entry:
+            self.state['items'][entry['item']]['steps'].append(entry['step'])
+        else:
+            self.state['items'][entry['item']] = {
+                'key': entry['item'], 'stock_id': entry['stock_id'],
+                'sku': entry['sku'], 'steps': []}
+
+    def record(self, entry):
+        """Apply entry to the state and append it to the checkpoint."""
+        with self.lock:
+            self.apply_entry(entry)
+            if self.checkpoint is None:
+                return
+            if self.checkpoint_file is None:
+                self.open_checkpoint()
+            self.checkpoint_file.write(json.dumps(entry) + '\n')
+            self.checkpoint_file.flush()
+
+    def open_checkpoint(self):
+        needs_newline = False
+        if os.path.exists(self.checkpoint) and \
+                os.path.getsize(self.checkpoint) > 0:
+            with open(self.checkpoint, 'rb') as checkpoint_file:
+                checkpoint_file.seek(-1, os.SEEK_END)
+                needs_newline = checkpoint_file.read(1) != b'\n'
+        self.checkpoint_file = open(self.checkpoint, 'a')
+        if needs_newline:
+            self.checkpoint_file.write('\n')
+
+    def close_checkpoint(self):
+        with self.lock:
+            if self.checkpoint_file is not None:
+                self.checkpoint_file.close()
+                self.checkpoint_file = None
+
+    def get_item_state(self, index):
+        """Return ``dict`` of stock ID, SKU and completed steps for a row."""
+        key = str(index)
+        with self.lock:
+            if key in self.state['items']:
+                return self.state['items'][key]
+        # Drawing from the pool may wait on a refill request so is done
+        # without holding the lock. Each row is processed by one thread.
+        sku = self.rows[index].get('sku')
+        if sku is None:
+            sku = self.api_session.sku_pool.get()
+        self.record({'item': key, 'stock_id': str(uuid.uuid4()), 'sku': sku})
+        return self.state['items'][key]
+
+    def complete_step(self, item_state, step):
+        self.record({'item': item_state['key'], 'step': step})
+
+    def retry(self, function, *args):
+        attempt = 0
+        while True:
+            try:
+                return function(*args)
+            except Exception:
+                if attempt >= self.retries:
+                    raise
+                time.sleep(self.retry_delay * 2 ** attempt)
+                attempt += 1
+
+    def create_item(self, row, item_state):
+        if 'item_sent' in item_state['steps']:
+            stock_ids = self.api_session.sku_lookup.fetch(
+                [item_state['sku']])
+            if stock_ids.get(item_state['sku']) == item_state['stock_id']:
+                return
+        else:
+            self.complete_step(item_state, 'item_sent')
+        kwargs = {
+            field: row[field] for field in self.item_fields if field in row}
+        api_requests.AddInventoryItem(
+            self.api_session, item_state['stock_id'], item_state['sku'],
+            row['title'], **kwargs)
+
+    def create_extended_properties(self, row, item_state):
+        properties = row.get('extended_properties', {})
+        if len(properties) == 0:
+            return
+        extended_properties = []
+        for name, value in properties.items():
+            extended_properties.append({
+                'pkRowId': str(uuid.uuid4()),
+                'fkStockItemId': item_state['stock_id'],
+                'ProperyName': name,
+                'PropertyValue': value,
+                'PropertyType': 'Attribute'})
+        api_requests.CreateInventoryItemExtendedProperties(
+            self.api_session, extended_properties)
+
+    def upload_images(self, row, item_state):
+        image_ids = []
+        for filepath in row.get('images', []):
+            upload_request = api_requests.UploadFile(
+                self.api_session, filepath, file_type='Image', expire_in=24)
+            image_ids.append(upload_request.response_dict[0]['FileId'])
+        if len(image_ids) > 0:
+            api_requests.UploadImagesToInventoryItem(
+                self.api_session, item_state['stock_id'], image_ids)
+
+    def process_row(self, index):
+        row = self.rows[index]
+        steps = (
+            ('item', self.create_item),
+            ('extended_properties', self.create_extended_properties),
+            ('images', self.upload_images))
+        step = 'sku'
+        try:
+            item_state = self.get_item_state(index)
+            for step, function in steps:
+                if step not in item_state['steps']:
+                    self.retry(function, row, item_state)
+                    self.complete_step(item_state, step)
+        except Exception as e:
+            self.failed[index] = '{} failed: {}'.format(step, e)
+
+    def create_variation_groups(self):
+        groups = {}
+        for index, row in enumerate(self.rows):
+            parent_sku = row.get('variation_group')
+            if parent_sku is None:
+                continue
+            if parent_sku not in groups:
+                groups[parent_sku] = {
+                    'title': row.get('variation_group_title', row['title']),
+                    'children': [], 'complete': True}
+            item_state = self.state['items'].get(str(index))
+            if index in self.failed or item_state is None:
+                groups[parent_sku]['complete'] = False
+            else:
+                groups[parent_sku]['children'].append(item_state['stock_id'])
+        for parent_sku, group in groups.items():
+            if parent_sku in self.state['variation_groups']:
+                continue
+            if group['complete'] is False:
+                self.failed[parent_sku] = \
+                    'Variation group not created as an item failed.'
+                continue
+            stock_id = str(uuid.uuid4())
+            try:
+                self.retry(
+                    lambda: api_requests.CreateVariationGroup(
+                        self.api_session, sku=parent_sku,
+                        title=group['title'], stock_id=stock_id,
+                        children_ids=group['children']))
+            except Exception as e:
+                self.failed[parent_sku] = \
+                    'Variation group failed: {}'.format(e)
+                continue
+            self.record(
+                {'variation_group': parent_sku, 'stock_id': stock_id})
+
+    def run(self):
+        """Create all items.
+
+        Returns:
+            dict: Stock IDs of created items by SKU.
+        """
+        self.validate()
+        self.load_checkpoint()
+        self.failed = {}
+        try:
+            with ThreadPoolExecutor(
+                    max_workers=self.max_workers) as executor:
+                list(executor.map(
+                    self.api_session.with_priority(
+                        self.priority, self.process_row),
+                    range(len(self.rows))))
+            self.create_variation_groups()
+        finally:
+            self.close_checkpoint()
+        created = {}
+        for key, item_state in self.state['items'].items():
+            if int(key) not in self.failed:
+                created[item_state['sku']] = item_state['stock_id']
+        return created
@@ -90,3 +90,8 @@ class ExtendedProperties():
         self.upload_new()
         self.update_existing()
         self.remove_deleted()
+        response_cache = self.item.api_session.response_cache
+        if response_cache is not None:
+            response_cache.invalidate(
+                [self.item.stock_id],
+                url_extensions=['/api/Inventory/GetExtendedPropertyNames'])
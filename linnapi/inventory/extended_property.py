@@ -10,6 +10,7 @@ class ExtendedProperty():
         self.value = None
         self.name = None
         self.property_id = None
+        self.item_stock_id = None
         if property_type is not None:
             self.property_type = property_type
         if value is not None:
@@ -24,6 +25,7 @@ class ExtendedProperty():
     def get_extended_properties_dict(self):
         ex_prop = {
             'pkRowId': self.property_id,
+            'fkStockItemId': self.item_stock_id,
             'ProperyName': self.name,
             'PropertyValue': self.value,
             'PropertyType': self.property_type
@@ -0,0 +1,174 @@
+"""Updates inventory item fields in bulk """
+
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+from linnapi.functions import is_guid
+
+
+class FieldUpdateReport:
+    """Result of ``InventoryFieldUpdater.update``.
+
+    Attributes:
+        updated -- List of stock IDs for which every change was sent.
+        failed -- ``dict`` of error messages by stock ID.
+    """
+
+    def __init__(self):
+        self.updated = []
+        self.failed = {}
+
+    def __str__(self):
+        return '{} updated, {} failed'.format(
+            len(self.updated), len(self.failed))
+
+
+class InventoryFieldUpdater:
+    """Sends changes to many inventory item fields.
+
+    Changes are sent as one ``UpdateInventoryItemField`` request per field
+    and item. When ``coalesce_threshold`` or more fields change for an
+    item, and ``UpdateInventoryItem`` can set all of them, the item
+    is requested with ``GetInventoryItemByID`` and sent back whole with the
+    changes, which takes two requests however many fields change. The
+    stock level is not sent back, so stock changes made between the two
+    requests are kept. All requests are sent from a pool of
+    ``max_workers`` threads.
+
+    Arguments:
+        api_session -- ``LinnworksAPISession``.
+
+    Keyword arguments:
+        max_workers -- Number of concurrent requests. (Default 8)
+        coalesce_threshold -- Number of changed fields at which an item is
+            updated whole. (Default 3)
+    """
+
+    max_workers = 8
+    coalesce_threshold = 3
+    priority = 'bulk'
+    item_fields = {
+        'SKU': ('ItemNumber', 'sku'),
+        'Title': ('ItemTitle', 'title'),
+        'Barcode': ('BarcodeNumber', 'barcode'),
+        'PurchasePrice': ('PurchasePrice', 'purchase_price'),
+        'RetailPrice': ('RetailPrice', 'retail_price'),
+        'TaxRate': ('TaxRate', 'tax_rate'),
+        'MetaData': ('MetaData', 'meta_data'),
+        'Category': ('CategoryId', 'category_id'),
+        'PackageGroup': ('PackageGroupId', 'package_group_id'),
+        'PostalService': ('PostalServiceId', 'postage_service_id'),
+        'Weight': ('Weight', 'weight'),
+        'Width': ('Width', 'width'),
+        'Depth': ('Depth', 'depth'),
+        'Height': ('Height', 'height'),
+    }
+    unchanged_fields = {
+        'VariationGroupName': 'variation_group_name',
+    }
+
+    def __init__(self, api_session, max_workers=None,
+                 coalesce_threshold=None):
+        self.api_session = api_session
+        if max_workers is not None:
+            self.max_workers = max_workers
+        if coalesce_threshold is not None:
+            self.coalesce_threshold = coalesce_threshold
+
+    def get_changes(self, stock_ids, fields):
+        """Return ``dict`` of changed field values by stock ID."""
+        stock_ids = list(stock_ids)
+        fields = {name: list(values) for name, values in fields.items()}
+        for name, values in fields.items():
+            if len(values) != len(stock_ids):
+                raise ValueError(
+                    'Field {} has {} values for {} stock IDs.'.format(
+                        name, len(values), len(stock_ids)))
+        changes = {}
+        for index, stock_id in enumerate(stock_ids):
+            item_changes = changes.setdefault(stock_id, {})
+            for name, values in fields.items():
+                if values[index] is not None:
+                    item_changes[name] = values[index]
+        return changes
+
+    def can_coalesce(self, item_changes):
+        return len(item_changes) >= self.coalesce_threshold and all(
+            name in self.item_fields for name in item_changes)
+
+    def update_field(self, stock_id, item_changes):
+        (name, value), = item_changes.items()
+        try:
+            api_requests.UpdateInventoryItemField(
+                self.api_session, field_name=name, value=value,
+                stock_id=stock_id)
+        except Exception as e:
+            return '{}: {}'.format(name, e)
+        return None
+
+    def update_item(self, stock_id, item_changes):
+        item = api_requests.GetInventoryItemByID(
+            self.api_session, stock_id, cacheable=False).response_dict
+        kwargs = {}
+        for key, argument in self.item_fields.values():
+            kwargs[argument] = item.get(key)
+        for key, argument in self.unchanged_fields.items():
+            kwargs[argument] = item.get(key)
+        for name, value in item_changes.items():
+            kwargs[self.item_fields[name][1]] = value
+        api_requests.UpdateInventoryItem(
+            self.api_session, stock_id, kwargs.pop('sku'),
+            kwargs.pop('title'), **kwargs)
+        return None
+
+    def send(self, change):
+        stock_id, item_changes, coalesce = change
+        try:
+            if coalesce:
+                return self.update_item(stock_id, item_changes)
+            return self.update_field(stock_id, item_changes)
+        except Exception as e:
+            return str(e)
+
+    def update(self, stock_ids, fields):
+        """Send field changes.
+
+        Arguments:
+            stock_ids -- List of stock IDs.
+            fields -- ``dict`` by field name of lists of new values, one for
+                each stock ID. Values that are None are not changed.
+
+        Example:
+            updater.update(
+                [stock_id_1, stock_id_2],
+                {'Title': ['New Title', None], 'RetailPrice': [4.99, 5.99]})
+
+        Returns:
+            ``FieldUpdateReport``.
+        """
+        report = FieldUpdateReport()
+        changes = []
+        for stock_id, item_changes in self.get_changes(
+                stock_ids, fields).items():
+            if not isinstance(stock_id, str) or not is_guid(stock_id):
+                report.failed[stock_id] = 'Stock ID must be valid GUID.'
+            elif self.can_coalesce(item_changes):
+                changes.append((stock_id, item_changes, True))
+            else:
+                changes.extend(
+                    (stock_id, {name: value}, False)
+                    for name, value in item_changes.items())
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            errors = list(executor.map(
+                self.api_session.with_priority(self.priority, self.send),
+                changes))
+        for (stock_id, item_changes, coalesce), error in zip(
+                changes, errors):
+            if error is not None:
+                report.failed[stock_id] = '\n'.join(
+                    filter(None, (report.failed.get(stock_id), error)))
+        for stock_id, item_changes, coalesce in changes:
+            if stock_id not in report.failed and \
+                    stock_id not in report.updated:
+                report.updated.append(stock_id)
+        return report
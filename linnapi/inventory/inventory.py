@@ -3,6 +3,7 @@ from . single_inventory_item import SingleInventoryItem
 from . variation_group import VariationGroup
 from . variation_inventory_item import VariationInventoryItem
 from . inventory_items import InventoryItems
+from . inventory_query import InventoryQuery
 
 
 class Inventory():
@@ -144,18 +145,27 @@ class Inventory():
             self.titles.append(item.title)
             self.title_lookup[item.title] = item_index
 
-    def load(self):
+    def load(self, columns=('SKU', 'Title'), stream=False, page_size=None):
+        """Load every inventory item.
+
+        Keyword arguments:
+            columns -- Names of the inventory columns to request.
+                (Default ('SKU', 'Title'))
+            stream -- If True items are read from each response one at a
+                time instead of decoding whole pages. (Default False)
+            page_size -- Number of items requested at once.
+                (Default ``InventoryQuery.page_size``)
+        """
         locations = []
         for location in self.locations:
             locations.append(location.guid)
-        view = api_requests.InventoryView()
-        columns_request = api_requests.GetInventoryColumnTypes(
-            self.api_session)
-        view.columns = columns_request.columns
-        self.request = api_requests.GetInventoryItems(
-            self.api_session, start=0, count=9999999, view=view,
-            locations=locations)
-        for item_data in self.request.response_dict['Items']:
+        query = InventoryQuery(self.api_session, page_size=page_size)
+        query.select(*columns).locations(*locations)
+        if stream is True:
+            items = query.stream()
+        else:
+            items = query
+        for item_data in items:
             self.add_single_item(item_data)
         self.update()
 
@@ -129,9 +129,9 @@ class InventoryItem:
         return api_requests.UploadImagesToInventoryItem(
             self.api_session, self.stock_id, [image_guid])
 
-    def get_item_data(self):
+    def get_item_data(self, cacheable=None):
         get_item_request = api_requests.GetInventoryItemByID(
-            self.api_session, self.stock_id)
+            self.api_session, self.stock_id, cacheable=cacheable)
         item_data = get_item_request.response_dict
         return item_data
 
@@ -140,7 +140,7 @@ class InventoryItem:
         return item_data[prop]
 
     def set_prop(self, prop, value):
-        item_data = self.get_item_data()
+        item_data = self.get_item_data(cacheable=False)
         item_data[prop] = value
         self.update_item(item_data)
 
@@ -196,9 +196,15 @@ class InventoryItem:
         return self.get_prop('TaxRate')
 
     def get_stock_levels(self):
-        request = api_requests.GetStockLevel(self.api_session, self.stock_id)
+        """Return ``dict`` of stock levels by location ID.
+
+        Requests from different threads at the same time, or within
+        ``api_session.stock_level_loader.prefetch``, are sent as one
+        ``GetStockLevelBatch`` request.
+        """
         stock_levels = {}
-        for location in request.response_dict:
+        for location in self.api_session.stock_level_loader.load(
+                self.stock_id):
             stock_levels[location['Location']['StockLocationId']] = {
                 'available': location['Available'],
                 'stock_level': location['StockLevel'],
@@ -212,7 +218,7 @@ class InventoryItem:
         if location_id is None:
             location_id = self.api_session.locations['Default'].guid
         stock_levels = self.get_stock_levels()
-        return stock_levels[location_id]["Available"]
+        return stock_levels[location_id]['available']
 
     def set_sku(self, sku):
         return self.set_prop('ItemNumber', str(sku))
@@ -1,9 +1,12 @@
 class InventoryItemImages:
 
-    def __init__(self, api_session, inventory_item, images=[]):
+    def __init__(self, api_session, inventory_item, images=None):
         self.api_session = api_session
         self.inventory_item = inventory_item
-        self.images = images
+        if images is not None:
+            self.images = images
+        else:
+            self.images = []
         self.update()
 
     def __getitem__(self, key):
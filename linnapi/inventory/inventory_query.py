@@ -0,0 +1,182 @@
+"""Builds inventory views that request only the columns that are needed """
+
+import copy
+
+import linnapi.api_requests as api_requests
+
+
+def get_column_types(api_session):
+    """Return ``dict`` of ``InventoryViewColumn``s by column name.
+
+    The columns are requested with ``GetInventoryColumnTypes`` once per
+    session and kept in ``api_session.inventory_column_types``.
+    """
+    if api_session.inventory_column_types is None:
+        request = api_requests.GetInventoryColumnTypes(api_session)
+        api_session.inventory_column_types = {
+            column.column_name: column for column in request.columns}
+    return api_session.inventory_column_types
+
+
+class InventoryQuery:
+    """Fluent builder for ``GetInventoryItems`` requests.
+
+    Only the columns passed to ``select`` are requested. The standard
+    columns (SKU, Title, RetailPrice, PurchasePrice, Available and
+    StockLevel) are described locally, other columns are taken from
+    ``get_column_types`` so their metadata is only requested once per
+    session. The view ``JSON`` is compiled once and reused until the query
+    is changed.
+
+    Example:
+        query = InventoryQuery(api_session).select('SKU', 'Available')
+        for item in query.where('Available', 0, condition='Greater'):
+            print(item['SKU'], item['Available'])
+
+    Arguments:
+        api_session -- ``LinnworksAPISession``.
+
+    Keyword arguments:
+        page_size -- Number of items requested per page. (Default 5000)
+    """
+
+    page_size = 5000
+
+    def __init__(self, api_session, page_size=None):
+        self.api_session = api_session
+        if page_size is not None:
+            self.page_size = page_size
+        self.column_names = []
+        self.filters = []
+        self.location_ids = None
+        self.view_json = None
+
+    def copy(self):
+        """Return a copy of the query that can be changed separately."""
+        query = copy.copy(self)
+        query.column_names = list(self.column_names)
+        query.filters = list(self.filters)
+        return query
+
+    def changed(self):
+        self.view_json = None
+        return self
+
+    def select(self, *column_names):
+        """Add columns to the view. Item IDs are always returned."""
+        for column_name in column_names:
+            if column_name not in self.column_names:
+                self.column_names.append(column_name)
+        return self.changed()
+
+    def where(self, column_name, value, condition='Equals', field=None,
+              filter_type=None):
+        """Add a filter. Filters are combined with ``And`` by default.
+
+        Arguments:
+            column_name -- Name of the column to filter on.
+            value -- Value to compare the column to.
+
+        Keyword arguments:
+            condition -- Comparison to make, such as 'Equals', 'Contains' or
+                'Greater'. (Default 'Equals')
+            field -- Data type of the column. Taken from the column type if
+                not passed.
+            filter_type -- 'And' or 'Or'. (Default None)
+        """
+        if field is None:
+            field = self.get_column(column_name).field
+        self.filters.append(api_requests.InventoryViewFilter(
+            field=field, value=value, condition=condition,
+            filter_name=column_name, filter_name_exact='',
+            filter_type=filter_type))
+        return self.changed()
+
+    def where_any(self, column_name, values, condition='Equals', field=None):
+        """Add a filter matching items where the column matches any value."""
+        for value in values:
+            self.where(
+                column_name, value, condition=condition, field=field,
+                filter_type='Or')
+        return self
+
+    def locations(self, *location_ids):
+        """Limit stock columns to the given location IDs."""
+        self.location_ids = list(location_ids)
+        return self
+
+    def get_column(self, column_name):
+        for column in api_requests.GetInventoryViews.standard_columns:
+            if column.column_name == column_name:
+                return column
+        column_types = get_column_types(self.api_session)
+        if column_name not in column_types:
+            raise ValueError('Unknown inventory column ' + str(column_name))
+        return column_types[column_name]
+
+    def get_view(self):
+        """Return ``InventoryView`` for the query."""
+        view = api_requests.InventoryView()
+        view.columns = [
+            self.get_column(column_name) for column_name in self.column_names]
+        view.filters = list(self.filters)
+        return view
+
+    def to_json(self):
+        """Return the view ``JSON``, compiled once until the query changes."""
+        if self.view_json is None:
+            self.view_json = self.get_view().to_json()
+        return self.view_json
+
+    def get_location_ids(self):
+        if self.location_ids is None:
+            return self.api_session.locations.ids
+        return self.location_ids
+
+    def request(self, start=0, count=None, stream=False):
+        """Return ``GetInventoryItems`` request for one page of items."""
+        if count is None:
+            count = self.page_size
+        return api_requests.GetInventoryItems(
+            self.api_session, start=start, count=count,
+            view_json=self.to_json(), locations=self.get_location_ids(),
+            stream=stream)
+
+    def fetch(self, start=0, count=None):
+        """Return list of item ``dict``s for one page of items."""
+        return self.request(start=start, count=count).response_dict['Items']
+
+    def count(self):
+        """Return the number of items matching the filters."""
+        return self.request(count=1).response_dict['TotalItems']
+
+    def __iter__(self):
+        start = 0
+        while True:
+            items = self.fetch(start=start)
+            for item in items:
+                yield item
+            if len(items) < self.page_size:
+                break
+            start += self.page_size
+
+    def stream(self):
+        """Yield every matching item, reading each page one item at a time.
+
+        Pages are streamed rather than decoded whole, so ``page_size`` can
+        cover the whole inventory without holding the response in memory.
+        """
+        start = 0
+        while True:
+            request = self.request(start=start, stream=True)
+            item_count = 0
+            for item in request.iter_response():
+                item_count += 1
+                yield item
+            if item_count < self.page_size:
+                break
+            start += self.page_size
+
+    def all(self):
+        """Return list of every matching item ``dict``."""
+        return list(self)
@@ -0,0 +1,35 @@
+"""Batch loaders for per item inventory reads """
+
+import linnapi.api_requests as api_requests
+from linnapi.batch_loader import BatchLoader
+from linnapi.functions import is_guid
+
+
+class StockLevelLoader(BatchLoader):
+    """Loads stock levels for many items with ``GetStockLevelBatch``.
+
+    Values are lists of stock level ``dict``s, one for each location, as
+    returned by ``GetStockLevel``. Items that are not found have an empty
+    list. Stock IDs that are not valid GUIDs are not sent, so ``load``
+    raises ``KeyError`` for them without failing the rest of the batch.
+
+    Arguments:
+        api_session -- ``LinnworksAPISession``.
+    """
+
+    def __init__(self, api_session, **kwargs):
+        self.api_session = api_session
+        super().__init__(**kwargs)
+
+    def load_batch(self, stock_ids):
+        stock_ids = [
+            stock_id for stock_id in stock_ids
+            if isinstance(stock_id, str) and is_guid(stock_id)]
+        if not stock_ids:
+            return {}
+        stock_levels = api_requests.GetStockLevelBatch(
+            self.api_session, stock_ids).stock_levels
+        return {
+            stock_id: stock_levels.get(stock_id, [])
+            for stock_id in stock_ids}
+
@@ -0,0 +1,177 @@
+"""Local lookup of stock IDs by product SKU """
+
+import threading
+
+import linnapi.api_requests as api_requests
+
+
+class SKULookup:
+    """Keeps a map of product SKU to stock ID for an API session.
+
+    The map can be filled in one go with ``load`` (a paged walk of the
+    inventory) or ``load_from_export``. SKUs that are not in the map are
+    requested in batches, with the SKUs in each batch combined in ``Or``
+    filters on a single inventory view.
+    """
+
+    page_size = 5000
+    filter_batch_size = 50
+    load_threshold = 1000
+
+    def __init__(self, api_session):
+        self.api_session = api_session
+        self.stock_ids = {}
+        self.skus = {}
+        self.loaded = False
+        self.lock = threading.RLock()
+
+    def __contains__(self, sku):
+        return sku in self.stock_ids
+
+    def __getitem__(self, sku):
+        return self.stock_ids[sku]
+
+    def __len__(self):
+        return len(self.stock_ids)
+
+    def clear(self):
+        with self.lock:
+            self.stock_ids = {}
+            self.skus = {}
+            self.loaded = False
+
+    def add(self, sku, stock_id):
+        """Store stock_id for sku, replacing any previous SKU for the item."""
+        with self.lock:
+            old_sku = self.skus.get(stock_id)
+            if old_sku is not None and old_sku != sku:
+                self.stock_ids.pop(old_sku, None)
+            old_stock_id = self.stock_ids.get(sku)
+            if old_stock_id is not None and old_stock_id != stock_id:
+                self.skus.pop(old_stock_id, None)
+            self.stock_ids[sku] = stock_id
+            self.skus[stock_id] = sku
+
+    def remove(self, sku):
+        """Remove sku from the map."""
+        with self.lock:
+            stock_id = self.stock_ids.pop(sku, None)
+            if stock_id is not None:
+                self.skus.pop(stock_id, None)
+
+    def rename(self, old_sku, new_sku):
+        """Move the stock ID for old_sku to new_sku."""
+        with self.lock:
+            stock_id = self.stock_ids.get(old_sku)
+            if stock_id is None:
+                return
+            self.add(new_sku, stock_id)
+
+    def get_view(self, filters=None):
+        view = api_requests.InventoryView()
+        view.columns = [api_requests.InventoryViewColumn(
+            column_name='SKU', display_name='SKU')]
+        if filters is not None:
+            view.filters = filters
+        return view
+
+    def load(self):
+        """Fill the map from a paged walk of the whole inventory."""
+        view = self.get_view()
+        stock_ids = {}
+        start = 0
+        while True:
+            request = api_requests.GetInventoryItems(
+                self.api_session, start=start, count=self.page_size,
+                view=view)
+            items = request.response_dict['Items']
+            for item in items:
+                stock_ids[item['SKU']] = item['Id']
+            if len(items) < self.page_size:
+                break
+            start += self.page_size
+        self.set_stock_ids(stock_ids)
+
+    def load_from_export(self, rows, sku_column='SKU',
+                         stock_id_column='StockItemId'):
+        """Fill the map from rows of an export.
+
+        Arguments:
+            rows -- Iterable of ``dict`` like rows, such as an
+                ``lstools.Table`` returned by ``functions.get_export``.
+
+        Keyword arguments:
+            sku_column -- Name of SKU column. (Default 'SKU')
+            stock_id_column -- Name of stock ID column.
+                (Default 'StockItemId')
+        """
+        stock_ids = {}
+        for row in rows:
+            stock_ids[row[sku_column]] = row[stock_id_column]
+        self.set_stock_ids(stock_ids)
+
+    def set_stock_ids(self, stock_ids):
+        with self.lock:
+            self.stock_ids = stock_ids
+            self.skus = {
+                stock_id: sku for sku, stock_id in stock_ids.items()}
+            self.loaded = True
+
+    def fetch(self, skus):
+        """Request stock IDs for skus and add them to the map.
+
+        Returns:
+            dict: Stock IDs found by SKU.
+        """
+        skus = list(skus)
+        found = {}
+        for i in range(0, len(skus), self.filter_batch_size):
+            batch = skus[i:i + self.filter_batch_size]
+            batch_skus = set(batch)
+            filters = [api_requests.InventoryViewFilter(
+                field='String', value=sku, condition='Equals',
+                filter_name='SKU', filter_name_exact='', filter_type='Or')
+                for sku in batch]
+            request = api_requests.GetInventoryItems(
+                self.api_session, start=0, count=len(batch),
+                view=self.get_view(filters))
+            for item in request.response_dict['Items']:
+                if item['SKU'] in batch_skus:
+                    found[item['SKU']] = item['Id']
+        for sku, stock_id in found.items():
+            self.add(sku, stock_id)
+        return found
+
+    def get_stock_ids(self, skus):
+        """Return ``dict`` of stock IDs by SKU for skus.
+
+        SKUs that are not in the map are requested. If more than
+        ``load_threshold`` SKUs are missing and the map has not been loaded
+        the whole inventory is loaded instead. SKUs that do not exist are
+        left out of the returned ``dict``.
+        """
+        skus = list(dict.fromkeys(skus))
+        missing = [sku for sku in skus if sku not in self.stock_ids]
+        if len(missing) > self.load_threshold and not self.loaded:
+            self.load()
+            missing = [sku for sku in missing if sku not in self.stock_ids]
+        if len(missing) > 0:
+            self.fetch(missing)
+        stock_ids = self.stock_ids
+        return {sku: stock_ids[sku] for sku in skus if sku in stock_ids}
+
+    def get_skus(self, stock_ids):
+        """Return ``dict`` of SKUs by stock ID for stock_ids.
+
+        If any stock ID is not in the map and the map has not been loaded
+        the whole inventory is loaded. Stock IDs that are still not found
+        are left out of the returned ``dict``.
+        """
+        stock_ids = list(dict.fromkeys(stock_ids))
+        if not self.loaded and any(
+                stock_id not in self.skus for stock_id in stock_ids):
+            self.load()
+        skus = self.skus
+        return {
+            stock_id: skus[stock_id] for stock_id in stock_ids
+            if stock_id in skus}
@@ -0,0 +1,106 @@
+"""Pool of reserved unused product SKUs """
+
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+
+
+class SKUPool:
+    """Thread safe pool of new product SKUs.
+
+    SKUs are requested from ``GetNewSKU`` in blocks of ``block_size``
+    concurrent requests. Each block is checked for duplicates and, in one
+    bulk lookup, for SKUs already in use before it is added to the pool.
+    When ``low_water_mark`` or fewer SKUs remain a background thread
+    requests another block.
+
+    Arguments:
+        api_session -- ``LinnworksAPISession``.
+
+    Keyword arguments:
+        block_size -- Number of SKUs requested per refill. (Default 20)
+        low_water_mark -- Number of SKUs remaining that starts a refill.
+            (Default 5)
+        max_workers -- Number of concurrent ``GetNewSKU`` requests.
+            (Default 8)
+    """
+
+    block_size = 20
+    low_water_mark = 5
+    max_workers = 8
+
+    def __init__(self, api_session, block_size=None, low_water_mark=None,
+                 max_workers=None):
+        self.api_session = api_session
+        if block_size is not None:
+            self.block_size = block_size
+        if low_water_mark is not None:
+            self.low_water_mark = low_water_mark
+        if max_workers is not None:
+            self.max_workers = max_workers
+        self.skus = collections.deque()
+        self.issued = set()
+        self.refilling = False
+        self.error = None
+        self.condition = threading.Condition()
+
+    def __len__(self):
+        return len(self.skus)
+
+    def get(self):
+        """Return an unused SKU, waiting for a refill if the pool is empty."""
+        with self.condition:
+            while len(self.skus) == 0:
+                if self.error is not None:
+                    error = self.error
+                    self.error = None
+                    raise error
+                self.start_refill()
+                self.condition.wait()
+            sku = self.skus.popleft()
+            self.issued.add(sku)
+            if len(self.skus) <= self.low_water_mark:
+                self.start_refill()
+            return sku
+
+    def get_many(self, count):
+        """Return list of count unused SKUs."""
+        return [self.get() for i in range(count)]
+
+    def start_refill(self):
+        if self.refilling is True:
+            return
+        self.refilling = True
+        thread = threading.Thread(target=self.refill, daemon=True)
+        thread.start()
+
+    def request_skus(self, count):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(
+                lambda i: api_requests.GetNewSKU(self.api_session).sku,
+                range(count)))
+
+    def refill(self):
+        try:
+            with self.condition:
+                exclude = self.issued | set(self.skus)
+            skus = [
+                sku for sku in dict.fromkeys(
+                    self.request_skus(self.block_size))
+                if sku not in exclude]
+            used = self.api_session.sku_lookup.get_stock_ids(skus)
+            skus = [sku for sku in skus if sku not in used]
+            if len(skus) == 0:
+                raise ValueError('No unused SKUs were returned.')
+        except Exception as e:
+            with self.condition:
+                self.error = e
+                self.refilling = False
+                self.condition.notify_all()
+            return
+        with self.condition:
+            self.skus.extend(skus)
+            self.refilling = False
+            self.condition.notify_all()
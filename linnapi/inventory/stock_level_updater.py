@@ -0,0 +1,187 @@
+"""Sends stock level changes in bulk """
+
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+from linnapi.functions import is_guid
+from . stock_snapshot import StockLevel
+
+
+class StockUpdateReport:
+    """Result of ``StockLevelUpdater.update``.
+
+    Attributes:
+        updated -- List of indexes of rows that were sent.
+        unchanged -- List of indexes of rows that matched the snapshot or
+            were replaced by a later row for the same item and location.
+        failed -- ``dict`` of error messages by row index.
+    """
+
+    def __init__(self):
+        self.updated = []
+        self.unchanged = []
+        self.failed = {}
+
+    def __str__(self):
+        return '{} updated, {} unchanged, {} failed'.format(
+            len(self.updated), len(self.unchanged), len(self.failed))
+
+
+class StockLevelUpdater:
+    """Sets stock levels for many items, sending only real changes.
+
+    Each row passed to ``update`` is a (SKU or stock ID, location, level)
+    tuple. Rows whose level already matches ``snapshot`` are not sent. The
+    rest are sent with ``SetStockLevel`` in batches of ``batch_size`` rows
+    from a pool of ``max_workers`` threads, and the snapshot is updated
+    with the levels that were set. The rows of a batch that fails are sent
+    again one at a time to find the rows that failed.
+
+    Arguments:
+        api_session -- ``LinnworksAPISession``.
+
+    Keyword arguments:
+        snapshot -- ``StockSnapshot`` of current levels. Rows are not
+            compared if None. (Default None)
+        batch_size -- Number of rows per request. (Default 100)
+        max_workers -- Number of concurrent requests. (Default 8)
+        change_source -- Description of the change recorded in the stock
+            item history. (Default None)
+    """
+
+    batch_size = 100
+    max_workers = 8
+    priority = 'bulk'
+
+    def __init__(self, api_session, snapshot=None, batch_size=None,
+                 max_workers=None, change_source=None):
+        self.api_session = api_session
+        self.snapshot = snapshot
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if max_workers is not None:
+            self.max_workers = max_workers
+        self.change_source = change_source
+
+    def get_location_id(self, location):
+        if location is None:
+            location = 'Default'
+        return self.api_session.locations[location].guid
+
+    def resolve(self, rows, report):
+        """Return ``dict`` of (SKU, stock ID, location ID, level) by index.
+
+        Rows that can not be resolved are added to ``report.failed``.
+        """
+        sku_lookup = self.api_session.sku_lookup
+        keys = [row[0] for row in rows]
+        stock_ids = sku_lookup.get_stock_ids(
+            [key for key in keys if not is_guid(key)])
+        skus = sku_lookup.get_skus([key for key in keys if is_guid(key)])
+        resolved = {}
+        for index, (key, location, level) in enumerate(rows):
+            if is_guid(key):
+                stock_id, sku = key, skus.get(key)
+            else:
+                stock_id, sku = stock_ids.get(key), key
+            if sku is None or stock_id is None:
+                report.failed[index] = 'Item {} not found.'.format(key)
+                continue
+            try:
+                location_id = self.get_location_id(location)
+                level = int(level)
+            except (KeyError, TypeError, ValueError) as e:
+                report.failed[index] = str(e)
+                continue
+            if not is_guid(location_id):
+                report.failed[index] = 'Location {} not found.'.format(
+                    location)
+                continue
+            resolved[index] = (sku, stock_id, location_id, level)
+        return resolved
+
+    def is_unchanged(self, stock_id, location_id, level):
+        if self.snapshot is None:
+            return False
+        current = self.snapshot.get(stock_id, location_id)
+        return current is not None and current.stock_level == level
+
+    def send_rows(self, rows):
+        try:
+            api_requests.SetStockLevel(
+                self.api_session,
+                [(sku, location_id, level)
+                 for index, (sku, stock_id, location_id, level) in rows],
+                change_source=self.change_source)
+        except Exception as e:
+            return str(e)
+        return None
+
+    def send_batch(self, batch):
+        """Send a batch and return a list of errors, one per row.
+
+        If the batch fails each row is sent on its own so one bad row does
+        not fail the rest of the batch.
+        """
+        error = self.send_rows(batch)
+        if error is None:
+            return [None] * len(batch)
+        if len(batch) == 1:
+            return [error]
+        return [self.send_rows([row]) for row in batch]
+
+    def update_snapshot(self, stock_id, location_id, level):
+        current = self.snapshot.get(stock_id, location_id)
+        if current is None:
+            current = StockLevel(level, level, 0, 0)
+        self.snapshot.set(stock_id, location_id, current._replace(
+            available=level - current.in_orders, stock_level=level))
+
+    def update(self, rows):
+        """Set stock levels.
+
+        Arguments:
+            rows -- Iterable of (SKU or stock ID, location, level) tuples.
+                Location is a location name or ID, or None for the
+                Default location. If the same item and location appear
+                more than once the last row is used.
+
+        Returns:
+            ``StockUpdateReport``.
+        """
+        rows = list(rows)
+        report = StockUpdateReport()
+        latest = {}
+        for index, row in sorted(self.resolve(rows, report).items()):
+            sku, stock_id, location_id, level = row
+            previous = latest.pop((stock_id, location_id), None)
+            if previous is not None:
+                report.unchanged.append(previous[0])
+            latest[(stock_id, location_id)] = (index, row)
+        changes = []
+        for index, row in latest.values():
+            sku, stock_id, location_id, level = row
+            if self.is_unchanged(stock_id, location_id, level):
+                report.unchanged.append(index)
+            else:
+                changes.append((index, row))
+        batches = [
+            changes[i:i + self.batch_size]
+            for i in range(0, len(changes), self.batch_size)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            errors = list(executor.map(
+                self.api_session.with_priority(
+                    self.priority, self.send_batch),
+                batches))
+        for batch, batch_errors in zip(batches, errors):
+            for (index, row), error in zip(batch, batch_errors):
+                sku, stock_id, location_id, level = row
+                if error is not None:
+                    report.failed[index] = error
+                    continue
+                report.updated.append(index)
+                if self.snapshot is not None:
+                    self.update_snapshot(stock_id, location_id, level)
+        report.updated.sort()
+        report.unchanged.sort()
+        return report
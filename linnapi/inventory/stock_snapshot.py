@@ -0,0 +1,154 @@
+"""Snapshot of stock levels for every item and location """
+
+import array
+import collections
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+
+
+StockLevel = collections.namedtuple(
+    'StockLevel', ['available', 'stock_level', 'in_orders', 'due'])
+
+
+class StockSnapshot:
+    """Table of stock levels by stock ID and location ID.
+
+    ``load`` requests stock levels with ``GetStockLevelBatch`` in batches
+    of ``batch_size`` stock IDs from a pool of ``max_workers`` threads.
+    Levels are stored in one ``array`` per field, with a row for each
+    stock ID and location ID pair, so a snapshot of the whole inventory
+    stays small enough to keep and compare with the next one.
+
+    Arguments:
+        api_session -- ``LinnworksAPISession``.
+
+    Keyword arguments:
+        batch_size -- Number of stock IDs per request. (Default 200)
+        max_workers -- Number of concurrent requests. (Default 8)
+    """
+
+    fields = StockLevel._fields
+    batch_size = 200
+    max_workers = 8
+    priority = 'bulk'
+
+    def __init__(self, api_session, batch_size=None, max_workers=None):
+        self.api_session = api_session
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if max_workers is not None:
+            self.max_workers = max_workers
+        self.clear()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def __getitem__(self, key):
+        """Return ``StockLevel`` for a (stock ID, location ID) tuple."""
+        row = self.rows[key]
+        return StockLevel(*(self.columns[field][row] for field in self.fields))
+
+    def __iter__(self):
+        for key in self.keys:
+            yield key, self[key]
+
+    def clear(self):
+        self.keys = []
+        self.rows = {}
+        self.columns = {field: array.array('q') for field in self.fields}
+        self.created = None
+
+    def get(self, stock_id, location_id=None, default=None):
+        """Return ``StockLevel`` for an item at a location.
+
+        Keyword arguments:
+            location_id -- Defaults to the Default location.
+            default -- Returned if the item is not in the snapshot.
+        """
+        if location_id is None:
+            location_id = self.api_session.locations['Default'].guid
+        key = (stock_id, location_id)
+        if key not in self.rows:
+            return default
+        return self[key]
+
+    def set(self, stock_id, location_id, stock_level):
+        """Store ``StockLevel`` for an item at a location."""
+        key = (stock_id, location_id)
+        row = self.rows.get(key)
+        if row is None:
+            self.rows[key] = len(self.keys)
+            self.keys.append(key)
+            for field, value in zip(self.fields, stock_level):
+                self.columns[field].append(int(value))
+        else:
+            for field, value in zip(self.fields, stock_level):
+                self.columns[field][row] = int(value)
+
+    def request_batch(self, stock_ids):
+        return api_requests.GetStockLevelBatch(
+            self.api_session, stock_ids).stock_levels
+
+    def load(self, stock_ids=None, location_ids=None):
+        """Request stock levels and replace the contents of the snapshot.
+
+        Keyword arguments:
+            stock_ids -- Stock IDs to request. Defaults to every item in
+                ``api_session.sku_lookup``, which is loaded if needed.
+            location_ids -- Location IDs to keep. Defaults to the IDs of
+                ``api_session.locations``.
+        """
+        if stock_ids is None:
+            if not self.api_session.sku_lookup.loaded:
+                self.api_session.sku_lookup.load()
+            stock_ids = self.api_session.sku_lookup.skus.keys()
+        stock_ids = list(stock_ids)
+        if location_ids is None:
+            location_ids = self.api_session.locations.ids
+        location_ids = set(location_ids)
+        batches = [
+            stock_ids[i:i + self.batch_size]
+            for i in range(0, len(stock_ids), self.batch_size)]
+        self.clear()
+        self.created = datetime.datetime.now()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            request_batch = self.api_session.with_priority(
+                self.priority, self.request_batch)
+            for stock_levels in executor.map(request_batch, batches):
+                for stock_id, levels in stock_levels.items():
+                    for level in levels:
+                        location_id = level['Location']['StockLocationId']
+                        if location_id not in location_ids:
+                            continue
+                        self.set(stock_id, location_id, StockLevel(
+                            level['Available'], level['StockLevel'],
+                            level['InOrders'], level['Due']))
+        return self
+
+    def diff(self, previous):
+        """Return changes since a previous snapshot.
+
+        Returns:
+            dict: Tuples of the previous and current ``StockLevel`` by
+                (stock ID, location ID). Either is None if the row is
+                missing from that snapshot.
+        """
+        changes = {}
+        for key, row in self.rows.items():
+            previous_row = previous.rows.get(key)
+            if previous_row is not None and all(
+                    self.columns[field][row] ==
+                    previous.columns[field][previous_row]
+                    for field in self.fields):
+                continue
+            old = None if previous_row is None else previous[key]
+            changes[key] = (old, self[key])
+        for key in previous.rows:
+            if key not in self.rows:
+                changes[key] = (previous[key], None)
+        return changes
@@ -3,12 +3,15 @@ from . variation_inventory_item import VariationInventoryItem
 
 
 class VariationGroup():
-    def __init__(self, api_session, stock_id, sku, title, children=[]):
+    def __init__(self, api_session, stock_id, sku, title, children=None):
         self.api_session = api_session
         self.stock_id = stock_id
         self.sku = sku
         self.title = title
-        self.children = children
+        if children is not None:
+            self.children = children
+        else:
+            self.children = []
 
     def get_children(self):
         request = api_requests.GetVariationItems(
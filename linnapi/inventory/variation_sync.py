@@ -0,0 +1,210 @@
+"""Brings variation groups in line with a mapping of parent to child SKUs """
+
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+
+
+class VariationSyncReport:
+    """Result of ``VariationSync.run``.
+
+    Attributes:
+        created -- ``dict`` of new parent stock IDs by parent SKU.
+        added -- ``dict`` of lists of child SKUs added by parent SKU.
+        removed -- ``dict`` of lists of child SKUs removed by parent SKU.
+            Children whose SKU is not in ``api_session.sku_lookup`` are
+            listed by stock ID.
+        failed -- ``dict`` of error messages by parent SKU.
+    """
+
+    def __init__(self):
+        self.created = {}
+        self.added = {}
+        self.removed = {}
+        self.failed = {}
+
+    def __str__(self):
+        return '{} created, {} added to, {} removed from, {} failed'.format(
+            len(self.created), len(self.added), len(self.removed),
+            len(self.failed))
+
+
+class VariationSync:
+    """Updates variation groups to match a mapping of parent to child SKUs.
+
+    The current groups named in ``groups`` are found with concurrent
+    ``SearchVariationGroups`` requests and their children with concurrent
+    ``GetVariationItems`` requests. All child SKUs are resolved to stock IDs
+    in one bulk lookup. Only the changes needed are then sent: children are
+    removed first, so they can move to another group, followed by new groups
+    and additions to existing ones.
+
+    Groups that are not named in ``groups`` are not inspected, so a child
+    can only be moved out of a group that is also in the mapping.
+
+    Arguments:
+        api_session -- ``LinnworksAPISession``.
+        groups -- ``dict`` of lists of child SKUs by parent SKU.
+
+    Keyword arguments:
+        titles -- ``dict`` of titles for new groups by parent SKU. New groups
+            without a title use their parent SKU. (Default None)
+        remove_unlisted -- If True children not listed for a group are
+            removed from it. (Default True)
+        max_workers -- Maximum number of concurrent requests. (Default 8)
+    """
+
+    priority = 'bulk'
+
+    def __init__(self, api_session, groups, titles=None,
+                 remove_unlisted=True, max_workers=8):
+        self.api_session = api_session
+        self.groups = {
+            parent_sku: list(dict.fromkeys(children))
+            for parent_sku, children in groups.items()}
+        self.titles = titles or {}
+        self.remove_unlisted = remove_unlisted
+        self.max_workers = max_workers
+        self.current_groups = {}
+
+    def map(self, function, items):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(
+                self.api_session.with_priority(self.priority, function),
+                items))
+
+    def find_group(self, parent_sku):
+        request = api_requests.SearchVariationGroups(
+            self.api_session, 'ParentSKU', search_text=parent_sku)
+        for group in request.variation_groups:
+            if group['sku'] == parent_sku:
+                return group['parent_stock_id']
+        return None
+
+    def get_children(self, parent_stock_id):
+        request = api_requests.GetVariationItems(
+            self.api_session, parent_stock_id)
+        return request.variation_children
+
+    def load_current_groups(self):
+        """Fill ``current_groups`` with the groups named in ``groups``.
+
+        ``current_groups`` is a ``dict`` by parent SKU of ``dict``s with the
+        group's ``stock_id`` and list of ``children`` stock IDs.
+        """
+        parent_skus = list(self.groups)
+        parent_ids = self.map(self.find_group, parent_skus)
+        found = [
+            (parent_sku, parent_id) for parent_sku, parent_id
+            in zip(parent_skus, parent_ids) if parent_id is not None]
+        children = self.map(
+            lambda group: self.get_children(group[1]), found)
+        self.current_groups = {
+            parent_sku: {'stock_id': parent_id, 'children': group_children}
+            for (parent_sku, parent_id), group_children
+            in zip(found, children)}
+
+    def plan(self):
+        """Return the changes needed without sending them.
+
+        Returns:
+            tuple: ``dict``s of child stock IDs to remove, to add and for
+                new groups, each by parent SKU.
+
+        Raises:
+            ValueError: If any child SKU does not exist.
+        """
+        self.load_current_groups()
+        child_skus = [
+            sku for children in self.groups.values() for sku in children]
+        stock_ids = self.api_session.sku_lookup.get_stock_ids(child_skus)
+        missing = [sku for sku in child_skus if sku not in stock_ids]
+        if len(missing) > 0:
+            raise ValueError(
+                'SKUs not found: ' + ', '.join(dict.fromkeys(missing)))
+        wanted = {
+            parent_sku: [stock_ids[sku] for sku in children]
+            for parent_sku, children in self.groups.items()}
+        wanted_ids = {
+            stock_id for children in wanted.values() for stock_id in children}
+        to_remove = {}
+        to_add = {}
+        to_create = {}
+        for parent_sku, children in wanted.items():
+            current = self.current_groups.get(parent_sku)
+            if current is None:
+                to_create[parent_sku] = children
+                continue
+            current_ids = set(current['children'])
+            add = [child for child in children if child not in current_ids]
+            if len(add) > 0:
+                to_add[parent_sku] = add
+            children = set(children)
+            remove = [
+                child for child in current['children']
+                if child not in children and (
+                    self.remove_unlisted or child in wanted_ids)]
+            if len(remove) > 0:
+                to_remove[parent_sku] = remove
+        return to_remove, to_add, to_create
+
+    def remove_children(self, parent_sku, children):
+        api_requests.DeleteVariationItems(
+            self.api_session, self.current_groups[parent_sku]['stock_id'],
+            children)
+
+    def add_children(self, parent_sku, children):
+        api_requests.AddVariationItems(
+            self.api_session, self.current_groups[parent_sku]['stock_id'],
+            children)
+
+    def create_group(self, parent_sku, children):
+        request = api_requests.CreateVariationGroup(
+            self.api_session, sku=parent_sku,
+            title=self.titles.get(parent_sku, parent_sku),
+            children_ids=children)
+        return request.stock_id
+
+    def send(self, function, changes):
+        """Call function for each change concurrently.
+
+        Returns:
+            dict: Results of function by parent SKU for changes that did
+                not fail.
+        """
+        def send_change(change):
+            try:
+                return function(*change)
+            except Exception as e:
+                self.report.failed[change[0]] = str(e)
+
+        changes = list(changes.items())
+        results = self.map(send_change, changes)
+        return {
+            parent_sku: result for (parent_sku, children), result
+            in zip(changes, results) if parent_sku not in self.report.failed}
+
+    def get_skus(self, changes):
+        skus = self.api_session.sku_lookup.skus
+        return {
+            parent_sku: [skus.get(child, child) for child in children]
+            for parent_sku, children in changes.items()
+            if parent_sku not in self.report.failed}
+
+    def run(self):
+        """Send the changes returned by ``plan``.
+
+        Returns:
+            ``VariationSyncReport``.
+        """
+        to_remove, to_add, to_create = self.plan()
+        self.report = VariationSyncReport()
+        self.send(self.remove_children, to_remove)
+        self.report.removed = self.get_skus(to_remove)
+        to_add = {
+            parent_sku: children for parent_sku, children in to_add.items()
+            if parent_sku not in self.report.failed}
+        self.send(self.add_children, to_add)
+        self.report.added = self.get_skus(to_add)
+        self.report.created = self.send(self.create_group, to_create)
+        return self.report
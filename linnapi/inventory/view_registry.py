@@ -0,0 +1,88 @@
+"""Per session store of inventory views """
+
+import threading
+
+import linnapi.api_requests as api_requests
+
+
+class InventoryViewRegistry:
+    """Keeps the frozen inventory views for an API session by name.
+
+    Views saved in Linnworks are requested with ``GetInventoryViews`` the
+    first time a view is looked up and kept until ``invalidate`` is
+    called. Local views can be added with ``add``. Every view is stored as
+    a ``FrozenInventoryView`` so it is only serialised once.
+    """
+
+    def __init__(self, api_session):
+        self.api_session = api_session
+        self.views = {}
+        self.local_views = {}
+        self.loaded = False
+        self.lock = threading.Lock()
+
+    def __getitem__(self, name):
+        self.load()
+        if name in self.local_views:
+            return self.local_views[name]
+        return self.views[name]
+
+    def __contains__(self, name):
+        self.load()
+        return name in self.local_views or name in self.views
+
+    def __iter__(self):
+        self.load()
+        for name in self.names():
+            yield self[name]
+
+    def __len__(self):
+        return len(self.names())
+
+    def names(self):
+        """Return list of the names of all views."""
+        self.load()
+        return list(dict.fromkeys(
+            list(self.views) + list(self.local_views)))
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def load(self):
+        """Request the saved views if they have not been loaded."""
+        with self.lock:
+            if self.loaded:
+                return
+            request = api_requests.GetInventoryViews(self.api_session)
+            self.views = {view.name: view.freeze() for view in request}
+            self.loaded = True
+
+    def add(self, view, name=None):
+        """Store a local view and return it frozen.
+
+        Arguments:
+            view -- ``InventoryView`` or ``FrozenInventoryView``.
+
+        Keyword arguments:
+            name -- Name to store the view under. Defaults to the view's
+                name.
+        """
+        if isinstance(view, api_requests.InventoryView):
+            view = view.freeze()
+        if name is None:
+            name = view.name
+        with self.lock:
+            self.local_views[name] = view
+        return view
+
+    def invalidate(self, name=None):
+        """Forget a local view, or the saved views if name is None."""
+        with self.lock:
+            if name is None:
+                self.views = {}
+                self.loaded = False
+            else:
+                self.local_views.pop(name, None)
@@ -0,0 +1,45 @@
+"""Lazy loading of package attributes (PEP 562).
+
+A package calls ``lazy_import`` with a ``dict`` mapping each public name to
+the submodule that defines it. The submodule is only imported when the name
+is first accessed, after which the value is stored in the package globals
+so later lookups do not reach ``__getattr__``.
+"""
+
+import importlib
+
+
+def lazy_import(package_name, package_globals, attributes, submodules=()):
+    """Return ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Arguments:
+        package_name -- ``__name__`` of the package.
+        package_globals -- ``globals()`` of the package.
+        attributes -- ``dict`` of submodule name, relative to the package,
+            by attribute name.
+
+    Keyword arguments:
+        submodules -- Names of submodules that can be accessed as
+            attributes of the package. (Default ())
+    """
+    submodules = set(submodules)
+
+    def __getattr__(name):
+        if name in attributes:
+            module = importlib.import_module(
+                '.' + attributes[name], package_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module('.' + name, package_name)
+        else:
+            raise AttributeError(
+                'module {!r} has no attribute {!r}'.format(
+                    package_name, name))
+        package_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(
+            set(package_globals) | set(attributes) | submodules)
+
+    return __getattr__, __dir__
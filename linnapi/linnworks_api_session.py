@@ -4,32 +4,85 @@
 the linnworks.net API.
 """
 
+import contextlib
+import importlib
 import os
-import requests
 import json
 import uuid
 import re
+import threading
+import time
 from pprint import pprint
 
-from linnapi.settings import Categories
-from linnapi.settings import PackageGroups
-from linnapi.settings import ShippingMethods
-from linnapi.settings import Locations
-from linnapi.settings import PostageServices
-from linnapi.settings import Channels
 from linnapi.exceptions import *
 
 
 class LinnworksAPISession:
     """Main wrapper class for linnworks.net API. Allows authentication with
     API and provides methods for many common API requests.
+
+    A session can be shared between threads. Each thread makes requests
+    with its own ``requests.Session``, all using the connection pool of
+    ``transport``, and the token is renewed once when it expires however
+    many threads are waiting on it.
+
+    Helpers such as ``sku_lookup`` are created when they are first used,
+    and the modules they need are only imported then, so that importing
+    the session stays fast.
     """
 
-    def __init__(self, *kwargs):
+    auth_url = 'https://api.linnworks.net//api/Auth/AuthorizeByApplication'
+    processed_order_store = None
+    inventory_column_types = None
+    response_cache = None
+    coalescer = None
+    scheduler = None
+    circuit_breakers = None
+    helper_classes = {
+        'sku_lookup': ('linnapi.inventory.sku_lookup', 'SKULookup'),
+        'sku_pool': ('linnapi.inventory.sku_pool', 'SKUPool'),
+        'inventory_views': (
+            'linnapi.inventory.view_registry', 'InventoryViewRegistry'),
+        'stock_level_loader': (
+            'linnapi.inventory.item_loaders', 'StockLevelLoader'),
+    }
+
+    def __init__(self, *kwargs, transport=None, response_cache=None,
+                 scheduler=None, circuit_breakers=None):
         """
         Create session with linnworks.net API
+
+        Keyword arguments:
+            transport -- ``TransportProfile`` with connection pooling,
+                compression and timeout settings. (Default None)
+            response_cache -- ``ResponseCache`` for read requests, or None
+                to send every request. (Default None)
+            scheduler -- ``RequestScheduler`` setting priority classes,
+                concurrency caps and the shared rate budget. (Default None)
+            circuit_breakers -- ``CircuitBreakers`` failing requests to
+                endpoints that keep failing without sending them.
+                (Default None)
         """
-        self.session = requests.Session()
+        from linnapi.coalescer import RequestCoalescer
+        if transport is None:
+            from linnapi.transport import TransportProfile
+            transport = TransportProfile()
+        self.transport = transport
+        if response_cache is not None:
+            self.response_cache = response_cache
+        if scheduler is None:
+            from linnapi.scheduler import RequestScheduler
+            scheduler = RequestScheduler()
+        self.scheduler = scheduler
+        if circuit_breakers is None:
+            from linnapi.circuit_breaker import CircuitBreakers
+            circuit_breakers = CircuitBreakers()
+        self.circuit_breakers = circuit_breakers
+        self.coalescer = RequestCoalescer()
+        self.local = threading.local()
+        self.token_lock = threading.Lock()
+        self.helpers = {}
+        self.helper_lock = threading.RLock()
         self.config_path = os.path.join(
             os.path.dirname(__file__), 'config.json')
         self.load_config()
@@ -38,6 +91,82 @@ class LinnworksAPISession:
         self.token = self.get_token()
         self.get_settings()
 
+    def get_helper(self, name):
+        """Return the helper ``name`` from ``helper_classes``.
+
+        The helper is created with the session the first time it is asked
+        for.
+        """
+        helper = self.helpers.get(name)
+        if helper is None:
+            with self.helper_lock:
+                if name not in self.helpers:
+                    module_name, class_name = self.helper_classes[name]
+                    module = importlib.import_module(module_name)
+                    self.helpers[name] = getattr(module, class_name)(self)
+                helper = self.helpers[name]
+        return helper
+
+    @property
+    def sku_lookup(self):
+        """``SKULookup`` shared by the session."""
+        return self.get_helper('sku_lookup')
+
+    @property
+    def sku_pool(self):
+        """``SKUPool`` shared by the session."""
+        return self.get_helper('sku_pool')
+
+    @property
+    def inventory_views(self):
+        """``InventoryViewRegistry`` shared by the session."""
+        return self.get_helper('inventory_views')
+
+    @property
+    def stock_level_loader(self):
+        """``StockLevelLoader`` shared by the session."""
+        return self.get_helper('stock_level_loader')
+
+    @property
+    def session(self):
+        """``requests.Session`` for the current thread."""
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            import requests
+            session = self.transport.configure(requests.Session())
+            self.local.session = session
+        return session
+
+    @contextlib.contextmanager
+    def priority(self, priority):
+        """Send requests made by this thread in the block at priority.
+
+        Arguments:
+            priority -- 'interactive', 'normal' or 'bulk'.
+        """
+        self.scheduler.check_priority(priority)
+        previous = getattr(self.local, 'priority', None)
+        self.local.priority = priority
+        try:
+            yield
+        finally:
+            self.local.priority = previous
+
+    def get_priority(self):
+        """Return the priority of requests made by this thread."""
+        return getattr(self.local, 'priority', None)
+
+    def with_priority(self, priority, function):
+        """Return function wrapped to make its requests at priority.
+
+        Priority is set per thread, so functions run by a thread pool are
+        wrapped to keep the priority of the job that started them.
+        """
+        def call(*args, **kwargs):
+            with self.priority(priority):
+                return function(*args, **kwargs)
+        return call
+
     def set_application_token(self):
         print('Application Token Required')
         try:
@@ -78,7 +207,7 @@ class LinnworksAPISession:
             config, open(self.config_path, 'w'), indent=4, sort_keys=True)
 
     def get_token(self):
-        url = 'https://api.linnworks.net//api/Auth/AuthorizeByApplication'
+        url = self.auth_url
         data = {
             'applicationId': self.application_id,
             'applicationSecret': self.application_secret,
@@ -94,6 +223,17 @@ class LinnworksAPISession:
             raise InvalidResponse(request)
         return token
 
+    def refresh_token(self, expired_token):
+        """Get a new token if ``expired_token`` is still the current token.
+
+        Threads that find the same token expired at once wait for the first
+        of them to get a new one rather than each requesting their own.
+        """
+        with self.token_lock:
+            if self.token == expired_token:
+                self.token = self.get_token()
+            return self.token
+
     def test_login(self):
         url = self.server + '/api/Stock/SKUExists'
         data = {'SKU': 'None'}
@@ -106,7 +246,8 @@ class LinnworksAPISession:
             return True
         return False
 
-    def make_request(self, url, data=None, params=None, files=None):
+    def make_request(self, url, data=None, params=None, files=None,
+                     stream=False):
         """Request resource URL
 
         Arguments:
@@ -115,31 +256,100 @@ class LinnworksAPISession:
         Keyword arguments:
             data --  dict containing POST request variables. (Default None)
             params --  dict containing GET request variables. (Default None)
+            stream -- If True the response body is not read until it is
+                used. (Default False)
 
         Returns:
             ``requests.Request`` object.
         """
+        headers = None
+        if files is None:
+            data, headers = self.transport.prepare_data(data)
         request = self.session.post(
-            url, data=data, params=params, files=files)
+            url, data=data, params=params, files=files, stream=stream,
+            headers=headers, timeout=self.transport.timeout)
         return request
 
-    def request(self, url, data=None, params={}, files=None):
+    def request(self, url, data=None, params=None, files=None,
+                stream=False):
         """Add authentication variables and make API request.
 
+        The request waits for a slot from ``scheduler`` at the priority
+        set with ``priority``. If the token has expired a new one is
+        requested and the request is sent once more. If the server
+        throttles the request it is queued again, up to
+        ``scheduler.throttle_retries`` times.
+
         Arguments:
             url -- URL to request.
 
         Keyword Arguments:
             data -- ``dict`` of GET variables (Default None)
+            params -- ``dict`` of GET variables. Not changed. (Default None)
+            stream -- If True the response body is not read until it is
+                used. (Default False)
 
         Returns:
             ``requests.Request`` object.
         """
-        params['token'] = self.token
-        request = self.make_request(url, data=data, params=params, files=files)
+        priority = self.get_priority()
+        retries = 0
+        while True:
+            with self.scheduler.slot(priority):
+                token = self.token
+                request = self.send_request(
+                    url, data, params, files, stream, token)
+                if request.status_code == 401:
+                    request.close()
+                    token = self.refresh_token(token)
+                    request = self.send_request(
+                        url, data, params, files, stream, token)
+            if request.status_code != 429 or \
+                    retries >= self.scheduler.throttle_retries:
+                return request
+            request.close()
+            retries += 1
+
+    def send_request(self, url, data, params, files, stream, token):
+        """Make a request with token and record it with the scheduler."""
+        import requests
+        started = time.monotonic()
+        try:
+            request = self.make_request(
+                url, data=data, params=dict(params or {}, token=token),
+                files=files, stream=stream)
+        except requests.RequestException:
+            self.scheduler.record(url, time.monotonic() - started, None)
+            raise
+        self.scheduler.record(url, time.monotonic() - started, request)
         return request
 
+    def stats(self):
+        """Return ``dict`` of request statistics for the session."""
+        stats = {
+            'scheduler': self.scheduler.stats(),
+            'coalescer': self.coalescer.stats(),
+            'circuit_breakers': self.circuit_breakers.stats()}
+        # Helpers are created on first use, so only report those in use.
+        stock_level_loader = self.helpers.get('stock_level_loader')
+        if stock_level_loader is not None:
+            stats['stock_level_loader'] = stock_level_loader.stats()
+        if self.response_cache is not None:
+            stats['response_cache'] = {
+                'hits': self.response_cache.hits,
+                'misses': self.response_cache.misses,
+                'entries': len(self.response_cache),
+                'bytes': self.response_cache.size,
+                'spilled_bytes': self.response_cache.spill_size}
+        return stats
+
     def get_settings(self):
+        from linnapi.settings import Categories
+        from linnapi.settings import PackageGroups
+        from linnapi.settings import ShippingMethods
+        from linnapi.settings import Locations
+        from linnapi.settings import PostageServices
+        from linnapi.settings import Channels
         self.categories = Categories(self)
         self.package_groups = PackageGroups(self)
         self.shipping_methods = ShippingMethods(self)
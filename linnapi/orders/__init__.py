@@ -2,3 +2,6 @@ from . open_order import OpenOrder
 from . open_orders import OpenOrders
 from . order_item import OrderItem
 from . print_list import PrintList
+from . incremental_print_list import IncrementalPrintList
+from . print_list_pipeline import PrintListPipeline
+from . process_orders import process_orders, ProcessOrdersReport
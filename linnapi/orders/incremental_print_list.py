@@ -0,0 +1,152 @@
+"""Print list that is updated incrementally from a snapshot of open orders """
+
+import linnapi.api_requests as api_requests
+from . open_order import OpenOrder
+from . open_orders import OpenOrders
+from . print_list import PrintList
+
+
+class IncrementalPrintList(PrintList):
+    """PrintList that keeps the previous snapshot of open orders.
+
+    ``refresh`` requests the open orders and only builds ``OpenOrder``
+    objects for orders that are new or whose data has changed since the last
+    refresh. ``order_to_be_printed`` is re-run for those orders alone. Bucket
+    indexes of order IDs by category, country, shipping service and paid
+    status are kept up to date so that ``select`` does not need to walk every
+    order.
+    """
+
+    bucket_names = ('category', 'country', 'shipping_service', 'paid')
+
+    def __init__(self, api_session, load=True):
+        self.api_session = api_session
+        self.order_data = {}
+        self.orders = {}
+        self.positions = {}
+        self.to_print_ids = set()
+        self.buckets = {name: {} for name in self.bucket_names}
+        self.last_delta = {'added': [], 'changed': [], 'removed': []}
+        self.print_lists = []
+        if load is True:
+            self.refresh()
+
+    def __len__(self):
+        return len(self.orders)
+
+    def refresh(self):
+        """Update the snapshot from the current open orders.
+
+        Returns:
+            dict: Lists of order IDs that were added, changed and removed.
+        """
+        if self.location is None:
+            location_id = self.api_session.locations['Default'].guid
+        else:
+            location_id = self.api_session.locations[self.location].guid
+        request = api_requests.GetOpenOrders(
+            self.api_session, count=99999, page_number=1, filters=None,
+            location_id=location_id, additional_filter=None)
+        return self.apply_snapshot(request.response_dict['Data'])
+
+    def apply_snapshot(self, orders_data):
+        """Diff ``orders_data`` against the stored snapshot and apply it."""
+        delta = {'added': [], 'changed': [], 'removed': []}
+        positions = {}
+        current = {}
+        for position, order_data in enumerate(orders_data):
+            current[order_data['OrderId']] = order_data
+            positions[order_data['OrderId']] = position
+        for order_id in list(self.order_data):
+            if order_id not in current:
+                self.remove_order(order_id)
+                delta['removed'].append(order_id)
+        for order_id, order_data in current.items():
+            previous_data = self.order_data.get(order_id)
+            if previous_data is None:
+                delta['added'].append(order_id)
+            elif previous_data != order_data:
+                self.remove_order(order_id)
+                delta['changed'].append(order_id)
+            else:
+                continue
+            self.add_order(order_data)
+        self.positions = positions
+        self.last_delta = delta
+        if delta['added'] or delta['changed'] or delta['removed']:
+            self.update_print_lists()
+        return delta
+
+    def add_order(self, order_data):
+        order = OpenOrder(self.api_session)
+        order.load_from_request(order_data)
+        self.order_data[order.order_id] = order_data
+        self.orders[order.order_id] = order
+        for name, key in self.get_bucket_keys(order).items():
+            self.buckets[name].setdefault(key, set()).add(order.order_id)
+        if self.order_to_be_printed(order):
+            self.to_print_ids.add(order.order_id)
+
+    def remove_order(self, order_id):
+        order = self.orders.pop(order_id)
+        del self.order_data[order_id]
+        for name, key in self.get_bucket_keys(order).items():
+            bucket = self.buckets[name][key]
+            bucket.discard(order_id)
+            if len(bucket) == 0:
+                del self.buckets[name][key]
+        self.to_print_ids.discard(order_id)
+
+    def get_bucket_keys(self, order):
+        return {
+            'category': order.category.name,
+            'country': order.country,
+            'shipping_service': order.postage_service.name,
+            'paid': order.paid}
+
+    def get_bucket(self, name, keys):
+        order_ids = set()
+        for key in keys:
+            order_ids.update(self.buckets[name].get(key, ()))
+        return order_ids
+
+    def select(self, categories=None, countries=None, shipping_services=None,
+               paid=None, to_print_only=True):
+        """Return ``OpenOrders`` matching the given bucket keys.
+
+        Keyword arguments:
+            categories -- Category names to include. (Default None)
+            countries -- Countries to include. (Default None)
+            shipping_services -- Shipping service names to include.
+                (Default None)
+            paid -- Paid status to include. (Default None)
+            to_print_only -- Only include orders that pass
+                ``order_to_be_printed``. (Default True)
+
+        Criteria left as ``None`` are not filtered on.
+        """
+        selections = []
+        if to_print_only is True:
+            selections.append(self.to_print_ids)
+        if categories is not None:
+            selections.append(self.get_bucket('category', categories))
+        if countries is not None:
+            selections.append(self.get_bucket('country', countries))
+        if shipping_services is not None:
+            selections.append(
+                self.get_bucket('shipping_service', shipping_services))
+        if paid is not None:
+            selections.append(self.get_bucket('paid', [paid]))
+        if len(selections) == 0:
+            order_ids = set(self.orders)
+        else:
+            selections.sort(key=len)
+            order_ids = set(selections[0]).intersection(*selections[1:])
+        orders = [self.orders[order_id] for order_id in sorted(
+            order_ids, key=self.positions.__getitem__)]
+        return OpenOrders(self.api_session, orders=orders)
+
+    def update_print_lists(self):
+        orders_to_print = [self.orders[order_id] for order_id in sorted(
+            self.to_print_ids, key=self.positions.__getitem__)]
+        self.make_print_lists(orders_to_print)
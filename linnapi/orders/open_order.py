@@ -11,7 +11,7 @@ class OpenOrder:
     order_id = None
     order_number = None
     customer_info = None
-    folder_name = []
+    folder_name = None
     external_reference_number = None
     hold_or_cancel = None
     invoice_printed = None
@@ -44,7 +44,7 @@ class OpenOrder:
     tax = None
     total_charge = None
     total_discount = None
-    items = []
+    items = None
     department = None
     unlinked = None
 
@@ -73,7 +73,9 @@ class OpenOrder:
         if customer_info is not None:
             self.customer_info = customer_info
         if folder_name is not None:
-            self.foler_name = folder_name
+            self.folder_name = folder_name
+        else:
+            self.folder_name = []
         if external_reference_number is not None:
             self.external_reference_number = external_reference_number
         if hold_or_cancel is not None:
@@ -138,6 +140,8 @@ class OpenOrder:
             self.total_discount = total_discount
         if items is not None:
             self.items = items
+        else:
+            self.items = []
         if unlinked is not None:
             self.unlinked = unlinked
 
@@ -195,6 +199,7 @@ class OpenOrder:
             self.unlinked = True
         else:
             self.unlinked = False
+        self.category = self.get_order_category()
 
         self.order_id = order_data['OrderId']
         self.order_number = str(order_data['NumOrderId'])
@@ -270,7 +275,8 @@ class OpenOrder:
                     quantity=item['Quantity'],
                     sku=item['SKU'],
                     title=item['Title'],
-                    weight=item['Weight'])
+                    weight=item['Weight'],
+                    bin_rack=item.get('BinRack'))
             items.append(new_item)
         return items
 
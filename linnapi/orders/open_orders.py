@@ -1,6 +1,7 @@
 import linnapi.api_requests as api_requests
 from . open_order import OpenOrder
 from . order_item import OrderItem
+from . process_orders import process_orders
 
 
 class OpenOrders:
@@ -30,7 +31,14 @@ class OpenOrders:
             count += len(order.items)
         return count
 
-    def load(self):
+    def load(self, stream=False):
+        """Load all open orders.
+
+        Keyword arguments:
+            stream -- If True orders are read from the response one at a
+                time instead of decoding the whole response at once.
+                (Default False)
+        """
         location_id = self.api_session.locations[self.location].guid
         self.request = api_requests.GetOpenOrders(
             self.api_session,
@@ -38,8 +46,13 @@ class OpenOrders:
             page_number=1,
             filters=None,
             location_id=location_id,
-            additional_filter=None)
-        for order in self.request.response_dict['Data']:
+            additional_filter=None,
+            stream=stream)
+        if stream is True:
+            orders = self.request.iter_response()
+        else:
+            orders = self.request.response_dict['Data']
+        for order in orders:
             self.add_order(order)
         self.update()
 
@@ -48,8 +61,7 @@ class OpenOrders:
         self.ids = []
         self.number_lookup = {}
         self.id_lookup = {}
-        for order in self.orders:
-            order_index = self.orders.index(order)
+        for order_index, order in enumerate(self.orders):
             self.numbers.append(order.order_number)
             self.ids.append(order.order_id)
             self.number_lookup[order.order_number] = order_index
@@ -68,13 +80,19 @@ class OpenOrders:
         else:
             return self.orders[key]
 
-    def __iter_(self):
+    def __iter__(self):
         for order in self.orders:
             yield order
 
     def __len__(self):
         return len(self.orders)
 
+    def process(self, max_workers=8):
+        """Process all orders. Return ``ProcessOrdersReport``."""
+        return process_orders(
+            self.api_session, self.ids, max_workers=max_workers,
+            location=self.location)
+
     def print_pick_list(self, printer_name):
         self.print_orders('Pick List', printer_name)
 
@@ -16,6 +16,7 @@ class OrderItem:
     sku = None
     title = None
     weight = None
+    bin_rack = None
 
     def __init__(self, api_session,
                  available=None,
@@ -31,7 +32,8 @@ class OrderItem:
                  quantity=None,
                  sku=None,
                  title=None,
-                 weight=None
+                 weight=None,
+                 bin_rack=None
                  ):
         self.api_session = api_session
         if available is not None:
@@ -62,6 +64,8 @@ class OrderItem:
             self.title = title
         if weight is not None:
             self.weight = weight
+        if bin_rack is not None:
+            self.bin_rack = bin_rack
 
     def getInventoryItem(self, api_session):
         return InventoryItem(api_session, self.guid)
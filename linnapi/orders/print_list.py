@@ -1,4 +1,5 @@
 from . open_orders import OpenOrders
+from . print_list_pipeline import PrintListPipeline
 
 
 class PrintList:
@@ -19,64 +20,58 @@ class PrintList:
     shipping_services = None
     location = None
     unlinked = None
-    batch = False
+    group_by = None
+    sort_by = ()
+    batch_size = None
+    pipeline = None
 
     def __init__(self, api_session):
         self.api_session = api_session
         self.all_open_orders = OpenOrders(api_session, load=True,
                                           location=self.location)
-        self.print_lists = []
-        orders_to_print = []
-        for order in self.all_open_orders:
-            if self.order_to_be_printed(order):
-                orders_to_print.append(order)
-        self.orders_to_print = OpenOrders(api_session, orders=orders_to_print)
-        self.separated_orders = self.separate_orders(self.orders_to_print)
+        self.make_print_lists(
+            self.get_pipeline().filter(self.all_open_orders.orders))
+
+    def get_pipeline(self):
+        """Return the ``PrintListPipeline`` compiled from this print list's
+        criteria.
+        """
+        if self.pipeline is None:
+            self.pipeline = PrintListPipeline(
+                paid=self.paid, invoice_printed=self.invoice_printed,
+                shipping_label_printed=self.shipping_label_printed,
+                pick_list_printed=self.pick_list_printed,
+                unlinked=self.unlinked, categories=self.categories,
+                countries=self.countries,
+                shipping_services=self.shipping_services,
+                group_by=self.group_by, sort_by=self.sort_by,
+                batch_size=self.batch_size)
+        return self.pipeline
+
+    def make_print_lists(self, orders_to_print):
+        self.orders_to_print = OpenOrders(
+            self.api_session, orders=orders_to_print)
+        self.separated_orders = self.separate_orders(orders_to_print)
         self.sorted_orders = []
         for order_list in self.separated_orders:
             self.sorted_orders.append(self.sort_orders(order_list))
-        if self.batch is True:
-            for order_list in self.sorted_orders:
-                batch = self.batch(order_list)
-                self.print_lists.append(batch)
-        else:
-            self.print_lists = self.separated_orders
+        self.print_lists = []
+        for order_list in self.sorted_orders:
+            for batch in self.batch(order_list):
+                self.print_lists.append(
+                    OpenOrders(self.api_session, orders=batch))
 
     def separate_orders(self, orders):
-        return [orders]
+        return self.get_pipeline().partition(orders)
 
     def sort_orders(self, orders):
-        return orders
+        return self.get_pipeline().sort(orders)
 
     def order_to_be_printed(self, order):
-        if self.paid is not None:
-            if order.paid != self.paid:
-                return False
-        if self.invoice_printed is not None:
-            if order.invoice_printed != self.invoice_printed:
-                return False
-        if self.shipping_label_printed is not None:
-            if order.shipping_label_printed != self.shipping_label_printed:
-                return False
-        if self.pick_list_printed is not None:
-            if order.pick_list_printed != self.pick_list_printed:
-                return False
-        if self.unlinked is not None:
-            if order.unlinked != self.unlinked:
-                return False
-        if self.categories is not None:
-            if order.category.name not in self.categories:
-                return False
-        if self.countries is not None:
-            if order.country not in self.countries:
-                return False
-        if self.shipping_services is not None:
-            if order.shipping_service.name not in self.shipping_services:
-                return False
-        return True
+        return self.get_pipeline().predicate(order)
 
     def batch(self, orders):
-        NotImplemented
+        return self.get_pipeline().batch(orders)
 
     def print_orders(self):
         for print_list in self.print_lists:
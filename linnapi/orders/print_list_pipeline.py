@@ -0,0 +1,162 @@
+"""Compiled filter, sort and batch pipeline for print lists """
+
+from operator import attrgetter
+
+
+def get_bin_rack(order):
+    """Return the first bin rack of the items in order."""
+    bin_racks = [
+        item.bin_rack for item in order.items
+        if not isinstance(item, str) and item.bin_rack is not None]
+    if len(bin_racks) == 0:
+        return ''
+    return min(bin_racks)
+
+
+class PrintListPipeline:
+    """Filters, groups, sorts and batches open orders for printing.
+
+    Criteria are compiled once into a single predicate. Values to match
+    against are held in ``frozenset`` objects so each membership test is a
+    hash lookup.
+
+    Keyword arguments:
+        paid -- Required paid status. (Default None)
+        invoice_printed -- Required invoice printed status. (Default None)
+        shipping_label_printed -- Required label printed status.
+            (Default None)
+        pick_list_printed -- Required pick list printed status.
+            (Default None)
+        unlinked -- Required unlinked status. (Default None)
+        categories -- Category names to include. (Default None)
+        countries -- Countries to include. (Default None)
+        shipping_services -- Shipping service names to include.
+            (Default None)
+        group_by -- Name from ``keys`` or function used to separate orders
+            into print lists. (Default None)
+        sort_by -- Sequence of names from ``keys`` or functions, or of
+            ``(key, reverse)`` tuples, to sort each print list by.
+            (Default ())
+        batch_size -- Maximum number of orders in a print list.
+            (Default None)
+
+    Criteria left as ``None`` are not filtered on.
+    """
+
+    keys = {
+        'shipping_service': attrgetter('postage_service.name'),
+        'category': attrgetter('category.name'),
+        'country': attrgetter('country'),
+        'bin_location': get_bin_rack,
+        'order_number': attrgetter('order_number'),
+        'date_recieved': attrgetter('date_recieved', 'time_recieved'),
+    }
+
+    def __init__(self, paid=None, invoice_printed=None,
+                 shipping_label_printed=None, pick_list_printed=None,
+                 unlinked=None, categories=None, countries=None,
+                 shipping_services=None, group_by=None, sort_by=(),
+                 batch_size=None):
+        equals = []
+        if paid is not None:
+            equals.append((attrgetter('paid'), paid))
+        if invoice_printed is not None:
+            equals.append((attrgetter('invoice_printed'), invoice_printed))
+        if shipping_label_printed is not None:
+            equals.append(
+                (attrgetter('label_printed'), shipping_label_printed))
+        if pick_list_printed is not None:
+            equals.append(
+                (attrgetter('pick_list_printed'), pick_list_printed))
+        if unlinked is not None:
+            equals.append((attrgetter('unlinked'), unlinked))
+        members = []
+        if categories is not None:
+            members.append((self.keys['category'], frozenset(categories)))
+        if countries is not None:
+            members.append((self.keys['country'], frozenset(countries)))
+        if shipping_services is not None:
+            members.append(
+                (self.keys['shipping_service'], frozenset(shipping_services)))
+        self.predicate = self.compile_predicate(equals, members)
+        if group_by is None:
+            self.group_key = None
+        else:
+            self.group_key = self.get_key(group_by)
+        self.sort_keys = []
+        for key in sort_by:
+            if isinstance(key, tuple):
+                key, reverse = key
+            else:
+                reverse = False
+            self.sort_keys.append((self.get_key(key), reverse))
+        self.batch_size = batch_size
+
+    def get_key(self, key):
+        if callable(key):
+            return key
+        if key not in self.keys:
+            raise ValueError(str(key) + " is not a valid print list key")
+        return self.keys[key]
+
+    def compile_predicate(self, equals, members):
+        equals = tuple(equals)
+        members = tuple(members)
+
+        def predicate(order):
+            for getter, value in equals:
+                if getter(order) != value:
+                    return False
+            for getter, values in members:
+                if getter(order) not in values:
+                    return False
+            return True
+        return predicate
+
+    def filter(self, orders):
+        """Return list of orders that meet the criteria."""
+        predicate = self.predicate
+        return [order for order in orders if predicate(order)]
+
+    def partition(self, orders):
+        """Return orders separated into lists by ``group_by``.
+
+        Groups are returned in the order their first order was seen.
+        """
+        if self.group_key is None:
+            return [list(orders)]
+        group_key = self.group_key
+        groups = {}
+        for order in orders:
+            key = group_key(order)
+            if key in groups:
+                groups[key].append(order)
+            else:
+                groups[key] = [order]
+        return list(groups.values())
+
+    def sort(self, orders):
+        """Return orders sorted by each key in ``sort_by`` in turn.
+
+        Keys are applied from last to first with a stable sort so that
+        earlier keys take precedence and ties keep their original order.
+        """
+        orders = list(orders)
+        for key, reverse in reversed(self.sort_keys):
+            orders.sort(key=key, reverse=reverse)
+        return orders
+
+    def batch(self, orders):
+        """Return orders split into lists of at most ``batch_size``."""
+        orders = list(orders)
+        if self.batch_size is None or len(orders) == 0:
+            return [orders]
+        return [orders[i:i + self.batch_size] for i in range(
+            0, len(orders), self.batch_size)]
+
+    def run(self, orders):
+        """Filter, partition, sort and batch orders in one call."""
+        print_lists = []
+        for group in self.partition(self.filter(orders)):
+            print_lists.extend(self.batch(self.sort(group)))
+        return print_lists
@@ -0,0 +1,85 @@
+"""Processes open orders in bulk """
+
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+
+
+class ProcessOrdersReport:
+    """Result of ``process_orders``.
+
+    Attributes:
+        processed -- List of order IDs confirmed as no longer open.
+        failed -- ``dict`` of error messages by order ID for orders that
+            returned an error or are still open.
+    """
+
+    def __init__(self):
+        self.processed = []
+        self.failed = {}
+
+    def __len__(self):
+        return len(self.processed) + len(self.failed)
+
+    def __str__(self):
+        return '{} processed, {} failed'.format(
+            len(self.processed), len(self.failed))
+
+
+def submit_process_order(api_session, order_id):
+    """Send ProcessOrder for order_id. Return error message or None."""
+    try:
+        request = api_requests.ProcessOrder(api_session, order_id)
+    except Exception as e:
+        return str(e)
+    response = getattr(request, 'response_dict', None)
+    if isinstance(response, dict) and response.get('Processed') is False:
+        return str(response.get('Error'))
+    return None
+
+
+def process_orders(api_session, order_ids, max_workers=8, location='Default'):
+    """Process open orders concurrently and confirm them in one request.
+
+    ProcessOrder requests are sent from a pool of at most ``max_workers``
+    threads. Orders whose request returned an error are reported as failed.
+    Once every request has returned, the IDs of all open orders are
+    requested once and any other order still in that list is reported as
+    failed.
+
+    Arguments:
+        order_ids -- Iterable of order IDs to process.
+
+    Keyword arguments:
+        max_workers -- Maximum number of concurrent requests. (Default 8)
+        location -- Name of location the orders are open in.
+            (Default 'Default')
+
+    Returns:
+        ``ProcessOrdersReport``.
+    """
+    order_ids = list(dict.fromkeys(order_ids))
+    report = ProcessOrdersReport()
+    if len(order_ids) == 0:
+        return report
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        errors = dict(zip(order_ids, executor.map(
+            lambda order_id: submit_process_order(api_session, order_id),
+            order_ids)))
+    submitted = []
+    for order_id in order_ids:
+        if errors[order_id] is None:
+            submitted.append(order_id)
+        else:
+            report.failed[order_id] = errors[order_id]
+    if len(submitted) == 0:
+        return report
+    open_orders_request = api_requests.GetAllOpenOrders(
+        api_session, location_id=api_session.locations[location].guid)
+    open_order_ids = set(open_orders_request.response_dict)
+    for order_id in submitted:
+        if order_id in open_order_ids:
+            report.failed[order_id] = 'Order is still open.'
+        else:
+            report.processed.append(order_id)
+    return report
@@ -0,0 +1,3 @@
+from . processed_order_search import ProcessedOrderRecord
+from . processed_order_search import iter_processed_orders
+from . processed_order_store import ProcessedOrderStore
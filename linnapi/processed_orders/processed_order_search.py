@@ -0,0 +1,170 @@
+"""Iterates processed orders for a date range.
+
+Large date ranges are split into shards of whole days which are searched
+concurrently. Pages are passed back through a bounded queue so only a few
+pages are held in memory at once.
+"""
+
+import datetime
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+from linnapi.functions import make_linnworks_date_time
+
+
+ProcessedOrderRecord = namedtuple('ProcessedOrderRecord', [
+    'order_id', 'order_number', 'reference_number', 'source', 'sub_source',
+    'received_date', 'processed_date', 'postage_service', 'total_charge',
+    'currency', 'country'])
+
+
+DATE_TYPE_FIELDS = {
+    'PROCESSED': 'processed_date',
+    'RECEIVED': 'received_date'}
+
+
+def make_record(order_data):
+    """Return ``ProcessedOrderRecord`` for a processed order search result."""
+    return ProcessedOrderRecord(
+        order_id=order_data['pkOrderID'],
+        order_number=str(order_data['nOrderId']),
+        reference_number=order_data.get('ReferenceNum'),
+        source=order_data.get('Source'),
+        sub_source=order_data.get('SubSource'),
+        received_date=order_data.get('dReceivedDate'),
+        processed_date=order_data.get('dProcessedOn'),
+        postage_service=order_data.get('PostalServiceName'),
+        total_charge=order_data.get('fTotalCharge'),
+        currency=order_data.get('cCurrency'),
+        country=order_data.get('cCountry'))
+
+
+def get_date_shards(from_date, to_date, shard_days=7):
+    """Split the days from from_date to to_date into ranges.
+
+    Returns:
+        list: ``(start, end)`` tuples of ``datetime.date``. Both ends are
+            included in the range and ranges do not overlap.
+    """
+    if isinstance(from_date, datetime.datetime):
+        from_date = from_date.date()
+    if isinstance(to_date, datetime.datetime):
+        to_date = to_date.date()
+    if to_date < from_date:
+        raise ValueError('to_date must not be before from_date')
+    shards = []
+    start = from_date
+    step = datetime.timedelta(days=shard_days)
+    while start <= to_date:
+        end = min(start + step - datetime.timedelta(days=1), to_date)
+        shards.append((start, end))
+        start = end + datetime.timedelta(days=1)
+    return shards
+
+
+def iter_processed_order_pages(api_session, start, end, entries_per_page=200,
+                               date_type='PROCESSED'):
+    """Yield lists of order data for each page of a date range search."""
+    from_date = make_linnworks_date_time(start.year, start.month, start.day)
+    to_date = make_linnworks_date_time(
+        end.year, end.month, end.day, hour=23, minute=59, second=59.999)
+    page_num = 1
+    while True:
+        request = api_requests.SearchProcessedOrdersPaged(
+            api_session, '', from_date=from_date, to_date=to_date,
+            date_type=date_type, exact_match=False, page_num=page_num,
+            num_entries_per_page=entries_per_page)
+        page = request.response_dict['Data']
+        total_pages = request.response_dict.get('TotalPages')
+        if len(page) > 0:
+            yield page
+        if len(page) < entries_per_page:
+            break
+        if total_pages is not None and page_num >= total_pages:
+            break
+        page_num += 1
+
+
+def iter_processed_orders(api_session, from_date, to_date, shard_days=7,
+                          max_workers=4, entries_per_page=200,
+                          date_type='PROCESSED'):
+    """Yield ``ProcessedOrderRecord`` for every order in a date range.
+
+    Arguments:
+        from_date -- ``datetime.date`` of first day to include.
+        to_date -- ``datetime.date`` of last day to include.
+
+    Keyword arguments:
+        shard_days -- Number of days searched by each shard. (Default 7)
+        max_workers -- Number of shards searched at once. (Default 4)
+        entries_per_page -- Number of orders requested per page.
+            (Default 200)
+        date_type -- Date searched on. (Default 'PROCESSED')
+
+    Records from different shards are interleaved, so they are only in date
+    order when ``max_workers`` is 1. Orders whose searched date is on the
+    first or last day of a shard are de-duplicated in case they are
+    returned by both shards or move between pages during the search. For
+    date types with no matching field in ``ProcessedOrderRecord`` every
+    order is de-duplicated.
+    """
+    shards = get_date_shards(from_date, to_date, shard_days=shard_days)
+    date_field = DATE_TYPE_FIELDS.get(date_type)
+    boundary_days = set()
+    for start, end in shards:
+        boundary_days.add(start.isoformat())
+        boundary_days.add(end.isoformat())
+    pages = queue.Queue(maxsize=max_workers * 2)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def search_shard(shard):
+        try:
+            for page in iter_processed_order_pages(
+                    api_session, shard[0], shard[1],
+                    entries_per_page=entries_per_page, date_type=date_type):
+                if not put(page):
+                    return
+        except Exception as e:
+            put(e)
+        put(done)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for shard in shards:
+            executor.submit(search_shard, shard)
+        boundary_ids = set()
+        remaining = len(shards)
+        while remaining > 0:
+            page = pages.get()
+            if page is done:
+                remaining -= 1
+                continue
+            if isinstance(page, Exception):
+                raise page
+            for order_data in page:
+                record = make_record(order_data)
+                if date_field is None:
+                    day = None
+                else:
+                    day = str(getattr(record, date_field))[:10]
+                if day is None or day in boundary_days:
+                    if record.order_id in boundary_ids:
+                        continue
+                    boundary_ids.add(record.order_id)
+                yield record
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
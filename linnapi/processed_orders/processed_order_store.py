@@ -0,0 +1,154 @@
+"""Local SQLite store of processed orders """
+
+import datetime
+import sqlite3
+import threading
+
+from . processed_order_search import ProcessedOrderRecord
+from . processed_order_search import iter_processed_orders
+
+
+class ProcessedOrderStore:
+    """Keeps a local copy of processed orders in an SQLite database.
+
+    ``sync`` searches only from the day of the latest processed order
+    already stored, so each sync requests the orders processed since the
+    previous one. Lookups by order ID or order number are answered from
+    indexed tables without contacting the API.
+
+    The store can be used from any thread. One connection is shared and
+    each read or write holds ``lock``.
+
+    Arguments:
+        api_session -- ``LinnworksAPISession`` used to sync.
+        path -- Path of the database file. (Default ':memory:')
+    """
+
+    insert_size = 500
+
+    def __init__(self, api_session, path=':memory:'):
+        self.api_session = api_session
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.create_tables()
+
+    def create_tables(self):
+        with self.lock, self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS processed_orders ('
+                'order_id TEXT PRIMARY KEY, order_number TEXT, '
+                'reference_number TEXT, source TEXT, sub_source TEXT, '
+                'received_date TEXT, processed_date TEXT, '
+                'postage_service TEXT, total_charge REAL, currency TEXT, '
+                'country TEXT)')
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS processed_orders_order_number '
+                'ON processed_orders (order_number)')
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS sync_state ('
+                'key TEXT PRIMARY KEY, value TEXT)')
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute(
+                'SELECT COUNT(*) FROM processed_orders').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def get_high_water_mark(self):
+        """Return ``datetime.date`` of the latest stored order or None."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM sync_state "
+                "WHERE key = 'high_water_mark'").fetchone()
+        if row is None:
+            return None
+        return datetime.datetime.strptime(row[0], '%Y-%m-%d').date()
+
+    def set_high_water_mark(self, date):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) "
+                "VALUES ('high_water_mark', ?)", (date.isoformat(), ))
+
+    def sync(self, start_date=None, end_date=None, shard_days=7,
+             max_workers=4):
+        """Add orders processed since the last sync to the store.
+
+        Keyword arguments:
+            start_date -- ``datetime.date`` to sync from if the store has
+                not been synced before. (Default None)
+            end_date -- ``datetime.date`` to sync to. (Default today)
+            shard_days -- Passed to ``iter_processed_orders``. (Default 7)
+            max_workers -- Passed to ``iter_processed_orders``. (Default 4)
+
+        Returns:
+            int: Number of orders received.
+        """
+        from_date = self.get_high_water_mark()
+        if from_date is None:
+            if start_date is None:
+                raise ValueError(
+                    'start_date is required for the first sync.')
+            from_date = start_date
+        if end_date is None:
+            end_date = datetime.date.today()
+        count = 0
+        rows = []
+        latest = None
+        for record in iter_processed_orders(
+                self.api_session, from_date, end_date,
+                shard_days=shard_days, max_workers=max_workers):
+            rows.append(record)
+            if record.processed_date:
+                day = str(record.processed_date)[:10]
+                if latest is None or day > latest:
+                    latest = day
+            if len(rows) >= self.insert_size:
+                count += self.insert(rows)
+                rows = []
+        count += self.insert(rows)
+        if latest is not None:
+            latest = datetime.datetime.strptime(latest, '%Y-%m-%d').date()
+            previous = self.get_high_water_mark()
+            if previous is None or latest > previous:
+                self.set_high_water_mark(latest)
+        return count
+
+    def insert(self, records):
+        """Add or replace ``ProcessedOrderRecord``s. Return number added."""
+        with self.lock, self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO processed_orders VALUES '
+                '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', records)
+        return len(records)
+
+    def get(self, order_id):
+        """Return ``ProcessedOrderRecord`` for order_id or None."""
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT * FROM processed_orders WHERE order_id = ?',
+                (order_id, )).fetchone()
+        if row is None:
+            return None
+        return ProcessedOrderRecord(*row)
+
+    def get_order_id(self, order_number):
+        """Return order ID for order_number or None."""
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT order_id FROM processed_orders '
+                'WHERE order_number = ?', (str(order_number), )).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def get_order_number(self, order_id):
+        """Return order number for order_id or None."""
+        record = self.get(order_id)
+        if record is None:
+            return None
+        return record.order_number
@@ -0,0 +1,257 @@
+"""Read through cache for responses to idempotent API requests """
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+
+
+class CacheEntry:
+    """A cached response body and what is needed to rebuild the response."""
+
+    __slots__ = (
+        'key', 'url', 'status_code', 'content_type', 'content', 'size',
+        'expires', 'stock_ids', 'path')
+
+    def __init__(self, key, response, expires, stock_ids):
+        self.key = key
+        self.url = response.url
+        self.status_code = response.status_code
+        self.content_type = response.headers.get('Content-Type')
+        self.content = response.content
+        self.size = len(self.content)
+        self.expires = expires
+        self.stock_ids = tuple(stock_ids)
+        self.path = None
+
+    def make_response(self):
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.encoding = 'utf-8'
+        if self.content_type is not None:
+            response.headers['Content-Type'] = self.content_type
+        response._content = self.content
+        return response
+
+
+class ResponseCache:
+    """Memory bounded LRU cache of responses to read requests.
+
+    Only requests whose class sets ``cacheable`` are cached. Entries are
+    keyed on the request's ``url_extension`` and its data and parameters,
+    and expire after the TTL for the endpoint. When a request whose class
+    sets ``invalidates_cache`` succeeds, cached responses for the stock IDs
+    it changed are dropped.
+
+    When the cached bodies exceed ``max_bytes`` the least recently used are
+    dropped, or written to ``spill_directory`` if one is given and read
+    back when they are next used.
+
+    Example:
+        cache = ResponseCache(
+            ttls={'/api/Inventory/GetInventoryItemById': 60})
+        api_session = LinnworksAPISession(response_cache=cache)
+
+    Keyword arguments:
+        max_bytes -- Largest total size of response bodies held in memory.
+            (Default 33554432)
+        default_ttl -- Seconds responses are kept for endpoints not in
+            ``ttls``. (Default 300)
+        ttls -- ``dict`` of seconds responses are kept by
+            ``url_extension``. A TTL of 0 disables caching for the
+            endpoint. (Default None)
+        spill_directory -- Directory to write evicted responses to, or
+            None to drop them. (Default None)
+        max_spill_bytes -- Largest total size of response bodies written to
+            ``spill_directory``. (Default 268435456)
+    """
+
+    max_bytes = 32 * 1024 * 1024
+    default_ttl = 300
+    spill_directory = None
+    max_spill_bytes = 256 * 1024 * 1024
+
+    def __init__(self, max_bytes=None, default_ttl=None, ttls=None,
+                 spill_directory=None, max_spill_bytes=None):
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if default_ttl is not None:
+            self.default_ttl = default_ttl
+        self.ttls = {}
+        if ttls is not None:
+            self.ttls.update(ttls)
+        if spill_directory is not None:
+            self.spill_directory = spill_directory
+            os.makedirs(self.spill_directory, exist_ok=True)
+        if max_spill_bytes is not None:
+            self.max_spill_bytes = max_spill_bytes
+        self.lock = threading.RLock()
+        self.entries = OrderedDict()
+        self.spilled = OrderedDict()
+        self.stock_index = {}
+        self.size = 0
+        self.spill_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+
+    def __len__(self):
+        return len(self.entries) + len(self.spilled)
+
+    def get_ttl(self, url_extension):
+        return self.ttls.get(url_extension, self.default_ttl)
+
+    def get_key(self, request):
+        """Return cache key for a request."""
+        return request.get_request_key()
+
+    def get(self, request):
+        """Return cached ``requests.Response`` for a request or None."""
+        key = self.get_key(request)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.spilled.get(key)
+            if entry is None or entry.expires <= time.monotonic():
+                if entry is not None:
+                    self.remove(key)
+                self.misses += 1
+                return None
+            if entry.path is not None and not self.unspill(entry):
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry.make_response()
+
+    def put(self, request, response, generation=None):
+        """Cache a response to a request.
+
+        Keyword arguments:
+            generation -- Value of ``generation`` when the request was sent.
+                If anything was invalidated since then the response may be
+                out of date and is not cached. (Default None)
+        """
+        ttl = self.get_ttl(request.url_extension)
+        if not ttl or not response.ok:
+            return
+        key = self.get_key(request)
+        entry = CacheEntry(
+            key, response, time.monotonic() + ttl, request.get_stock_ids())
+        if entry.size > self.max_bytes:
+            return
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            self.remove(key)
+            self.entries[key] = entry
+            self.size += entry.size
+            for stock_id in entry.stock_ids:
+                self.stock_index.setdefault(stock_id, set()).add(key)
+            self.evict()
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+        else:
+            entry = self.spilled.pop(key, None)
+            if entry is None:
+                return
+            self.spill_size -= entry.size
+            self.delete_file(entry)
+        self.unindex(entry)
+
+    def unindex(self, entry):
+        for stock_id in entry.stock_ids:
+            keys = self.stock_index.get(stock_id)
+            if keys is not None:
+                keys.discard(entry.key)
+                if not keys:
+                    del self.stock_index[stock_id]
+
+    def invalidate(self, stock_ids=None, url_extensions=()):
+        """Drop cached responses for items and endpoints.
+
+        Keyword arguments:
+            stock_ids -- Iterable of stock IDs to drop responses for, or None
+                to drop responses for every item. (Default None)
+            url_extensions -- Iterable of endpoints to drop every response
+                for. (Default ())
+        """
+        with self.lock:
+            self.generation += 1
+            if stock_ids is None:
+                stock_ids = list(self.stock_index)
+            keys = set()
+            for stock_id in stock_ids:
+                keys.update(self.stock_index.get(stock_id, ()))
+            url_extensions = tuple(url_extensions)
+            if url_extensions:
+                for key in list(self.entries) + list(self.spilled):
+                    if key.split('?', 1)[0] in url_extensions:
+                        keys.add(key)
+            for key in keys:
+                self.remove(key)
+
+    def clear(self):
+        """Drop every cached response."""
+        with self.lock:
+            self.generation += 1
+            for key in list(self.entries) + list(self.spilled):
+                self.remove(key)
+
+    def evict(self):
+        while self.size > self.max_bytes:
+            key, entry = self.entries.popitem(last=False)
+            self.size -= entry.size
+            if self.spill_directory is None or not self.spill(entry):
+                self.unindex(entry)
+        while self.spill_size > self.max_spill_bytes:
+            self.remove(next(iter(self.spilled)))
+
+    def get_path(self, key):
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.spill_directory, name)
+
+    def spill(self, entry):
+        """Write an entry's body to disk. Return False if it can't be."""
+        path = self.get_path(entry.key)
+        try:
+            with open(path, 'wb') as spill_file:
+                spill_file.write(entry.content)
+        except OSError:
+            return False
+        entry.content = None
+        entry.path = path
+        self.spilled[entry.key] = entry
+        self.spill_size += entry.size
+        return True
+
+    def unspill(self, entry):
+        """Read an entry's body back into memory. Return False if lost."""
+        try:
+            with open(entry.path, 'rb') as spill_file:
+                content = spill_file.read()
+        except OSError:
+            self.remove(entry.key)
+            return False
+        del self.spilled[entry.key]
+        self.spill_size -= entry.size
+        self.delete_file(entry)
+        entry.content = content
+        self.entries[entry.key] = entry
+        self.size += entry.size
+        self.evict()
+        return True
+
+    def delete_file(self, entry):
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+        entry.path = None
@@ -0,0 +1,237 @@
+"""Schedules API requests by priority within one shared rate budget """
+
+import collections
+import contextlib
+import threading
+import time
+
+from linnapi.concurrency_limit import AdaptiveConcurrencyLimit
+
+
+class RequestScheduler:
+    """Decides when each request may be sent.
+
+    Every request belongs to a priority class, ``'interactive'``,
+    ``'normal'`` or ``'bulk'``. At most ``max_concurrency`` requests are
+    sent at once, and each class has its own cap in ``limits``. The last
+    ``reserved`` slots are only used by interactive requests, so normal and
+    bulk work together never take every slot and an interactive request
+    does not wait for a slow bulk request to finish. Waiting requests are
+    started in strict
+    priority order, oldest first within a class, so an interactive request
+    goes ahead of any queued normal or bulk request. If ``rate`` is set,
+    requests of all classes share a token bucket of ``rate`` requests per
+    second.
+
+    Callers that can not start yet wait in ``acquire`` rather than being
+    given an error, which slows bulk jobs down to the rate the budget
+    allows.
+
+    If ``adaptive`` is True the number of requests sent at once is set by
+    an ``AdaptiveConcurrencyLimit`` between 1 and ``max_concurrency``
+    from the responses passed to ``record``. The limit is never less than
+    ``reserved`` + 1 so other classes can always make progress. Class caps
+    shrink in proportion, and no request starts while the server has
+    asked for a pause with ``Retry-After``.
+
+    Keyword arguments:
+        max_concurrency -- Largest number of requests sent at once.
+            (Default 16)
+        limits -- ``dict`` of the largest number of requests sent at once
+            by priority class. Classes that are not given keep their
+            default. (Default interactive 16, normal 12, bulk 8)
+        reserved -- Number of slots only interactive requests may use.
+            At most ``max_concurrency`` - 1. (Default 2)
+        rate -- Requests per second shared by every class, or None for no
+            limit. (Default None)
+        burst -- Number of requests that can be sent at once when the
+            rate budget has not been used. (Default 10)
+        adaptive -- If True the concurrency limit adapts to latency and
+            throttling. (Default True)
+        limiter -- ``AdaptiveConcurrencyLimit`` to use if adaptive.
+            Created from ``max_concurrency`` if None. (Default None)
+        throttle_retries -- Number of times a throttled (429) request is
+            queued again before the response is returned. (Default 3)
+    """
+
+    priorities = ('interactive', 'normal', 'bulk')
+    default_priority = 'normal'
+    max_concurrency = 16
+    reserved = 2
+    rate = None
+    burst = 10
+    adaptive = True
+    throttle_retries = 3
+
+    def __init__(self, max_concurrency=None, limits=None, rate=None,
+                 burst=None, adaptive=None, limiter=None,
+                 throttle_retries=None, reserved=None):
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        if reserved is not None:
+            self.reserved = reserved
+        self.reserved = max(0, min(self.reserved, self.max_concurrency - 1))
+        self.limits = {
+            'interactive': self.max_concurrency, 'normal': 12, 'bulk': 8}
+        if limits is not None:
+            self.limits.update(limits)
+        if rate is not None:
+            self.rate = rate
+        if burst is not None:
+            self.burst = burst
+        if adaptive is not None:
+            self.adaptive = adaptive
+        if throttle_retries is not None:
+            self.throttle_retries = throttle_retries
+        self.limiter = None
+        if self.adaptive:
+            if limiter is None:
+                limiter = AdaptiveConcurrencyLimit(
+                    max_limit=self.max_concurrency)
+            self.limiter = limiter
+        self.condition = threading.Condition()
+        self.waiting = {
+            priority: collections.deque() for priority in self.priorities}
+        self.active = {priority: 0 for priority in self.priorities}
+        self.sent = {priority: 0 for priority in self.priorities}
+        self.wait_time = {priority: 0.0 for priority in self.priorities}
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def check_priority(self, priority):
+        if priority is None:
+            return self.default_priority
+        if priority not in self.waiting:
+            raise ValueError('Unknown request priority ' + str(priority))
+        return priority
+
+    def get_limit(self):
+        """Return the number of requests that may be sent at once."""
+        if self.limiter is None:
+            return self.max_concurrency
+        return min(self.max_concurrency, max(
+            self.reserved + 1, self.limiter.get_limit()))
+
+    def get_class_limit(self, priority):
+        limit = self.get_limit()
+        if limit == self.max_concurrency:
+            return self.limits[priority]
+        return max(1, min(
+            self.limits[priority],
+            limit * self.limits[priority] // self.max_concurrency))
+
+    def can_start(self, priority):
+        limit = self.get_limit()
+        active = sum(self.active.values())
+        if active >= limit or \
+                self.active[priority] >= self.get_class_limit(priority):
+            return False
+        if priority == 'interactive':
+            return True
+        return active - self.active['interactive'] < limit - self.reserved
+
+    def is_next(self, priority, ticket):
+        """Return True if ticket is the next request that should start."""
+        if self.waiting[priority][0] is not ticket:
+            return False
+        for higher in self.priorities[:self.priorities.index(priority)]:
+            if self.waiting[higher] and self.can_start(higher):
+                return False
+        return self.can_start(priority)
+
+    def take_token(self):
+        """Take a token. Return 0, or seconds until a token is available."""
+        if self.rate is None:
+            return 0
+        now = time.monotonic()
+        self.tokens = min(
+            float(self.burst), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def acquire(self, priority=None):
+        """Wait until a request of priority may be sent and count it."""
+        priority = self.check_priority(priority)
+        ticket = object()
+        started = time.monotonic()
+        with self.condition:
+            queue = self.waiting[priority]
+            queue.append(ticket)
+            try:
+                while True:
+                    if self.is_next(priority, ticket):
+                        delay = self.get_throttle_delay()
+                        if delay > 0:
+                            self.condition.wait(delay)
+                            continue
+                        delay = self.take_token()
+                        if delay == 0:
+                            break
+                        self.condition.wait(delay)
+                    else:
+                        self.condition.wait()
+            except BaseException:
+                queue.remove(ticket)
+                self.condition.notify_all()
+                raise
+            queue.popleft()
+            self.active[priority] += 1
+            self.sent[priority] += 1
+            self.wait_time[priority] += time.monotonic() - started
+            self.condition.notify_all()
+        return priority
+
+    def get_throttle_delay(self):
+        if self.limiter is None:
+            return 0
+        return self.limiter.get_delay()
+
+    def record(self, endpoint, latency, response):
+        """Pass a response to the limiter and wake waiting requests.
+
+        Arguments:
+            endpoint -- Key grouping requests of similar cost.
+            latency -- Seconds the request took.
+            response -- ``requests.Response`` or None if the request
+                failed without a response.
+        """
+        if self.limiter is None:
+            return
+        self.limiter.record(endpoint, latency, response)
+        with self.condition:
+            self.condition.notify_all()
+
+    def release(self, priority=None):
+        """Mark a request of priority as finished."""
+        priority = self.check_priority(priority)
+        with self.condition:
+            self.active[priority] -= 1
+            self.condition.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self, priority=None):
+        """Hold a request slot for the ``with`` block."""
+        priority = self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def stats(self):
+        """Return ``dict`` of request counts by priority class."""
+        with self.condition:
+            stats = {
+                priority: {
+                    'active': self.active[priority],
+                    'waiting': len(self.waiting[priority]),
+                    'sent': self.sent[priority],
+                    'wait_time': self.wait_time[priority]}
+                for priority in self.priorities}
+            stats['limit'] = self.get_limit()
+            stats['reserved'] = self.reserved
+        if self.limiter is not None:
+            stats['concurrency'] = self.limiter.stats()
+        return stats
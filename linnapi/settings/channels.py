@@ -9,8 +9,11 @@ class Channels(InfoClass):
     request_class = api_requests.GetChannels
     entry_class = Channel
     info_list = []
-    sub_sources = []
-    sub_source_lookup = {}
+
+    def __init__(self, api_session):
+        self.sub_sources = []
+        self.sub_source_lookup = {}
+        super().__init__(api_session)
 
     def add_entry(self, entry):
         new_entry = self.entry_class(
@@ -9,8 +9,11 @@ class ShippingMethods(InfoClass):
     request_class = api_requests.GetShippingMethods
     entry_class = ShippingMethod
     info_list = []
-    vendors = []
-    vendor_lookup = {}
+
+    def __init__(self, api_session):
+        self.vendors = []
+        self.vendor_lookup = {}
+        super().__init__(api_session)
 
     def load_info(self):
         for service in self.request.response_dict:
@@ -0,0 +1,161 @@
+"""HTTP transport settings for ``LinnworksAPISession`` """
+
+import gzip
+import socket
+import threading
+from urllib.parse import urlencode
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that sets socket options on every new connection."""
+
+    def __init__(self, socket_options=None, **kwargs):
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class TransportProfile:
+    """Connection pooling, compression and keep alive settings.
+
+    Response bodies are always requested compressed with every encoding
+    ``urllib3`` can decode. Request bodies are only compressed if
+    ``compress_requests`` is True, as the server must accept
+    ``Content-Encoding: gzip`` on POST bodies.
+
+    Keyword arguments:
+        pool_connections -- Number of hosts to keep connection pools for.
+            (Default 4)
+        pool_maxsize -- Connections kept open per host. Should be at least
+            the number of threads sharing the session. (Default 16)
+        compress_requests -- If True form bodies longer than
+            ``compress_min_size`` bytes are sent gzipped. (Default False)
+        compress_min_size -- Smallest body in bytes to compress.
+            (Default 1024)
+        compress_level -- gzip compression level. (Default 6)
+        keep_alive -- If True TCP keep alive is enabled on connections.
+            (Default True)
+        keep_alive_idle -- Seconds a connection is idle before keep alive
+            probes are sent. (Default 60)
+        keep_alive_interval -- Seconds between keep alive probes.
+            (Default 15)
+        keep_alive_count -- Number of failed probes before the connection
+            is dropped. (Default 4)
+        timeout -- Seconds to wait for the server to connect or respond,
+            as one number or a (connect, read) tuple, or None to wait
+            forever. (Default (10, 300))
+    """
+
+    pool_connections = 4
+    pool_maxsize = 16
+    compress_requests = False
+    compress_min_size = 1024
+    compress_level = 6
+    keep_alive = True
+    keep_alive_idle = 60
+    keep_alive_interval = 15
+    keep_alive_count = 4
+    timeout = (10, 300)
+    accept_encoding = ACCEPT_ENCODING
+
+    def __init__(self, pool_connections=None, pool_maxsize=None,
+                 compress_requests=None, compress_min_size=None,
+                 compress_level=None, keep_alive=None, keep_alive_idle=None,
+                 keep_alive_interval=None, keep_alive_count=None,
+                 timeout=None):
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if compress_requests is not None:
+            self.compress_requests = compress_requests
+        if compress_min_size is not None:
+            self.compress_min_size = compress_min_size
+        if compress_level is not None:
+            self.compress_level = compress_level
+        if keep_alive is not None:
+            self.keep_alive = keep_alive
+        if keep_alive_idle is not None:
+            self.keep_alive_idle = keep_alive_idle
+        if keep_alive_interval is not None:
+            self.keep_alive_interval = keep_alive_interval
+        if keep_alive_count is not None:
+            self.keep_alive_count = keep_alive_count
+        if timeout is not None:
+            self.timeout = timeout
+        self.adapter = None
+        self.adapter_lock = threading.Lock()
+
+    def get_socket_options(self):
+        """Return socket options for new connections."""
+        options = list(HTTPConnection.default_socket_options)
+        if not self.keep_alive:
+            return options
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((
+                socket.IPPROTO_TCP, socket.TCP_KEEPIDLE,
+                self.keep_alive_idle))
+        elif hasattr(socket, 'TCP_KEEPALIVE'):
+            options.append((
+                socket.IPPROTO_TCP, socket.TCP_KEEPALIVE,
+                self.keep_alive_idle))
+        if hasattr(socket, 'TCP_KEEPINTVL'):
+            options.append((
+                socket.IPPROTO_TCP, socket.TCP_KEEPINTVL,
+                self.keep_alive_interval))
+        if hasattr(socket, 'TCP_KEEPCNT'):
+            options.append((
+                socket.IPPROTO_TCP, socket.TCP_KEEPCNT,
+                self.keep_alive_count))
+        return options
+
+    def get_adapter(self):
+        return KeepAliveHTTPAdapter(
+            socket_options=self.get_socket_options(),
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize)
+
+    def get_shared_adapter(self):
+        """Return the adapter shared by every session using the profile.
+
+        Sessions made for different threads share one connection pool, so
+        ``pool_maxsize`` limits connections for the whole profile.
+        """
+        with self.adapter_lock:
+            if self.adapter is None:
+                self.adapter = self.get_adapter()
+            return self.adapter
+
+    def configure(self, session):
+        """Apply the profile to a ``requests.Session``."""
+        adapter = self.get_shared_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Accept-Encoding'] = self.accept_encoding
+        return session
+
+    def prepare_data(self, data):
+        """Return POST data and extra headers for a request.
+
+        If request compression is on and the form encoded body is at least
+        ``compress_min_size`` bytes it is returned gzipped with the
+        matching headers. Otherwise data is returned unchanged.
+        """
+        if not self.compress_requests or not isinstance(data, dict):
+            return data, None
+        body = urlencode(data, doseq=True).encode('utf-8')
+        if len(body) < self.compress_min_size:
+            return data, None
+        headers = {
+            'Content-Encoding': 'gzip',
+            'Content-Type': 'application/x-www-form-urlencoded'}
+        return gzip.compress(body, self.compress_level), headers
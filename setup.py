@@ -21,5 +21,6 @@ setup(name='linnapi',
         'linnapi.api_requests.settings',
         'linnapi.inventory',
         'linnapi.orders',
+        'linnapi.processed_orders',
         'linnapi.settings'],
     package_data={'': ['config.json']})
@@ -0,0 +1,130 @@
+"""Stand-in for ``LinnworksAPISession`` that answers requests locally """
+
+import contextlib
+import io
+import json
+
+import requests
+
+from linnapi.settings.info_entry import InfoEntry
+
+
+def make_guid(number):
+    """Return a valid GUID made from number."""
+    return '00000000-0000-4000-8000-{:012d}'.format(number)
+
+
+DEFAULT_LOCATION_ID = make_guid(999999)
+
+
+class Lookup(dict):
+    """Settings lookup creating an entry for any name asked for."""
+
+    def __getitem__(self, key):
+        if key not in self:
+            self[key] = InfoEntry(key, key)
+        return dict.__getitem__(self, key)
+
+    @property
+    def ids(self):
+        return [entry.guid for entry in self.values()]
+
+
+class Channels:
+    sub_sources = []
+
+
+def make_response(body, status_code=200, url='http://fake'):
+    """Return ``requests.Response`` with body encoded as JSON."""
+    response = requests.Response()
+    response.status_code = status_code
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    response._content = body
+    response.url = url
+    response.encoding = 'utf-8'
+    response.raw = io.BytesIO(body)
+    return response
+
+
+class FakeSession:
+    """Session passing each request to ``handler``.
+
+    Arguments:
+        handler -- Callable taking the URL and data of a request and
+            returning the response body, or a (body, status_code) tuple.
+    """
+
+    server = 'http://fake'
+    response_cache = None
+    coalescer = None
+    circuit_breakers = None
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.locations = Lookup(
+            Default=InfoEntry(DEFAULT_LOCATION_ID, 'Default'))
+        self.categories = Lookup()
+        self.postage_services = Lookup()
+        self.package_groups = Lookup()
+        self.channels = Channels()
+
+    def request(self, url, data=None, params=None, files=None,
+                stream=False):
+        self.requests.append((url, data))
+        response = self.handler(url, data)
+        if not isinstance(response, tuple):
+            response = (response, )
+        return make_response(*response, url=url)
+
+    @contextlib.contextmanager
+    def priority(self, priority):
+        yield
+
+    def get_priority(self):
+        return None
+
+    def with_priority(self, priority, function):
+        return function
+
+
+def order_data(number, items=1):
+    """Return ``dict`` of an open order as returned by ``GetOpenOrders``."""
+    address = {
+        key: '' for key in (
+            'Address1', 'Address2', 'Address3', 'Company', 'Country',
+            'CountryId', 'EmailAddress', 'FullName', 'PhoneNumber',
+            'PostCode', 'Region', 'Town')}
+    return {
+        'OrderId': 'order-{}'.format(number),
+        'NumOrderId': number,
+        'FolderName': [],
+        'CustomerInfo': {
+            'Address': address, 'BillingAddress': {},
+            'ChannelBuyerName': ''},
+        'GeneralInfo': {
+            'ReceivedDate': '2020-01-01T00:00:00', 'SubSource': 'Shop',
+            'ExternalReferenceNum': '', 'HoldOrCancel': False,
+            'InvoicePrinted': False, 'LabelError': '',
+            'LabelPrinted': False, 'Marker': 0, 'Notes': 0,
+            'PartShipped': False, 'PickListPrinted': False,
+            'ReferenceNum': '', 'Status': 'PAID'},
+        'ShippingInfo': {
+            'ItemWeight': 0, 'ManualAdjust': False,
+            'PostalServiceId': 'postage', 'PackageCategoryId': 'package',
+            'PostageCost': 0, 'PostageCostExTax': 0, 'TotalWeight': 0,
+            'TrackingNumber': ''},
+        'TotalsInfo': {
+            key: 0 for key in (
+                'CountryTaxRate', 'Currency', 'PaymentMethod',
+                'PaymentMethodId', 'ProfitMargin', 'Subtotal', 'Tax',
+                'TotalCharge', 'TotalDiscount')},
+        'Items': [
+            {'SKU': 'SKU-{}-{}'.format(number, i), 'CategoryName': 'Cat',
+             'AvailableStock': 1, 'BarcodeNumber': '', 'ChannelSKU': '',
+             'ChannelTitle': '', 'InOrderBook': 0,
+             'ItemId': 'item-{}'.format(i), 'ItemNumber': '', 'Level': 1,
+             'Quantity': 1, 'Title': 'Item {}'.format(i), 'Weight': 0,
+             'BinRack': ''}
+            for i in range(items)]}
@@ -0,0 +1,57 @@
+import json
+import unittest
+
+import linnapi.api_requests as api_requests
+
+from tests.fake_session import FakeSession
+
+STOCK_ID = '8a1f3c52-9b7d-4e0a-b6c4-2d5e7f901234'
+
+
+class FakeSKUPool:
+
+    def __init__(self):
+        self.skus = ['POOL-1', 'POOL-2']
+
+    def get(self):
+        return self.skus.pop(0)
+
+
+class FakeSKULookup:
+
+    def add(self, sku, stock_id):
+        pass
+
+
+class TestAddInventoryItem(unittest.TestCase):
+
+    def setUp(self):
+        self.api_session = FakeSession(lambda url, data: b'')
+        self.api_session.sku_pool = FakeSKUPool()
+        self.api_session.sku_lookup = FakeSKULookup()
+
+    def sent_item(self):
+        url, data = self.api_session.requests[-1]
+        return json.loads(data['inventoryItem'])
+
+    def test_add_draws_sku_from_pool(self):
+        api_requests.AddInventoryItem(
+            self.api_session, STOCK_ID, None, 'Title')
+        self.assertEqual(self.sent_item()['ItemNumber'], 'POOL-1')
+
+    def test_update_requires_sku(self):
+        with self.assertRaises(ValueError):
+            api_requests.UpdateInventoryItem(
+                self.api_session, STOCK_ID, None, 'Title')
+        self.assertEqual(self.api_session.sku_pool.skus, ['POOL-1', 'POOL-2'])
+        self.assertEqual(self.api_session.requests, [])
+
+    def test_unset_guid_fields_are_not_sent(self):
+        api_requests.AddInventoryItem(
+            self.api_session, STOCK_ID, 'SKU', 'Title',
+            category_id='c4b1e2d3-0000-4000-8000-000000000001')
+        item = self.sent_item()
+        self.assertEqual(
+            item['CategoryId'], 'c4b1e2d3-0000-4000-8000-000000000001')
+        self.assertNotIn('PackageGroupId', item)
+        self.assertNotIn('PostalServiceId', item)
@@ -0,0 +1,124 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from linnapi.batch_loader import BatchLoader
+
+
+class RecordingLoader(BatchLoader):
+    """Loader returning each key doubled and recording its batches."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = []
+        self.calls_lock = threading.Lock()
+
+    def load_batch(self, keys):
+        with self.calls_lock:
+            self.calls.append(sorted(keys))
+        values = {}
+        for key in keys:
+            if key == 'missing':
+                continue
+            if key == 'bad':
+                values[key] = ValueError('bad key')
+            else:
+                values[key] = key * 2
+        return values
+
+
+class FailingLoader(BatchLoader):
+
+    def load_batch(self, keys):
+        raise RuntimeError('batch failed')
+
+
+class TestBatchLoader(unittest.TestCase):
+
+    def test_keys_within_window_are_one_batch(self):
+        loader = RecordingLoader(window=0.5)
+        barrier = threading.Barrier(10)
+
+        def load(key):
+            barrier.wait()
+            return loader.load(key)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            values = list(executor.map(load, range(10)))
+        self.assertEqual(values, [key * 2 for key in range(10)])
+        self.assertEqual(loader.calls, [list(range(10))])
+        self.assertEqual(loader.stats(), {'batches': 1, 'keys': 10})
+
+    def test_full_batch_does_not_wait_for_window(self):
+        loader = RecordingLoader(window=60, max_batch_size=4)
+        barrier = threading.Barrier(4)
+
+        def load(key):
+            barrier.wait()
+            return loader.load(key)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            values = list(executor.map(load, range(4)))
+        self.assertEqual(values, [0, 2, 4, 6])
+        self.assertEqual(loader.calls, [[0, 1, 2, 3]])
+
+    def test_keys_after_window_are_a_new_batch(self):
+        loader = RecordingLoader(window=0)
+        self.assertEqual(loader.load(1), 2)
+        self.assertEqual(loader.load(2), 4)
+        self.assertEqual(loader.calls, [[1], [2]])
+
+    def test_prefetch_serves_loads(self):
+        loader = RecordingLoader(max_batch_size=3)
+        with loader.prefetch(range(7)) as values:
+            self.assertEqual(len(values), 7)
+            self.assertEqual(
+                [loader.load(key) for key in range(7)],
+                [key * 2 for key in range(7)])
+        self.assertEqual(
+            sorted(loader.calls), [[0, 1, 2], [3, 4, 5], [6]])
+        loader.load(0)
+        self.assertEqual(len(loader.calls), 4)
+
+    def test_error_raised_for_its_key_only(self):
+        loader = RecordingLoader(window=0.5)
+        keys = ['a', 'bad', 'missing']
+        barrier = threading.Barrier(len(keys))
+        results = {}
+
+        def load(key):
+            barrier.wait()
+            try:
+                results[key] = loader.load(key)
+            except Exception as e:
+                results[key] = e
+
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            list(executor.map(load, keys))
+        self.assertEqual(len(loader.calls), 1)
+        self.assertEqual(results['a'], 'aa')
+        self.assertIsInstance(results['bad'], ValueError)
+        self.assertIsInstance(results['missing'], KeyError)
+
+    def test_failed_batch_raises_for_every_key(self):
+        loader = FailingLoader(window=0.5)
+        barrier = threading.Barrier(3)
+        errors = []
+
+        def load(key):
+            barrier.wait()
+            try:
+                loader.load(key)
+            except RuntimeError as e:
+                errors.append(e)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(load, range(3)))
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(loader.stats(), {'batches': 0, 'keys': 0})
+
+    def test_load_many_leaves_out_failed_keys(self):
+        loader = RecordingLoader()
+        self.assertEqual(
+            loader.load_many(['a', 'bad', 'missing', 'a']), {'a': 'aa'})
+        self.assertEqual(loader.calls, [['a', 'bad', 'missing']])
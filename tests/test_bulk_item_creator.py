@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import unittest
+
+from linnapi.inventory.bulk_item_creator import BulkItemCreator
+
+from tests.fake_session import FakeSession, make_guid
+
+
+class FakeSKUPool:
+
+    def __init__(self):
+        self.creator = None
+        self.drawn = 0
+        self.drawn_with_lock = 0
+
+    def get(self):
+        if self.creator is not None and self.creator.lock.locked():
+            self.drawn_with_lock += 1
+        self.drawn += 1
+        return 'POOL-{}'.format(self.drawn)
+
+
+class FakeSKULookup:
+
+    def __init__(self):
+        self.stock_ids = {}
+
+    def add(self, sku, stock_id):
+        self.stock_ids[sku] = stock_id
+
+    def fetch(self, skus):
+        return {sku: self.stock_ids.get(sku) for sku in skus}
+
+
+def handler(url, data):
+    if url.endswith('CreateInventoryItemExtendedProperties'):
+        return []
+    return b''
+
+
+class TestBulkItemCreator(unittest.TestCase):
+
+    def setUp(self):
+        self.api_session = FakeSession(handler)
+        self.api_session.sku_pool = FakeSKUPool()
+        self.api_session.sku_lookup = FakeSKULookup()
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.directory.name, 'checkpoint')
+        self.rows = [
+            {'title': 'Item {}'.format(i), 'extended_properties': {'a': i}}
+            for i in range(5)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def make_creator(self):
+        creator = BulkItemCreator(
+            self.api_session, self.rows, checkpoint=self.checkpoint,
+            max_workers=4, retries=0)
+        self.api_session.sku_pool.creator = creator
+        return creator
+
+    def sent(self, endpoint):
+        return [url for url, data in self.api_session.requests
+                if url.endswith(endpoint)]
+
+    def test_skus_are_drawn_without_lock(self):
+        created = self.make_creator().run()
+        self.assertEqual(len(created), 5)
+        self.assertEqual(self.api_session.sku_pool.drawn, 5)
+        self.assertEqual(self.api_session.sku_pool.drawn_with_lock, 0)
+
+    def test_checkpoint_is_appended_per_step(self):
+        self.make_creator().run()
+        with open(self.checkpoint) as checkpoint_file:
+            lines = checkpoint_file.read().splitlines()
+        # One entry per item then item_sent, item, extended_properties
+        # and images steps.
+        self.assertEqual(len(lines), 5 * 5)
+        self.assertEqual(json.loads(lines[0]).keys(), {
+            'item', 'stock_id', 'sku'})
+
+    def test_resume_skips_completed_steps(self):
+        created = self.make_creator().run()
+        self.api_session.requests = []
+        self.assertEqual(self.make_creator().run(), created)
+        self.assertEqual(self.api_session.requests, [])
+        self.assertEqual(self.api_session.sku_pool.drawn, 5)
+
+    def test_resume_after_interrupted_write(self):
+        creator = self.make_creator()
+        creator.record({'item': '0', 'stock_id': make_guid(1), 'sku': 'SKU-0'})
+        creator.close_checkpoint()
+        with open(self.checkpoint, 'a') as checkpoint_file:
+            checkpoint_file.write('{"item": "0", "st')
+        created = self.make_creator().run()
+        self.assertEqual(created['SKU-0'], make_guid(1))
+        self.assertEqual(len(self.sent('AddInventoryItem')), 5)
+        self.assertEqual(
+            len(self.sent('CreateInventoryItemExtendedProperties')), 5)
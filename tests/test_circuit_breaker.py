@@ -0,0 +1,111 @@
+import time
+import unittest
+
+import requests
+
+from linnapi.api_requests.request import Request
+from linnapi.circuit_breaker import CircuitBreaker, CircuitBreakers
+from linnapi.exceptions import CircuitOpenError
+
+from tests.fake_session import FakeSession, make_response
+
+
+class Ping(Request):
+    url_extension = '/api/Test/Ping'
+
+    def get_data(self):
+        return {}
+
+    def get_params(self):
+        return {}
+
+    def get_files(self):
+        return None
+
+    def test_response(self, response):
+        return False
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.breaker = CircuitBreaker(
+            '/api/Test/Ping', failure_threshold=2, reset_timeout=0.05)
+
+    def open_breaker(self):
+        for i in range(2):
+            self.breaker.before_request()
+            self.breaker.record(None)
+
+    def test_opens_after_threshold(self):
+        self.open_breaker()
+        self.assertEqual(self.breaker.get_state(), 'open')
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_request()
+
+    def test_throttled_response_is_not_a_failure(self):
+        for i in range(3):
+            self.breaker.record(make_response({}, 429))
+        self.assertEqual(self.breaker.get_state(), 'closed')
+
+    def test_half_open_trial_closes_on_success(self):
+        self.open_breaker()
+        time.sleep(0.06)
+        self.breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_request()
+        self.breaker.record(make_response({}))
+        self.assertEqual(self.breaker.get_state(), 'closed')
+
+    def test_half_open_trial_reopens_on_failure(self):
+        self.open_breaker()
+        time.sleep(0.06)
+        self.breaker.before_request()
+        self.breaker.record(make_response({}, 500))
+        self.assertEqual(self.breaker.get_state(), 'open')
+
+    def test_endpoint_settings(self):
+        breakers = CircuitBreakers(
+            failure_threshold=3, endpoints={'/slow': {'reset_timeout': 5}})
+        self.assertEqual(breakers.get('/slow').reset_timeout, 5)
+        self.assertEqual(breakers.get('/slow').failure_threshold, 3)
+        self.assertIs(breakers.get('/fast'), breakers.get('/fast'))
+
+
+class TestRequestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.responses = []
+        self.api_session = FakeSession(self.handle)
+        self.api_session.circuit_breakers = CircuitBreakers(
+            failure_threshold=2, reset_timeout=0.05)
+        self.breaker = self.api_session.circuit_breakers.get(
+            Ping.url_extension)
+
+    def handle(self, url, data):
+        response = self.responses.pop(0)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    def fail_endpoint(self):
+        self.responses = [({}, 500), requests.ConnectionError()]
+        Ping(self.api_session)
+        with self.assertRaises(requests.ConnectionError):
+            Ping(self.api_session)
+
+    def test_fast_fail_without_sending(self):
+        self.fail_endpoint()
+        with self.assertRaises(CircuitOpenError):
+            Ping(self.api_session)
+        self.assertEqual(len(self.api_session.requests), 2)
+
+    def test_trial_released_after_other_exception(self):
+        self.fail_endpoint()
+        time.sleep(0.06)
+        self.responses = [ValueError('token refresh failed'), {}]
+        with self.assertRaises(ValueError):
+            Ping(self.api_session)
+        self.assertEqual(self.breaker.get_state(), 'half_open')
+        Ping(self.api_session)
+        self.assertEqual(self.breaker.get_state(), 'closed')
@@ -0,0 +1,55 @@
+import threading
+import unittest
+
+import linnapi.api_requests as api_requests
+from linnapi.api_requests import decoders
+from linnapi.coalescer import RequestCoalescer
+
+from tests.fake_session import FakeSession
+
+STOCK_ID = '8a1f3c52-9b7d-4e0a-b6c4-2d5e7f901234'
+
+
+class TestCoalescedRequests(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.api_session = FakeSession(self.handle)
+        self.api_session.coalescer = RequestCoalescer()
+        self.decoded = 0
+        self.decode_lock = threading.Lock()
+        self.previous_decoder = decoders.decoder
+        decoders.set_decoder(self.decode)
+
+    def tearDown(self):
+        decoders.set_decoder(self.previous_decoder)
+
+    def decode(self, content):
+        with self.decode_lock:
+            self.decoded += 1
+        return decoders.decode_stdlib(content)
+
+    def handle(self, url, data):
+        self.release.wait(5)
+        return {'StockItemId': STOCK_ID}
+
+    def test_waiters_share_decoded_response(self):
+        results = []
+
+        def get_item():
+            results.append(api_requests.GetInventoryItemByID(
+                self.api_session, STOCK_ID))
+
+        threads = [threading.Thread(target=get_item) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        while self.api_session.coalescer.hits < 3:
+            threading.Event().wait(0.01)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.api_session.requests), 1)
+        self.assertEqual(self.decoded, 1)
+        self.assertEqual(
+            [request.response_dict['StockItemId'] for request in results],
+            [STOCK_ID] * 4)
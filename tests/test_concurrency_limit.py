@@ -0,0 +1,125 @@
+import email.utils
+import unittest
+from unittest import mock
+
+from linnapi.concurrency_limit import (
+    AdaptiveConcurrencyLimit, get_retry_after)
+
+from tests.fake_session import make_response
+
+NOW = 1600000000.0
+
+
+def response(status_code, retry_after=None):
+    response = make_response(b'', status_code)
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+
+class TestAdaptiveConcurrencyLimit(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('linnapi.concurrency_limit.time')
+        self.time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.time.time.return_value = NOW
+        self.time.monotonic.return_value = 1000.0
+
+    def advance(self, seconds):
+        self.time.time.return_value += seconds
+        self.time.monotonic.return_value += seconds
+
+    def reasons(self, limit):
+        return [reason for _, _, reason in limit.history]
+
+    def test_successes_increase_limit(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=4, max_limit=6)
+        for _ in range(4):
+            limit.record('/api/Test', 0.1, response(200))
+        self.assertEqual(limit.get_limit(), 4)
+        limit.record('/api/Test', 0.1, response(200))
+        self.assertEqual(limit.get_limit(), 5)
+        for _ in range(20):
+            limit.record('/api/Test', 0.1, response(200))
+        self.assertEqual(limit.get_limit(), 6)
+        self.assertEqual(limit.history[-1][1:], (6, 'increase'))
+        self.assertEqual(
+            self.reasons(limit), ['start', 'increase', 'increase'])
+
+    def test_error_halves_limit_once_per_cooldown(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=16, cooldown=1.0)
+        limit.record('/api/Test', 0.1, response(500))
+        limit.record('/api/Test', 0.1, response(503))
+        limit.record('/api/Test', 0.1, None)
+        self.assertEqual(limit.get_limit(), 8)
+        self.advance(1.0)
+        limit.record('/api/Test', 0.1, response(502))
+        self.assertEqual(limit.get_limit(), 4)
+        self.assertEqual(limit.get_delay(), 0.0)
+        stats = limit.stats()
+        self.assertEqual(stats['errors'], 4)
+        self.assertEqual(stats['responses'], 4)
+        self.assertEqual(
+            [entry[1:] for entry in stats['history']],
+            [(16, 'start'), (8, 'error'), (4, 'error')])
+
+    def test_limit_does_not_fall_below_minimum(self):
+        limit = AdaptiveConcurrencyLimit(
+            initial_limit=2, min_limit=2, cooldown=0)
+        for _ in range(3):
+            limit.record('/api/Test', 0.1, response(500))
+        self.assertEqual(limit.get_limit(), 2)
+        self.assertEqual(self.reasons(limit), ['start'])
+
+    def test_throttle_uses_retry_after_seconds(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=10)
+        limit.record('/api/Test', 0.1, response(429, '30'))
+        self.assertEqual(limit.get_limit(), 5)
+        self.assertEqual(limit.get_delay(), 30.0)
+        self.advance(10)
+        self.assertEqual(limit.get_delay(), 20.0)
+        stats = limit.stats()
+        self.assertEqual(stats['throttled'], 1)
+        self.assertEqual(stats['throttled_for'], 20.0)
+        self.assertEqual(stats['history'][-1], (NOW, 5, 'throttled'))
+
+    def test_throttle_uses_retry_after_date(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=10)
+        date = email.utils.formatdate(NOW + 45, usegmt=True)
+        limit.record('/api/Test', 0.1, response(429, date))
+        self.assertEqual(limit.get_delay(), 45.0)
+
+    def test_throttle_without_retry_after_uses_default(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=10)
+        limit.record('/api/Test', 0.1, response(429))
+        self.assertEqual(limit.get_delay(), limit.default_retry_after)
+
+    def test_shorter_retry_after_does_not_shorten_delay(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=10, cooldown=0)
+        limit.record('/api/Test', 0.1, response(429, '30'))
+        limit.record('/api/Test', 0.1, response(429, '5'))
+        self.assertEqual(limit.get_delay(), 30.0)
+        self.assertEqual(limit.get_limit(), 2)
+
+    def test_rising_latency_decreases_limit(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=10, cooldown=0)
+        limit.record('/api/Slow', 1.0, response(200))
+        limit.record('/api/Fast', 0.01, response(200))
+        self.assertEqual(limit.latency_ratio, 1.0)
+        for _ in range(20):
+            limit.record('/api/Fast', 0.1, response(200))
+        self.assertEqual(self.reasons(limit)[-1], 'latency')
+        self.assertLess(limit.get_limit(), 10)
+
+
+class TestGetRetryAfter(unittest.TestCase):
+
+    def test_values(self):
+        self.assertIsNone(get_retry_after(None))
+        self.assertIsNone(get_retry_after(response(429)))
+        self.assertEqual(get_retry_after(response(429, '2.5')), 2.5)
+        self.assertEqual(get_retry_after(response(429, '-1')), 0.0)
+        self.assertIsNone(get_retry_after(response(429, 'soon')))
+        past = email.utils.formatdate(0, usegmt=True)
+        self.assertEqual(get_retry_after(response(429, past)), 0.0)
@@ -0,0 +1,57 @@
+import json
+import unittest
+
+from linnapi.inventory.field_updater import InventoryFieldUpdater
+from linnapi.inventory.sku_lookup import SKULookup
+
+from tests.fake_session import FakeSession
+
+STOCK_ID = '8a1f3c52-9b7d-4e0a-b6c4-2d5e7f901234'
+
+
+class FakeSKULookup:
+
+    def add(self, sku, stock_id):
+        pass
+
+
+class TestInventoryFieldUpdater(unittest.TestCase):
+
+    def setUp(self):
+        self.item = {
+            'StockItemId': STOCK_ID, 'ItemNumber': 'SKU', 'ItemTitle': 'Old',
+            'BarcodeNumber': '', 'PurchasePrice': 1.0, 'RetailPrice': 2.0,
+            'Quantity': 5, 'TaxRate': 20, 'VariationGroupName': '',
+            'MetaData': '', 'CategoryId': None, 'PackageGroupId': None,
+            'PostalServiceId': None, 'Weight': 0, 'Width': 0, 'Depth': 0,
+            'Height': 0}
+        self.api_session = FakeSession(self.handle)
+        self.api_session.sku_lookup = FakeSKULookup()
+
+    def handle(self, url, data):
+        if url.endswith('GetInventoryItemById'):
+            return self.item
+        return b''
+
+    def test_whole_item_update_does_not_send_stock_level(self):
+        report = InventoryFieldUpdater(self.api_session).update(
+            [STOCK_ID], {
+                'Title': ['New'], 'RetailPrice': [3.5], 'Weight': [10]})
+        self.assertEqual(report.updated, [STOCK_ID])
+        url, data = self.api_session.requests[-1]
+        self.assertTrue(url.endswith('UpdateInventoryItem'))
+        item = json.loads(data['inventoryItem'])
+        self.assertEqual(item['ItemTitle'], 'New')
+        self.assertEqual(item['RetailPrice'], '3.5')
+        self.assertNotIn('Quantity', item)
+
+    def test_sku_field_update_renames_lookup_entry(self):
+        self.api_session.sku_lookup = SKULookup(self.api_session)
+        self.api_session.sku_lookup.add('SKU', STOCK_ID)
+        report = InventoryFieldUpdater(self.api_session).update(
+            [STOCK_ID], {'SKU': ['NEW-SKU']})
+        self.assertEqual(report.updated, [STOCK_ID])
+        url, data = self.api_session.requests[-1]
+        self.assertTrue(url.endswith('UpdateInventoryItemField'))
+        self.assertNotIn('SKU', self.api_session.sku_lookup)
+        self.assertEqual(self.api_session.sku_lookup['NEW-SKU'], STOCK_ID)
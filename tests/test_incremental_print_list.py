@@ -0,0 +1,112 @@
+import copy
+import unittest
+
+from linnapi.orders.incremental_print_list import IncrementalPrintList
+
+from tests.fake_session import FakeSession, order_data
+
+
+def make_order(number, country='UK', service='Post', status='PAID',
+               category='Cat'):
+    data = order_data(number)
+    data['CustomerInfo']['Address']['Country'] = country
+    data['ShippingInfo']['PostalServiceId'] = service
+    data['GeneralInfo']['Status'] = status
+    data['Items'][0]['CategoryName'] = category
+    return data
+
+
+class PaidPrintList(IncrementalPrintList):
+    paid = 'PAID'
+    batch_size = 2
+
+
+class TestIncrementalPrintList(unittest.TestCase):
+
+    def setUp(self):
+        self.api_session = FakeSession(lambda url, data: {})
+        self.print_list = PaidPrintList(self.api_session, load=False)
+        self.orders = [
+            make_order(1), make_order(2, country='FR'),
+            make_order(3, status='UNPAID'), make_order(4, service='Courier')]
+        self.print_list.apply_snapshot(self.orders)
+
+    def ids(self, orders):
+        return [order.order_id for order in orders.orders]
+
+    def test_initial_snapshot(self):
+        self.assertEqual(len(self.print_list), 4)
+        self.assertEqual(self.print_list.last_delta, {
+            'added': ['order-1', 'order-2', 'order-3', 'order-4'],
+            'changed': [], 'removed': []})
+        self.assertEqual(self.print_list.to_print_ids, {
+            'order-1', 'order-2', 'order-4'})
+        self.assertEqual(
+            [self.ids(orders) for orders in self.print_list.print_lists],
+            [['order-1', 'order-2'], ['order-4']])
+
+    def test_delta(self):
+        orders = copy.deepcopy(self.orders)
+        orders[0]['GeneralInfo']['Status'] = 'UNPAID'
+        orders[2]['GeneralInfo']['Status'] = 'PAID'
+        del orders[1]
+        orders.append(make_order(5, country='DE'))
+        unchanged = self.print_list.orders['order-4']
+        delta = self.print_list.apply_snapshot(orders)
+        self.assertEqual(delta, {
+            'added': ['order-5'], 'changed': ['order-1', 'order-3'],
+            'removed': ['order-2']})
+        self.assertIs(self.print_list.orders['order-4'], unchanged)
+        self.assertEqual(self.print_list.to_print_ids, {
+            'order-3', 'order-4', 'order-5'})
+        self.assertEqual(
+            [self.ids(orders) for orders in self.print_list.print_lists],
+            [['order-3', 'order-4'], ['order-5']])
+
+    def test_unchanged_snapshot_keeps_print_lists(self):
+        print_lists = self.print_list.print_lists
+        delta = self.print_list.apply_snapshot(copy.deepcopy(self.orders))
+        self.assertEqual(
+            delta, {'added': [], 'changed': [], 'removed': []})
+        self.assertIs(self.print_list.print_lists, print_lists)
+
+    def test_buckets_follow_changes(self):
+        buckets = self.print_list.buckets
+        self.assertEqual(buckets['country'], {
+            'UK': {'order-1', 'order-3', 'order-4'}, 'FR': {'order-2'}})
+        orders = copy.deepcopy(self.orders)
+        orders[1]['CustomerInfo']['Address']['Country'] = 'DE'
+        orders[3]['ShippingInfo']['PostalServiceId'] = 'Post'
+        del orders[2]
+        self.print_list.apply_snapshot(orders)
+        self.assertEqual(buckets['country'], {
+            'UK': {'order-1', 'order-4'}, 'DE': {'order-2'}})
+        self.assertEqual(buckets['shipping_service'], {
+            'Post': {'order-1', 'order-2', 'order-4'}})
+        self.assertEqual(buckets['paid'], {
+            'PAID': {'order-1', 'order-2', 'order-4'}})
+
+    def test_select(self):
+        self.assertEqual(
+            self.ids(self.print_list.select(countries=['UK'])),
+            ['order-1', 'order-4'])
+        self.assertEqual(
+            self.ids(self.print_list.select(
+                countries=['UK'], to_print_only=False)),
+            ['order-1', 'order-3', 'order-4'])
+        self.assertEqual(
+            self.ids(self.print_list.select(
+                countries=['UK', 'FR'], shipping_services=['Post'])),
+            ['order-1', 'order-2'])
+        self.assertEqual(
+            self.ids(self.print_list.select(paid='UNPAID')), [])
+        self.assertEqual(
+            self.ids(self.print_list.select(to_print_only=False)),
+            ['order-1', 'order-2', 'order-3', 'order-4'])
+
+    def test_select_keeps_snapshot_order(self):
+        orders = list(reversed(self.orders))
+        self.print_list.apply_snapshot(orders)
+        self.assertEqual(
+            self.ids(self.print_list.select()),
+            ['order-4', 'order-2', 'order-1'])
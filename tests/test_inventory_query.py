@@ -0,0 +1,101 @@
+import json
+import unittest
+
+from linnapi.inventory.inventory_query import InventoryQuery
+
+from tests.fake_session import FakeSession, DEFAULT_LOCATION_ID, make_guid
+
+COLUMN_TYPES = [{
+    'ColumnName': 'BinRack', 'DisplayName': 'Bin Rack', 'Field': 'String',
+    'Group': 'Location', 'IsEditable': True, 'SortDirection': None,
+    'Width': 100.0}]
+
+
+class TestInventoryQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [{'Id': make_guid(i), 'SKU': str(i)} for i in range(5)]
+        self.api_session = FakeSession(self.handle)
+        self.api_session.inventory_column_types = None
+
+    def handle(self, url, data):
+        if url.endswith('GetInventoryColumnTypes'):
+            return COLUMN_TYPES
+        start = data['startIndex']
+        items = self.items[start:start + data['itemsCount']]
+        return {'Items': items, 'TotalItems': len(self.items)}
+
+    def sent(self, endpoint):
+        return [
+            data for url, data in self.api_session.requests
+            if url.endswith('/' + endpoint)]
+
+    def test_view_has_only_selected_columns(self):
+        query = InventoryQuery(self.api_session).select(
+            'Available', 'SKU', 'BinRack', 'SKU')
+        view = json.loads(query.to_json())
+        self.assertEqual(
+            [column['ColumnName'] for column in view['Columns']],
+            ['Available', 'SKU', 'BinRack'])
+        self.assertEqual(view['Columns'][0]['Field'], 'Int')
+        self.assertEqual(view['Columns'][2]['DisplayName'], 'Bin Rack')
+        self.assertEqual(view['Filters'], [])
+
+    def test_column_types_requested_once_per_session(self):
+        InventoryQuery(self.api_session).select('BinRack').to_json()
+        InventoryQuery(self.api_session).where('BinRack', 'A1').to_json()
+        self.assertEqual(len(self.sent('GetInventoryColumnTypes')), 1)
+
+    def test_standard_columns_do_not_request_column_types(self):
+        InventoryQuery(self.api_session).select('SKU', 'Title').to_json()
+        self.assertEqual(self.api_session.requests, [])
+
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            InventoryQuery(self.api_session).select('Colour').to_json()
+
+    def test_filters(self):
+        query = InventoryQuery(self.api_session).select('SKU')
+        query.where('Available', 0, condition='Greater')
+        query.where_any('SKU', ['A', 'B'])
+        filters = json.loads(query.to_json())['Filters']
+        self.assertEqual(filters[0], {
+            'Value': 0, 'Field': 'Int', 'FilterName': 'Available',
+            'FilterNameExact': '', 'Condition': 'Greater'})
+        self.assertEqual(
+            [(f['Value'], f['Type']) for f in filters[1:]],
+            [('A', 'Or'), ('B', 'Or')])
+
+    def test_json_compiled_until_changed(self):
+        query = InventoryQuery(self.api_session).select('SKU')
+        view_json = query.to_json()
+        self.assertIs(query.to_json(), view_json)
+        query.select('Title')
+        self.assertIsNot(query.to_json(), view_json)
+        self.assertEqual(len(json.loads(query.to_json())['Columns']), 2)
+
+    def test_copy_is_independent(self):
+        query = InventoryQuery(self.api_session).select('SKU')
+        copied = query.copy().select('Title').where('SKU', 'A')
+        self.assertEqual(len(json.loads(query.to_json())['Columns']), 1)
+        self.assertEqual(json.loads(query.to_json())['Filters'], [])
+        self.assertEqual(len(json.loads(copied.to_json())['Filters']), 1)
+
+    def test_pages(self):
+        query = InventoryQuery(self.api_session, page_size=2).select('SKU')
+        self.assertEqual(query.all(), self.items)
+        pages = self.sent('GetInventoryItems')
+        self.assertEqual(
+            [(data['startIndex'], data['itemsCount']) for data in pages],
+            [(0, 2), (2, 2), (4, 2)])
+        self.assertEqual(len({data['view'] for data in pages}), 1)
+        self.assertEqual(
+            json.loads(pages[0]['stockLocationIds']), [DEFAULT_LOCATION_ID])
+
+    def test_count_and_locations(self):
+        location_id = make_guid(5)
+        query = InventoryQuery(self.api_session).locations(location_id)
+        self.assertEqual(query.count(), 5)
+        data, = self.sent('GetInventoryItems')
+        self.assertEqual(data['itemsCount'], 1)
+        self.assertEqual(json.loads(data['stockLocationIds']), [location_id])
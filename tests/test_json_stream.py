@@ -0,0 +1,84 @@
+import json
+import unittest
+
+from linnapi.api_requests.json_stream import JSONArrayStream
+
+ELEMENTS = [
+    {'SKU': 'A,B]', 'Title': 'Quote \" and \\\\ backslash', 'Level': 12345},
+    -1.5e10, 0, 987654321, 'text with ] and }', True, False, None,
+    [1, [2, {'a': []}]], {}, '',
+    {'Title': 'Café €5 \U0001f600', 'Price': 10.25}]
+
+
+def split(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestJSONArrayStream(unittest.TestCase):
+
+    def assert_all_splits(self, body, expected, **kwargs):
+        for size in range(1, len(body) + 1):
+            stream = JSONArrayStream(split(body, size), **kwargs)
+            self.assertEqual(list(stream), expected, 'chunk size {}'.format(
+                size))
+        return stream
+
+    def test_chunk_boundaries(self):
+        body = json.dumps(ELEMENTS).encode()
+        self.assert_all_splits(body, ELEMENTS)
+
+    def test_multibyte_characters_split_across_chunks(self):
+        body = json.dumps(ELEMENTS, ensure_ascii=False).encode('utf-8')
+        self.assertGreater(len(body), len(body.decode('utf-8')))
+        self.assert_all_splits(body, ELEMENTS)
+
+    def test_numbers_split_across_chunks(self):
+        numbers = [1234567890, -0.000123, 6.02e23, 42]
+        body = json.dumps(numbers).replace(', ', ',').encode()
+        self.assert_all_splits(body, numbers)
+        self.assertEqual(list(JSONArrayStream([b'[12', b'34]'])), [1234])
+        self.assertEqual(list(JSONArrayStream([b'[1.', b'5e', b'2]'])), [150])
+
+    def test_empty_array(self):
+        self.assertEqual(list(JSONArrayStream([b' [ ', b' ] '])), [])
+        self.assertEqual(
+            list(JSONArrayStream([b'{"Data": []}'], key='Data')), [])
+
+    def test_values_around_keyed_array(self):
+        body = json.dumps({
+            'PageNumber': 1, 'Data': ELEMENTS, 'TotalEntries': 12,
+            'Extra': {'Nested': [1, 2]}}).encode()
+        stream = self.assert_all_splits(body, ELEMENTS, key='Data')
+        self.assertEqual(stream.values, {
+            'PageNumber': 1, 'TotalEntries': 12,
+            'Extra': {'Nested': [1, 2]}})
+
+    def test_values_are_not_available_before_iteration_ends(self):
+        body = b'{"Data": [1, 2], "TotalEntries": 2}'
+        stream = JSONArrayStream(split(body, 4), key='Data')
+        iterator = iter(stream)
+        self.assertEqual(next(iterator), 1)
+        self.assertNotIn('TotalEntries', stream.values)
+        self.assertEqual(list(iterator), [2])
+        self.assertEqual(stream.values, {'TotalEntries': 2})
+
+    def test_key_not_an_array_is_stored(self):
+        stream = JSONArrayStream([b'{"Data": null, "Count": 0}'], key='Data')
+        self.assertEqual(list(stream), [])
+        self.assertEqual(stream.values, {'Data': None, 'Count': 0})
+
+    def test_buffer_holds_one_element_at_a_time(self):
+        body = json.dumps([{'n': i, 'pad': 'x' * 50} for i in range(200)])
+        stream = JSONArrayStream(split(body.encode(), 64), max_buffer_size=200)
+        self.assertEqual(len(list(stream)), 200)
+
+    def test_element_larger_than_max_buffer_size(self):
+        body = json.dumps([1, 'x' * 500, 2]).encode()
+        stream = JSONArrayStream(split(body, 64), max_buffer_size=200)
+        with self.assertRaises(ValueError):
+            list(stream)
+
+    def test_invalid_bodies(self):
+        for body in (b'', b'[1, 2', b'{"Data": 1}', b'[1 2]', b'[1, ]'):
+            with self.assertRaises(ValueError, msg=body):
+                list(JSONArrayStream(split(body, 2)))
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+import unittest
+
+import linnapi.inventory
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def get_imported(self, statement):
+        """Return names of linnapi and requests modules loaded by statement
+        in a new interpreter.
+        """
+        code = (
+            statement + '\nimport sys\n'
+            'print(" ".join(name for name in sys.modules '
+            'if name.split(".")[0] in ("linnapi", "requests")))')
+        output = subprocess.check_output([sys.executable, '-c', code])
+        return set(output.decode().split())
+
+    def test_session_import_is_lazy(self):
+        imported = self.get_imported(
+            'from linnapi import LinnworksAPISession')
+        self.assertIn('linnapi.linnworks_api_session', imported)
+        for name in ('requests', 'linnapi.inventory', 'linnapi.settings',
+                     'linnapi.api_requests.request'):
+            self.assertNotIn(name, imported)
+
+    def test_inventory_names(self):
+        for name in linnapi.inventory.__all__:
+            self.assertEqual(getattr(linnapi.inventory, name).__name__, name)
@@ -0,0 +1,40 @@
+import unittest
+
+from linnapi.orders.open_order import OpenOrder
+
+from tests.fake_session import FakeSession, order_data
+
+
+class TestOpenOrderLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.api_session = FakeSession(lambda url, data: {})
+
+    def load(self, data):
+        order = OpenOrder(self.api_session)
+        order.load_from_request(data)
+        return order
+
+    def test_order_with_items(self):
+        order = self.load(order_data(1, items=2))
+        self.assertEqual(len(order.items), 2)
+        self.assertEqual(order.items[0].sku, 'SKU-1-0')
+        self.assertFalse(order.unlinked)
+        self.assertEqual(order.category.name, 'Cat')
+
+    def test_order_without_items(self):
+        order = self.load(order_data(2, items=0))
+        self.assertEqual(order.items, [])
+        self.assertFalse(order.unlinked)
+        self.assertEqual(order.category.name, 'None')
+
+    def test_unlinked_item(self):
+        data = order_data(3)
+        data['Items'][0]['SKU'] = None
+        order = self.load(data)
+        self.assertTrue(order.unlinked)
+
+    def test_orders_do_not_share_items(self):
+        first = self.load(order_data(4))
+        second = self.load(order_data(5))
+        self.assertIsNot(first.items, second.items)
@@ -0,0 +1,120 @@
+import unittest
+
+from linnapi.orders.open_order import OpenOrder
+from linnapi.orders.print_list import PrintList
+from linnapi.orders.print_list_pipeline import PrintListPipeline
+
+from tests.fake_session import FakeSession, order_data
+
+ORDERS = [
+    # number, country, service, paid, label printed, bin rack, received
+    (1, 'UK', 'Post', 'PAID', False, 'B2', '2020-01-03T09:00:00'),
+    (2, 'FR', 'Courier', 'PAID', False, 'A1', '2020-01-01T09:00:00'),
+    (3, 'UK', 'Post', 'UNPAID', False, 'A2', '2020-01-02T09:00:00'),
+    (4, 'UK', 'Courier', 'PAID', True, 'C1', '2020-01-02T08:00:00'),
+    (5, 'DE', 'Post', 'PAID', False, 'A1', '2020-01-02T10:00:00'),
+    (6, 'UK', 'Post', 'PAID', False, 'A1', '2020-01-01T12:00:00'),
+]
+
+
+def make_data(number, country, service, paid, label_printed, bin_rack,
+              received):
+    data = order_data(number, items=2)
+    data['CustomerInfo']['Address']['Country'] = country
+    data['ShippingInfo']['PostalServiceId'] = service
+    data['GeneralInfo']['Status'] = paid
+    data['GeneralInfo']['LabelPrinted'] = label_printed
+    data['GeneralInfo']['ReceivedDate'] = received
+    data['Items'][0]['BinRack'] = 'Z9'
+    data['Items'][1]['BinRack'] = bin_rack
+    return data
+
+
+class TestPrintListPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.api_session = FakeSession(self.handle)
+        self.orders = []
+        for row in ORDERS:
+            order = OpenOrder(self.api_session)
+            order.load_from_request(make_data(*row))
+            self.orders.append(order)
+
+    def handle(self, url, data):
+        return {'Data': [make_data(*row) for row in ORDERS]}
+
+    def numbers(self, orders):
+        return [int(order.order_number) for order in orders]
+
+    def test_predicate(self):
+        pipeline = PrintListPipeline(
+            paid='PAID', shipping_label_printed=False, countries=['UK', 'DE'])
+        self.assertEqual(
+            self.numbers(pipeline.filter(self.orders)), [1, 5, 6])
+        pipeline = PrintListPipeline(shipping_services=('Courier', ))
+        self.assertEqual(self.numbers(pipeline.filter(self.orders)), [2, 4])
+        pipeline = PrintListPipeline(categories=['Other'])
+        self.assertEqual(pipeline.filter(self.orders), [])
+        self.assertEqual(
+            len(PrintListPipeline().filter(self.orders)), len(ORDERS))
+
+    def test_partition_keeps_first_seen_order(self):
+        pipeline = PrintListPipeline(group_by='country')
+        self.assertEqual(
+            [self.numbers(group)
+             for group in pipeline.partition(self.orders)],
+            [[1, 3, 4, 6], [2], [5]])
+        pipeline = PrintListPipeline(group_by=lambda order: order.paid)
+        self.assertEqual(
+            [self.numbers(group)
+             for group in pipeline.partition(self.orders)],
+            [[1, 2, 4, 5, 6], [3]])
+
+    def test_sort_is_stable_across_keys(self):
+        pipeline = PrintListPipeline(
+            sort_by=['bin_location', ('date_recieved', True)])
+        self.assertEqual(
+            self.numbers(pipeline.sort(self.orders)), [5, 6, 2, 3, 1, 4])
+        pipeline = PrintListPipeline(sort_by=['shipping_service'])
+        self.assertEqual(
+            self.numbers(pipeline.sort(self.orders)), [2, 4, 1, 3, 5, 6])
+
+    def test_invalid_key(self):
+        with self.assertRaises(ValueError):
+            PrintListPipeline(sort_by=['colour'])
+        with self.assertRaises(ValueError):
+            PrintListPipeline(group_by='colour')
+
+    def test_batch(self):
+        pipeline = PrintListPipeline(batch_size=4)
+        self.assertEqual(
+            [self.numbers(batch) for batch in pipeline.batch(self.orders)],
+            [[1, 2, 3, 4], [5, 6]])
+        self.assertEqual(pipeline.batch([]), [[]])
+        self.assertEqual(
+            len(PrintListPipeline().batch(self.orders)[0]), len(ORDERS))
+
+    def test_run(self):
+        pipeline = PrintListPipeline(
+            paid='PAID', group_by='shipping_service',
+            sort_by=['order_number'], batch_size=2)
+        self.assertEqual(
+            [self.numbers(batch) for batch in pipeline.run(self.orders)],
+            [[1, 5], [6], [2, 4]])
+
+    def test_print_list_uses_pipeline(self):
+
+        class UKPrintList(PrintList):
+            countries = ['UK']
+            shipping_label_printed = False
+            group_by = 'shipping_service'
+            sort_by = ['bin_location']
+            batch_size = 1
+
+        print_list = UKPrintList(self.api_session)
+        open_orders = print_list.all_open_orders
+        self.assertEqual(
+            [self.numbers(orders.orders)
+             for orders in print_list.print_lists], [[6], [3], [1]])
+        self.assertTrue(print_list.order_to_be_printed(open_orders['1']))
+        self.assertFalse(print_list.order_to_be_printed(open_orders['4']))
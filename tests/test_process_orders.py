@@ -0,0 +1,49 @@
+import unittest
+
+from linnapi.orders.process_orders import process_orders
+
+from tests.fake_session import FakeSession
+
+
+class TestProcessOrders(unittest.TestCase):
+
+    def setUp(self):
+        self.open_order_ids = ['stuck']
+        self.api_session = FakeSession(self.handle)
+
+    def handle(self, url, data):
+        if url.endswith('GetAllOpenOrders'):
+            return self.open_order_ids
+        order_id = data['orderId']
+        if order_id == 'unknown':
+            return {'Message': 'Order not found'}, 400
+        if order_id == 'refused':
+            return {'Processed': False, 'Error': 'Not enough stock'}
+        return {'Processed': True}
+
+    def open_order_requests(self):
+        return [
+            url for url, data in self.api_session.requests
+            if url.endswith('GetAllOpenOrders')]
+
+    def test_report(self):
+        report = process_orders(
+            self.api_session, ['done', 'stuck', 'refused', 'unknown'])
+        self.assertEqual(report.processed, ['done'])
+        self.assertEqual(
+            set(report.failed), {'stuck', 'refused', 'unknown'})
+        self.assertEqual(report.failed['stuck'], 'Order is still open.')
+        self.assertEqual(report.failed['refused'], 'Not enough stock')
+        self.assertIn('400', report.failed['unknown'])
+        self.assertEqual(len(self.open_order_requests()), 1)
+
+    def test_errors_are_not_confirmed(self):
+        report = process_orders(self.api_session, ['unknown', 'refused'])
+        self.assertEqual(report.processed, [])
+        self.assertEqual(len(report.failed), 2)
+        self.assertEqual(self.open_order_requests(), [])
+
+    def test_duplicate_order_ids(self):
+        report = process_orders(self.api_session, ['done', 'done'])
+        self.assertEqual(report.processed, ['done'])
+        self.assertEqual(len(report), 1)
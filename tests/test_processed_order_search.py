@@ -0,0 +1,46 @@
+import datetime
+import unittest
+
+from linnapi.processed_orders.processed_order_search import (
+    get_date_shards, iter_processed_orders)
+
+from tests.fake_session import FakeSession
+
+
+class TestIterProcessedOrders(unittest.TestCase):
+
+    def setUp(self):
+        self.api_session = FakeSession(self.handle)
+
+    def handle(self, url, data):
+        return {'Data': self.orders, 'TotalPages': 1}
+
+    def search(self, date_type):
+        return list(iter_processed_orders(
+            self.api_session, datetime.date(2020, 1, 1),
+            datetime.date(2020, 1, 14), shard_days=7, max_workers=1,
+            date_type=date_type))
+
+    def order(self, received, processed):
+        return {
+            'pkOrderID': 'order-1', 'nOrderId': 1,
+            'dReceivedDate': received, 'dProcessedOn': processed}
+
+    def test_shards(self):
+        self.assertEqual(
+            get_date_shards(
+                datetime.date(2020, 1, 1), datetime.date(2020, 1, 10), 7),
+            [(datetime.date(2020, 1, 1), datetime.date(2020, 1, 7)),
+             (datetime.date(2020, 1, 8), datetime.date(2020, 1, 10))])
+
+    def test_received_boundary_order_is_deduplicated(self):
+        self.orders = [self.order('2020-01-07T23:00:00', '2020-01-10')]
+        self.assertEqual(len(self.search('RECEIVED')), 1)
+
+    def test_processed_boundary_order_is_deduplicated(self):
+        self.orders = [self.order('2020-01-03', '2020-01-08T09:00:00')]
+        self.assertEqual(len(self.search('PROCESSED')), 1)
+
+    def test_other_date_types_are_deduplicated(self):
+        self.orders = [self.order('2020-01-03', '2020-01-10')]
+        self.assertEqual(len(self.search('PAYMENTRECEIVED')), 1)
@@ -0,0 +1,63 @@
+import datetime
+import threading
+import unittest
+
+from linnapi.processed_orders import ProcessedOrderStore
+
+from tests.fake_session import FakeSession
+
+
+def processed_order(number, processed_on):
+    return {
+        'pkOrderID': 'order-{}'.format(number), 'nOrderId': number,
+        'dReceivedDate': processed_on, 'dProcessedOn': processed_on}
+
+
+class TestProcessedOrderStore(unittest.TestCase):
+
+    def setUp(self):
+        self.orders = [
+            processed_order(1, '2020-01-02T10:00:00'),
+            processed_order(2, '2020-01-05T16:30:00')]
+        self.api_session = FakeSession(self.handle)
+        self.store = ProcessedOrderStore(self.api_session)
+
+    def handle(self, url, data):
+        return {'Data': self.orders, 'TotalPages': 1}
+
+    def sync(self):
+        return self.store.sync(
+            start_date=datetime.date(2020, 1, 1),
+            end_date=datetime.date(2020, 1, 31), shard_days=31)
+
+    def test_sync_stores_orders(self):
+        self.assertEqual(self.sync(), 2)
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.get_order_id(2), 'order-2')
+        self.assertEqual(self.store.get_order_number('order-1'), '1')
+
+    def test_high_water_mark_is_latest_processed_order(self):
+        self.sync()
+        self.assertEqual(
+            self.store.get_high_water_mark(), datetime.date(2020, 1, 5))
+
+    def test_empty_sync_keeps_high_water_mark(self):
+        self.sync()
+        self.orders = []
+        self.store.sync(end_date=datetime.date(2020, 2, 29))
+        self.assertEqual(
+            self.store.get_high_water_mark(), datetime.date(2020, 1, 5))
+
+    def test_lookup_from_other_threads(self):
+        self.sync()
+        results = []
+
+        def lookup():
+            results.append(self.store.get_order_id(1))
+
+        threads = [threading.Thread(target=lookup) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['order-1'] * 8)
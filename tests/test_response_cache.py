@@ -0,0 +1,174 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import linnapi.api_requests as api_requests
+from linnapi.response_cache import ResponseCache
+
+from tests.fake_session import FakeSession, make_guid, make_response
+
+URL_EXTENSION = '/api/Test'
+
+
+class CachedRequest:
+    """Stand-in for a cacheable request."""
+
+    url_extension = URL_EXTENSION
+
+    def __init__(self, name, stock_ids=()):
+        self.name = name
+        self.stock_ids = stock_ids
+
+    def get_request_key(self):
+        return self.url_extension + '?' + self.name
+
+    def get_stock_ids(self):
+        return self.stock_ids
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def put(self, cache, name, size=10, stock_ids=()):
+        request = CachedRequest(name, stock_ids)
+        cache.put(request, make_response(b'x' * size))
+        return request
+
+    def test_entries_expire_after_ttl(self):
+        cache = ResponseCache(default_ttl=10, ttls={'/api/Other': 0})
+        with mock.patch('linnapi.response_cache.time.monotonic') as clock:
+            clock.return_value = 100
+            request = self.put(cache, 'a')
+            clock.return_value = 109.9
+            self.assertIsNotNone(cache.get(request))
+            clock.return_value = 110
+            self.assertIsNone(cache.get(request))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_zero_ttl_is_not_cached(self):
+        cache = ResponseCache(ttls={URL_EXTENSION: 0})
+        request = self.put(cache, 'a')
+        self.assertIsNone(cache.get(request))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ResponseCache(max_bytes=25)
+        a = self.put(cache, 'a', stock_ids=['s1'])
+        b = self.put(cache, 'b')
+        cache.get(a)
+        c = self.put(cache, 'c')
+        self.assertEqual(cache.size, 20)
+        self.assertIsNone(cache.get(b))
+        self.assertIsNotNone(cache.get(a))
+        self.assertIsNotNone(cache.get(c))
+        self.assertEqual(cache.stock_index, {'s1': {a.get_request_key()}})
+
+    def test_response_larger_than_cache_is_not_stored(self):
+        cache = ResponseCache(max_bytes=5)
+        request = self.put(cache, 'a')
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get(request))
+
+    def test_evicted_entries_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(
+                max_bytes=25, spill_directory=directory,
+                max_spill_bytes=15)
+            a = self.put(cache, 'a', stock_ids=['s1'])
+            b = self.put(cache, 'b')
+            c = self.put(cache, 'c', size=10)
+            self.assertEqual((cache.size, cache.spill_size), (20, 10))
+            self.assertEqual(len(os.listdir(directory)), 1)
+            response = cache.get(a)
+            self.assertEqual(response.content, b'x' * 10)
+            # Reading a back spills b, the least recently used.
+            self.assertEqual((cache.size, cache.spill_size), (20, 10))
+            self.assertIn(b.get_request_key(), cache.spilled)
+            self.put(cache, 'd')
+            # c spills and b is dropped to keep within max_spill_bytes.
+            self.assertEqual(list(cache.spilled), [c.get_request_key()])
+            self.assertEqual(len(os.listdir(directory)), 1)
+            self.assertIsNone(cache.get(b))
+            cache.invalidate(['s1'])
+            self.assertNotIn(a.get_request_key(), cache.entries)
+            cache.clear()
+            self.assertEqual(os.listdir(directory), [])
+            self.assertEqual((cache.size, cache.spill_size), (0, 0))
+
+    def test_lost_spill_file_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(max_bytes=15, spill_directory=directory)
+            a = self.put(cache, 'a')
+            self.put(cache, 'b')
+            os.remove(cache.spilled[a.get_request_key()].path)
+            self.assertIsNone(cache.get(a))
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(cache.spill_size, 0)
+
+    def test_put_after_invalidation_is_dropped(self):
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate(['s1'])
+        request = CachedRequest('a', ['s1'])
+        cache.put(request, make_response(b'old'), generation=generation)
+        self.assertIsNone(cache.get(request))
+        cache.put(
+            request, make_response(b'new'), generation=cache.generation)
+        self.assertEqual(cache.get(request).content, b'new')
+
+    def test_invalidate_endpoints(self):
+        cache = ResponseCache()
+        request = self.put(cache, 'a')
+        other = CachedRequest('b')
+        other.url_extension = '/api/Other'
+        cache.put(other, make_response(b'other'))
+        cache.invalidate([], url_extensions=[URL_EXTENSION])
+        self.assertIsNone(cache.get(request))
+        self.assertIsNotNone(cache.get(other))
+
+
+class TestRequestCaching(unittest.TestCase):
+
+    parent_id = make_guid(1)
+
+    def setUp(self):
+        self.invalidate_during_send = False
+        self.api_session = FakeSession(self.handle)
+        self.api_session.response_cache = ResponseCache()
+
+    def handle(self, url, data):
+        if url.endswith('GetVariationItems'):
+            if self.invalidate_during_send:
+                self.api_session.response_cache.invalidate(
+                    [self.parent_id])
+            return [{'pkStockItemId': make_guid(2)}]
+        return []
+
+    def get_children(self):
+        return api_requests.GetVariationItems(
+            self.api_session, self.parent_id).variation_children
+
+    def test_reads_are_cached(self):
+        self.assertEqual(self.get_children(), [make_guid(2)])
+        self.assertEqual(self.get_children(), [make_guid(2)])
+        self.assertEqual(len(self.api_session.requests), 1)
+
+    def test_invalidation_while_sending_is_not_cached(self):
+        self.invalidate_during_send = True
+        self.get_children()
+        self.assertEqual(len(self.api_session.response_cache), 0)
+        self.invalidate_during_send = False
+        self.get_children()
+        self.get_children()
+        self.assertEqual(len(self.api_session.requests), 2)
+
+    def test_write_without_stock_ids_drops_every_item(self):
+        self.get_children()
+        api_requests.UpdateInventoryItemExtendedProperties(
+            self.api_session, [{
+                'pkRowId': make_guid(3), 'ProperyName': 'Name',
+                'PropertyValue': 'Value', 'PropertyType': 'Attribute'}])
+        self.assertEqual(len(self.api_session.response_cache), 0)
+        self.get_children()
+        self.assertEqual(len(self.api_session.requests), 3)
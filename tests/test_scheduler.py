@@ -0,0 +1,101 @@
+import threading
+import time
+import unittest
+
+from linnapi.concurrency_limit import AdaptiveConcurrencyLimit
+from linnapi.scheduler import RequestScheduler
+
+
+class TestRequestScheduler(unittest.TestCase):
+
+    def start(self, scheduler, priority, started):
+        """Acquire a slot in a new thread and add priority to started."""
+        def acquire():
+            scheduler.acquire(priority)
+            started.append(priority)
+        thread = threading.Thread(target=acquire, daemon=True)
+        thread.start()
+        return thread
+
+    def wait_for_waiting(self, scheduler, count):
+        for i in range(200):
+            stats = scheduler.stats()
+            if sum(stats[priority]['waiting']
+                   for priority in scheduler.priorities) == count:
+                return
+            time.sleep(0.01)
+        self.fail('Requests did not queue.')
+
+    def test_bulk_does_not_take_reserved_slots(self):
+        scheduler = RequestScheduler(
+            max_concurrency=4, reserved=1, adaptive=False,
+            limits={'bulk': 4})
+        for i in range(3):
+            scheduler.acquire('bulk')
+        started = []
+        thread = self.start(scheduler, 'bulk', started)
+        self.wait_for_waiting(scheduler, 1)
+        scheduler.acquire('interactive')
+        self.assertEqual(started, [])
+        scheduler.release('bulk')
+        thread.join(1)
+        self.assertEqual(started, ['bulk'])
+
+    def test_normal_and_bulk_share_non_reserved_slots(self):
+        scheduler = RequestScheduler(max_concurrency=16, adaptive=False)
+        for i in range(12):
+            scheduler.acquire('normal')
+        scheduler.acquire('bulk')
+        scheduler.acquire('bulk')
+        self.assertFalse(scheduler.can_start('bulk'))
+        self.assertFalse(scheduler.can_start('normal'))
+        self.assertTrue(scheduler.can_start('interactive'))
+
+    def test_class_limit(self):
+        scheduler = RequestScheduler(
+            max_concurrency=8, adaptive=False, limits={'bulk': 2})
+        scheduler.acquire('bulk')
+        scheduler.acquire('bulk')
+        self.assertFalse(scheduler.can_start('bulk'))
+        self.assertTrue(scheduler.can_start('normal'))
+
+    def test_priority_order(self):
+        scheduler = RequestScheduler(
+            max_concurrency=2, reserved=0, adaptive=False)
+        scheduler.acquire('normal')
+        scheduler.acquire('normal')
+        started = []
+        threads = [self.start(scheduler, 'bulk', started)]
+        self.wait_for_waiting(scheduler, 1)
+        threads.append(self.start(scheduler, 'normal', started))
+        self.wait_for_waiting(scheduler, 2)
+        threads.append(self.start(scheduler, 'interactive', started))
+        self.wait_for_waiting(scheduler, 3)
+        for expected in (['interactive'], ['interactive', 'normal']):
+            scheduler.release('normal')
+            for i in range(100):
+                if len(started) == len(expected):
+                    break
+                time.sleep(0.01)
+            self.assertEqual(started, expected)
+        scheduler.release('interactive')
+        for thread in threads:
+            thread.join(1)
+        self.assertEqual(started, ['interactive', 'normal', 'bulk'])
+
+    def test_adaptive_limit_keeps_reserve(self):
+        limiter = AdaptiveConcurrencyLimit(initial_limit=1, max_limit=16)
+        scheduler = RequestScheduler(
+            max_concurrency=16, reserved=2, limiter=limiter)
+        self.assertEqual(scheduler.get_limit(), 3)
+        scheduler.acquire('bulk')
+        self.assertFalse(scheduler.can_start('bulk'))
+        self.assertFalse(scheduler.can_start('normal'))
+        scheduler.acquire('interactive')
+        scheduler.acquire('interactive')
+        self.assertFalse(scheduler.can_start('interactive'))
+
+    def test_reserved_is_less_than_max_concurrency(self):
+        scheduler = RequestScheduler(max_concurrency=1, adaptive=False)
+        self.assertEqual(scheduler.reserved, 0)
+        self.assertTrue(scheduler.can_start('bulk'))
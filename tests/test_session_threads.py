@@ -0,0 +1,121 @@
+"""Stress test of one session shared by many threads against a local
+stand-in for the API server.
+"""
+
+import http.server
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+from linnapi.linnworks_api_session import LinnworksAPISession
+from linnapi.scheduler import RequestScheduler
+
+
+class APIHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        state = self.server.state
+        length = int(self.headers.get('Content-Length') or 0)
+        body = parse_qs(self.rfile.read(length).decode())
+        query = parse_qs(urlparse(self.path).query)
+        if self.path.startswith('/api/Auth/'):
+            with state['lock']:
+                state['issued'] += 1
+                state['token'] = 'token-{}'.format(state['issued'])
+            self.reply(200, {'Token': state['token']})
+        elif query.get('token', [None])[0] != state['token']:
+            self.reply(401, {'Message': 'Token expired'})
+        else:
+            self.reply(200, {'n': body['n'][0]})
+
+    def reply(self, status_code, body):
+        content = json.dumps(body).encode()
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalSession(LinnworksAPISession):
+    """Session using the local server and no settings requests."""
+
+    def load_config(self):
+        self.server = self.local_server
+        self.application_id = 'id'
+        self.application_secret = 'secret'
+        self.application_token = 'application-token'
+
+    def get_settings(self):
+        pass
+
+
+class TestSharedSession(unittest.TestCase):
+
+    threads = 32
+    requests = 2000
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), APIHandler)
+        self.server.daemon_threads = True
+        self.server.state = {
+            'lock': threading.Lock(), 'issued': 0, 'token': None}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        base = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        LocalSession.local_server = base
+        LocalSession.auth_url = base + '/api/Auth/AuthorizeByApplication'
+        self.api_session = LocalSession(scheduler=RequestScheduler(
+            max_concurrency=self.threads, limits={'normal': self.threads}))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_shared_session(self):
+        self.assertEqual(self.server.state['issued'], 1)
+        self.server.state['token'] = 'expired'
+        sessions = {}
+        sessions_lock = threading.Lock()
+        params = {'shared': '1'}
+
+        def call(n):
+            response = self.api_session.request(
+                self.api_session.server + '/api/Test', data={'n': n},
+                params=params)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['n'], str(n))
+            with sessions_lock:
+                session = sessions.setdefault(
+                    threading.get_ident(), self.api_session.session)
+            self.assertIs(session, self.api_session.session)
+
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            list(executor.map(call, range(self.requests)))
+        self.assertEqual(self.server.state['issued'], 2)
+        self.assertEqual(len(sessions), self.threads)
+        self.assertEqual(
+            len(set(map(id, sessions.values()))), self.threads)
+        self.assertEqual(params, {'shared': '1'})
+
+    def test_helpers_created_once(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            lookups = set(map(id, executor.map(
+                lambda i: self.api_session.sku_lookup, range(32))))
+        self.assertEqual(len(lookups), 1)
+        self.assertIs(self.api_session.sku_lookup.api_session,
+                      self.api_session)
+
+    def test_stats_only_reports_helpers_in_use(self):
+        self.assertNotIn('stock_level_loader', self.api_session.stats())
+        self.assertNotIn('stock_level_loader', self.api_session.helpers)
+        self.api_session.stock_level_loader
+        self.assertEqual(
+            self.api_session.stats()['stock_level_loader'],
+            {'batches': 0, 'keys': 0})
@@ -0,0 +1,63 @@
+import json
+import unittest
+
+from linnapi.inventory.sku_lookup import SKULookup
+from linnapi.inventory.stock_level_updater import StockLevelUpdater
+from linnapi.inventory.stock_snapshot import StockLevel, StockSnapshot
+
+from tests.fake_session import DEFAULT_LOCATION_ID, FakeSession, make_guid
+
+
+class TestStockLevelUpdater(unittest.TestCase):
+
+    def setUp(self):
+        self.api_session = FakeSession(self.handle)
+        self.api_session.sku_lookup = SKULookup(self.api_session)
+        self.api_session.sku_lookup.set_stock_ids(
+            {'SKU1': make_guid(1), 'SKU2': make_guid(2)})
+        self.snapshot = StockSnapshot(self.api_session)
+        self.snapshot.set(
+            make_guid(1), DEFAULT_LOCATION_ID, StockLevel(3, 3, 0, 0))
+        self.sent = []
+
+    def handle(self, url, data):
+        if url.endswith('GetInventoryItems'):
+            return {'Items': []}
+        levels = json.loads(data['stockLevels'])
+        self.sent.append(levels)
+        return levels
+
+    def update(self, rows):
+        return StockLevelUpdater(
+            self.api_session, snapshot=self.snapshot).update(rows)
+
+    def sent_levels(self):
+        return [
+            (level['SKU'], level['Level'])
+            for levels in self.sent for level in levels]
+
+    def test_unchanged_rows_are_not_sent(self):
+        report = self.update([('SKU1', None, 3), ('SKU2', None, 7)])
+        self.assertEqual(self.sent_levels(), [('SKU2', 7)])
+        self.assertEqual(report.updated, [1])
+        self.assertEqual(report.unchanged, [0])
+
+    def test_last_row_wins_when_it_matches_snapshot(self):
+        report = self.update([('SKU1', None, 5), ('SKU1', None, 3)])
+        self.assertEqual(self.sent, [])
+        self.assertEqual(report.unchanged, [0, 1])
+        self.assertEqual(
+            self.snapshot.get(make_guid(1)).stock_level, 3)
+
+    def test_last_row_wins_when_it_changes(self):
+        report = self.update([('SKU1', None, 3), ('SKU1', None, 8)])
+        self.assertEqual(self.sent_levels(), [('SKU1', 8)])
+        self.assertEqual(report.updated, [1])
+        self.assertEqual(report.unchanged, [0])
+        self.assertEqual(
+            self.snapshot.get(make_guid(1)).stock_level, 8)
+
+    def test_unknown_item_fails(self):
+        report = self.update([('SKU9', None, 1)])
+        self.assertIn(0, report.failed)
+        self.assertEqual(self.sent, [])
@@ -0,0 +1,77 @@
+import json
+import unittest
+
+from linnapi.inventory.stock_snapshot import StockLevel, StockSnapshot
+
+from tests.fake_session import FakeSession, DEFAULT_LOCATION_ID, make_guid
+
+OTHER_LOCATION_ID = make_guid(999998)
+STOCK_IDS = [make_guid(i) for i in range(5)]
+
+
+class TestStockSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.levels = {
+            stock_id: {DEFAULT_LOCATION_ID: (i, i + 1, 0, 0)}
+            for i, stock_id in enumerate(STOCK_IDS)}
+        self.levels[STOCK_IDS[0]][OTHER_LOCATION_ID] = (7, 7, 0, 0)
+        self.api_session = FakeSession(self.handle)
+
+    def handle(self, url, data):
+        stock_ids = json.loads(data['request'])['StockItemIds']
+        return [{
+            'pkStockItemId': stock_id,
+            'StockItemLevels': [{
+                'Location': {'StockLocationId': location_id},
+                'Available': level[0], 'StockLevel': level[1],
+                'InOrders': level[2], 'Due': level[3]}
+                for location_id, level in self.levels[stock_id].items()]}
+            for stock_id in stock_ids]
+
+    def load(self, **kwargs):
+        return StockSnapshot(self.api_session, batch_size=2).load(
+            stock_ids=STOCK_IDS, **kwargs)
+
+    def test_load_in_batches(self):
+        snapshot = self.load(
+            location_ids=[DEFAULT_LOCATION_ID, OTHER_LOCATION_ID])
+        self.assertEqual(len(self.api_session.requests), 3)
+        self.assertEqual(len(snapshot), 6)
+        self.assertEqual(
+            snapshot.get(STOCK_IDS[3]), StockLevel(3, 4, 0, 0))
+        self.assertEqual(
+            snapshot.get(STOCK_IDS[0], OTHER_LOCATION_ID),
+            StockLevel(7, 7, 0, 0))
+        self.assertIsNone(snapshot.get(make_guid(100)))
+        self.assertIsNotNone(snapshot.created)
+
+    def test_load_keeps_only_given_locations(self):
+        snapshot = self.load(location_ids=[DEFAULT_LOCATION_ID])
+        self.assertEqual(len(snapshot), 5)
+        self.assertNotIn((STOCK_IDS[0], OTHER_LOCATION_ID), snapshot)
+
+    def test_set_replaces_row(self):
+        snapshot = StockSnapshot(self.api_session)
+        snapshot.set(STOCK_IDS[0], DEFAULT_LOCATION_ID, (1, 2, 3, 4))
+        snapshot.set(STOCK_IDS[0], DEFAULT_LOCATION_ID, (5, 6, 7, 8))
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(list(snapshot), [(
+            (STOCK_IDS[0], DEFAULT_LOCATION_ID), StockLevel(5, 6, 7, 8))])
+
+    def test_diff(self):
+        previous = self.load(
+            location_ids=[DEFAULT_LOCATION_ID, OTHER_LOCATION_ID])
+        self.levels[STOCK_IDS[1]][DEFAULT_LOCATION_ID] = (1, 2, 1, 0)
+        self.levels[STOCK_IDS[2]][OTHER_LOCATION_ID] = (3, 3, 0, 0)
+        del self.levels[STOCK_IDS[0]][OTHER_LOCATION_ID]
+        current = self.load(
+            location_ids=[DEFAULT_LOCATION_ID, OTHER_LOCATION_ID])
+        self.assertEqual(current.diff(previous), {
+            (STOCK_IDS[1], DEFAULT_LOCATION_ID): (
+                StockLevel(1, 2, 0, 0), StockLevel(1, 2, 1, 0)),
+            (STOCK_IDS[2], OTHER_LOCATION_ID): (
+                None, StockLevel(3, 3, 0, 0)),
+            (STOCK_IDS[0], OTHER_LOCATION_ID): (
+                StockLevel(7, 7, 0, 0), None)})
+        self.assertEqual(current.diff(current), {})
@@ -0,0 +1,66 @@
+import gzip
+import socket
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+import requests
+
+from linnapi.transport import TransportProfile
+
+
+class TestTransportProfile(unittest.TestCase):
+
+    def test_configure_mounts_shared_adapter(self):
+        profile = TransportProfile(pool_maxsize=32)
+        sessions = [profile.configure(requests.Session()) for _ in range(2)]
+        adapter = sessions[0].get_adapter('https://example.com')
+        self.assertIs(sessions[0].get_adapter('http://example.com'), adapter)
+        self.assertIs(sessions[1].get_adapter('https://example.com'), adapter)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        for session in sessions:
+            self.assertIn('gzip', session.headers['Accept-Encoding'])
+
+    def test_adapter_created_once_across_threads(self):
+        profile = TransportProfile()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            adapters = set(map(id, executor.map(
+                lambda i: profile.get_shared_adapter(), range(32))))
+        self.assertEqual(len(adapters), 1)
+
+    def test_keep_alive_socket_options(self):
+        profile = TransportProfile(keep_alive_idle=30)
+        options = profile.get_shared_adapter().poolmanager.connection_pool_kw[
+            'socket_options']
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            self.assertIn(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30), options)
+        options = TransportProfile(keep_alive=False).get_socket_options()
+        self.assertNotIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+
+    def test_data_not_compressed_by_default(self):
+        data = {'request': 'x' * 5000}
+        self.assertEqual(
+            TransportProfile().prepare_data(data), (data, None))
+
+    def test_small_body_not_compressed(self):
+        profile = TransportProfile(
+            compress_requests=True, compress_min_size=100)
+        data = {'request': 'x' * 10}
+        self.assertEqual(profile.prepare_data(data), (data, None))
+        self.assertEqual(profile.prepare_data('raw'), ('raw', None))
+
+    def test_large_body_compressed(self):
+        profile = TransportProfile(
+            compress_requests=True, compress_min_size=100)
+        data = {'request': '{"a": "café"}' * 20, 'ids': ['1', '2']}
+        body, headers = profile.prepare_data(data)
+        self.assertEqual(headers, {
+            'Content-Encoding': 'gzip',
+            'Content-Type': 'application/x-www-form-urlencoded'})
+        self.assertLess(len(body), 100)
+        self.assertEqual(
+            parse_qs(gzip.decompress(body).decode('utf-8')), {
+                'request': [data['request']], 'ids': ['1', '2']})
@@ -0,0 +1,116 @@
+import json
+import unittest
+
+from linnapi.inventory.sku_lookup import SKULookup
+from linnapi.inventory.variation_sync import VariationSync
+
+from tests.fake_session import FakeSession, make_guid
+
+PARENT_ID = make_guid(100)
+STOCK_IDS = {sku: make_guid(number) for number, sku in enumerate('ABCD')}
+
+
+class TestVariationSync(unittest.TestCase):
+
+    def setUp(self):
+        self.current = {'P1': (PARENT_ID, ['A', 'B'])}
+        self.fail_endpoint = None
+        self.api_session = FakeSession(self.handle)
+        self.api_session.sku_lookup = SKULookup(self.api_session)
+        for sku, stock_id in STOCK_IDS.items():
+            self.api_session.sku_lookup.add(sku, stock_id)
+
+    def handle(self, url, data):
+        endpoint = url.rsplit('/', 1)[1]
+        if endpoint == self.fail_endpoint:
+            return {'Message': 'Failed'}, 400
+        if endpoint == 'SearchVariationGroups':
+            groups = []
+            if data['searchText'] in self.current:
+                groups.append({
+                    'pkVariationItemId': self.current[
+                        data['searchText']][0],
+                    'VariationSKU': data['searchText'],
+                    'VariationGroupName': data['searchText']})
+            return {'Data': groups}
+        if endpoint == 'GetVariationItems':
+            for parent_id, children in self.current.values():
+                if parent_id == data['pkVariationItemId']:
+                    return [
+                        {'pkStockItemId': STOCK_IDS[sku]}
+                        for sku in children]
+            return []
+        if endpoint == 'GetInventoryItems':
+            return {'Items': []}
+        return b''
+
+    def sent(self, endpoint):
+        return [
+            data for url, data in self.api_session.requests
+            if url.endswith('/' + endpoint)]
+
+    def test_plan(self):
+        sync = VariationSync(
+            self.api_session, {'P1': ['B', 'C'], 'P2': ['D']})
+        to_remove, to_add, to_create = sync.plan()
+        self.assertEqual(to_remove, {'P1': [STOCK_IDS['A']]})
+        self.assertEqual(to_add, {'P1': [STOCK_IDS['C']]})
+        self.assertEqual(to_create, {'P2': [STOCK_IDS['D']]})
+
+    def test_plan_keeps_unlisted_children(self):
+        sync = VariationSync(
+            self.api_session, {'P1': ['B', 'C']}, remove_unlisted=False)
+        to_remove, to_add, to_create = sync.plan()
+        self.assertEqual(to_remove, {})
+        self.assertEqual(to_add, {'P1': [STOCK_IDS['C']]})
+
+    def test_plan_moves_child_listed_elsewhere(self):
+        sync = VariationSync(
+            self.api_session, {'P1': ['B'], 'P2': ['A']},
+            remove_unlisted=False)
+        to_remove, to_add, to_create = sync.plan()
+        self.assertEqual(to_remove, {'P1': [STOCK_IDS['A']]})
+        self.assertEqual(to_create, {'P2': [STOCK_IDS['A']]})
+
+    def test_plan_missing_sku(self):
+        sync = VariationSync(self.api_session, {'P1': ['A', 'X']})
+        with self.assertRaises(ValueError):
+            sync.plan()
+
+    def test_unchanged_group_sends_nothing(self):
+        report = VariationSync(self.api_session, {'P1': ['A', 'B']}).run()
+        self.assertEqual(str(report), '0 created, 0 added to, '
+                         '0 removed from, 0 failed')
+        self.assertEqual(self.sent('AddVariationItems'), [])
+        self.assertEqual(self.sent('DeleteVariationItems'), [])
+
+    def test_run(self):
+        report = VariationSync(
+            self.api_session, {'P1': ['B', 'C'], 'P2': ['D']},
+            titles={'P2': 'Group 2'}).run()
+        self.assertEqual(report.removed, {'P1': ['A']})
+        self.assertEqual(report.added, {'P1': ['C']})
+        self.assertEqual(list(report.created), ['P2'])
+        removed, = self.sent('DeleteVariationItems')
+        self.assertEqual(removed['pkVariationItemId'], PARENT_ID)
+        self.assertEqual(
+            json.loads(removed['pkStockItemIds']), [STOCK_IDS['A']])
+        added, = self.sent('AddVariationItems')
+        self.assertEqual(
+            json.loads(added['pkStockItemIds']), [STOCK_IDS['C']])
+        created, = self.sent('CreateVariationGroup')
+        template = json.loads(created['template'])
+        self.assertEqual(template['ParentSKU'], 'P2')
+        self.assertEqual(template['VariationGroupName'], 'Group 2')
+        self.assertEqual(template['VariationItemIds'], [STOCK_IDS['D']])
+        self.assertEqual(
+            template['ParentStockItemId'], report.created['P2'])
+
+    def test_failed_removal_skips_additions(self):
+        self.fail_endpoint = 'DeleteVariationItems'
+        report = VariationSync(
+            self.api_session, {'P1': ['B', 'C']}).run()
+        self.assertEqual(list(report.failed), ['P1'])
+        self.assertEqual(report.removed, {})
+        self.assertEqual(report.added, {})
+        self.assertEqual(self.sent('AddVariationItems'), [])
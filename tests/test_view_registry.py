@@ -0,0 +1,99 @@
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import linnapi.api_requests as api_requests
+from linnapi.inventory.view_registry import InventoryViewRegistry
+
+from tests.fake_session import FakeSession, make_guid
+
+
+def view_dict(name, number):
+    view = api_requests.InventoryView(name=name, _id=make_guid(number))
+    view.columns = api_requests.GetInventoryViews.standard_columns[:2]
+    return view.to_dict()
+
+
+class TestInventoryViewRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = [view_dict('Stock', 1), view_dict('Prices', 2)]
+        self.gate = threading.Event()
+        self.gate.set()
+        self.api_session = FakeSession(self.handle)
+        self.registry = InventoryViewRegistry(self.api_session)
+
+    def handle(self, url, data):
+        self.gate.wait()
+        return self.saved
+
+    def test_saved_views_requested_once(self):
+        view = self.registry['Stock']
+        self.assertIs(self.registry['Stock'], view)
+        self.assertIn('Prices', self.registry)
+        self.assertNotIn('Other', self.registry)
+        self.assertIsNone(self.registry.get('Other'))
+        self.assertEqual(self.registry.names(), ['Stock', 'Prices'])
+        self.assertEqual(len(self.api_session.requests), 1)
+
+    def test_concurrent_lookups_share_one_request(self):
+        self.gate.clear()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(lambda: self.registry['Prices'])
+                for _ in range(16)]
+            self.gate.set()
+            views = {id(future.result()) for future in futures}
+        self.assertEqual(len(views), 1)
+        self.assertEqual(len(self.api_session.requests), 1)
+
+    def test_views_are_frozen_once(self):
+        view = self.registry['Stock']
+        self.assertIsInstance(view, api_requests.FrozenInventoryView)
+        self.assertIs(view.to_json(), view.to_json())
+        self.assertEqual(json.loads(view.to_json()), self.saved[0])
+        with self.assertRaises(AttributeError):
+            view.name = 'Changed'
+
+    def test_local_views(self):
+        local = api_requests.InventoryView(name='Stock', _id=make_guid(3))
+        frozen = self.registry.add(local)
+        self.assertIsInstance(frozen, api_requests.FrozenInventoryView)
+        self.assertIs(self.registry['Stock'], frozen)
+        self.registry.add(frozen, name='Copy')
+        self.assertIs(self.registry['Copy'], frozen)
+        self.assertEqual(
+            self.registry.names(), ['Stock', 'Prices', 'Copy'])
+        self.assertEqual(len(self.registry), 3)
+        self.registry.invalidate('Stock')
+        self.assertEqual(
+            self.registry['Stock'].to_dict(), self.saved[0])
+        self.assertEqual(len(self.api_session.requests), 1)
+
+    def test_invalidate_reloads_saved_views(self):
+        self.registry['Stock']
+        self.saved = [view_dict('New', 4)]
+        self.registry.invalidate()
+        self.assertNotIn('Stock', self.registry)
+        self.assertEqual([view.name for view in self.registry], ['New'])
+        self.assertEqual(len(self.api_session.requests), 2)
+
+
+class TestFrozenInventoryView(unittest.TestCase):
+
+    def test_equal_views_hash_equal(self):
+        first = api_requests.InventoryView(name='A', _id=make_guid(1))
+        second = api_requests.InventoryView(name='A', _id=make_guid(1))
+        self.assertEqual(first.freeze(), second.freeze())
+        self.assertEqual(len({first.freeze(), second.freeze()}), 1)
+        second.name = 'B'
+        self.assertNotEqual(first.freeze(), second.freeze())
+
+    def test_thaw_returns_editable_copy(self):
+        frozen = api_requests.InventoryView(
+            name='A', _id=make_guid(1)).freeze()
+        view = frozen.thaw()
+        view.name = 'B'
+        self.assertEqual(frozen.name, 'A')
+        self.assertEqual(view.freeze().to_dict()['Id'], make_guid(1))